@@ -0,0 +1,27 @@
+"""add bot difficulty to games
+
+Revision ID: 0004_bot_level
+Revises: 1c369d8b6f2e
+Create Date: 2026-10-19 00:00:00
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0004_bot_level"
+down_revision = "1c369d8b6f2e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "games",
+        sa.Column("bot_level", sa.String(), nullable=False, server_default="normal"),
+    )
+    op.alter_column("games", "bot_level", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("games", "bot_level")
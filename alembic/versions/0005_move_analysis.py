@@ -0,0 +1,57 @@
+"""record turns and store post-game move analysis
+
+Revision ID: 0005_move_analysis
+Revises: 0004_bot_level
+Create Date: 2026-10-19 00:00:00
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0005_move_analysis"
+down_revision = "0004_bot_level"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "turns",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("game_id", sa.Integer(), sa.ForeignKey("games.id"), nullable=False),
+        sa.Column(
+            "player_id",
+            sa.Integer(),
+            sa.ForeignKey("game_players.id"),
+            nullable=False,
+        ),
+        sa.Column("number", sa.Integer(), nullable=False),
+        sa.Column("rack", sa.String(), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False),
+    )
+    op.add_column(
+        "placed_tiles",
+        sa.Column("turn_id", sa.Integer(), sa.ForeignKey("turns.id"), nullable=True),
+    )
+    op.create_table(
+        "move_analyses",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "turn_id",
+            sa.Integer(),
+            sa.ForeignKey("turns.id"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("best_word", sa.String(), nullable=True),
+        sa.Column("best_score", sa.Integer(), nullable=False),
+        sa.Column("best_tiles", sa.JSON(), nullable=False),
+        sa.Column("equity_lost", sa.Float(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("move_analyses")
+    op.drop_column("placed_tiles", "turn_id")
+    op.drop_table("turns")
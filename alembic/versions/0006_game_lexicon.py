@@ -0,0 +1,27 @@
+"""add lexicon to games
+
+Revision ID: 0006_game_lexicon
+Revises: 0005_move_analysis
+Create Date: 2026-10-19 00:00:00
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0006_game_lexicon"
+down_revision = "0005_move_analysis"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "games",
+        sa.Column("lexicon", sa.String(), nullable=False, server_default="ods8"),
+    )
+    op.alter_column("games", "lexicon", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("games", "lexicon")
@@ -0,0 +1,175 @@
+"""Post-game analysis: the best move that was available on every turn.
+
+Once a game is finished its recorded turns are replayed on a board and, for
+each one, the bot's best move by equity is searched for the rack the player
+held.  Searches run in a process pool capped at :data:`WORKERS`; every result
+is committed as soon as it arrives, so an interrupted job resumes with only
+the turns that still have no :class:`~backend.models.MoveAnalysis`.
+
+Run ``python -m backend.analysis`` to finish the analysis of every game.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import bot, models
+from .lexicon import get_lexicon
+from .pools import get_pool
+
+logger = logging.getLogger(__name__)
+
+WORKERS = int(os.getenv("GAME_ANALYSIS_WORKERS", "2"))
+ON_FINISH = os.getenv("GAME_ANALYSIS_ON_FINISH", "1") == "1"
+
+Letters = List[List[Optional[str]]]
+Placements = List[Tuple[int, int, str, bool]]
+# (turn id, lexicon, board before the turn, rack, placements played, score)
+Job = Tuple[int, str, Letters, str, Placements, int]
+# (best placements, best word, best score, equity lost)
+Result = Tuple[Placements, Optional[str], int, float]
+
+# Games are analysed one at a time; each one fans out to the process pool.
+_jobs = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-analysis")
+
+
+def analyse_turn(
+    lexicon: str, letters: Letters, rack: str, placements: Placements, score: int
+) -> Result:
+    """Compare the move played from *rack* with the best one available."""
+    lex = get_lexicon(lexicon)
+    board = bot.board_from_letters(letters, lex)
+    rack_counts = dict(Counter(ch.upper() for ch in rack))
+    leaves = bot.default_table()
+    trie = bot.get_trie(lex.words)
+    best = bot.best_move(board, rack_counts, trie, leaves=leaves)
+    if best is None:
+        return [], None, 0, 0.0
+    remaining = dict(rack_counts)
+    for _r, _c, ch, blank in placements:
+        key = "?" if blank else ch
+        if remaining.get(key):
+            remaining[key] -= 1
+    played = score + leaves.value(bot.rack_key(remaining))
+    lost = max(0.0, bot.equity(best, rack_counts, leaves) - played)
+    return best.letters, best.main_word, best.score, lost
+
+
+def pending_turns(db: Session, game_id: int) -> List[Job]:
+    """Turns of *game_id* without an analysis, with the board before each.
+
+    Tiles without a turn were played before turns were recorded (migration
+    0005), so they are on the board before the first recorded turn.
+    """
+    lexicon = db.get(models.Game, game_id).lexicon
+    turns = (
+        db.query(models.Turn)
+        .filter_by(game_id=game_id)
+        .order_by(models.Turn.number)
+        .all()
+    )
+    grid: Letters = [[None] * bot.BOARD_SIZE for _ in range(bot.BOARD_SIZE)]
+    legacy = (
+        db.query(models.PlacedTile)
+        .filter(
+            models.PlacedTile.game_id == game_id, models.PlacedTile.turn_id.is_(None)
+        )
+        .all()
+    )
+    for t in legacy:
+        grid[t.x][t.y] = t.letter
+    jobs: List[Job] = []
+    for turn in turns:
+        placements = [
+            (t.x, t.y, t.letter.upper(), t.letter.islower()) for t in turn.tiles
+        ]
+        if turn.analysis is None:
+            board = [row[:] for row in grid]
+            jobs.append((turn.id, lexicon, board, turn.rack, placements, turn.score))
+        for t in turn.tiles:
+            grid[t.x][t.y] = t.letter
+    return jobs
+
+
+def _run(jobs: List[Job], workers: int) -> Iterator[Tuple[int, Result]]:
+    if workers <= 0:
+        for turn_id, *args in jobs:
+            yield turn_id, analyse_turn(*args)
+        return
+    if not jobs:
+        return
+    # Every job of a game shares its lexicon.
+    pool = get_pool("analysis", workers, get_lexicon(jobs[0][1]))
+    futures = {pool.submit(analyse_turn, *args): turn_id for turn_id, *args in jobs}
+    for fut in as_completed(futures):
+        yield futures[fut], fut.result()
+
+
+def analyse_game(db: Session, game_id: int, workers: int = WORKERS) -> int:
+    """Analyse the turns of *game_id* still missing; return how many were done.
+
+    Games whose lexicon version is no longer available are skipped.
+    """
+    jobs = pending_turns(db, game_id)
+    if jobs:
+        try:
+            get_lexicon(jobs[0][1])
+        except ValueError:
+            logger.warning("Game %s lexicon %s is unavailable", game_id, jobs[0][1])
+            return 0
+    done = 0
+    for turn_id, (tiles, word, score, lost) in _run(jobs, workers):
+        db.add(
+            models.MoveAnalysis(
+                turn_id=turn_id,
+                best_word=word,
+                best_score=score,
+                best_tiles=[list(p) for p in tiles],
+                equity_lost=lost,
+            )
+        )
+        db.commit()
+        done += 1
+    return done
+
+
+def resume_all(db: Session, workers: int = WORKERS) -> int:
+    """Finish the analysis of every finished game; return the turns analysed."""
+    game_ids = (
+        db.query(models.Turn.game_id)
+        .join(models.Game, models.Game.id == models.Turn.game_id)
+        .outerjoin(models.MoveAnalysis, models.MoveAnalysis.turn_id == models.Turn.id)
+        .filter(models.Game.finished.is_(True), models.MoveAnalysis.id.is_(None))
+        .distinct()
+        .all()
+    )
+    return sum(analyse_game(db, game_id, workers) for (game_id,) in game_ids)
+
+
+def _analyse_in_background(game_id: int) -> None:
+    from .database import SessionLocal
+
+    try:
+        with SessionLocal() as db:
+            analyse_game(db, game_id)
+    except Exception:
+        logger.exception("Analysis of game %s failed", game_id)
+
+
+def schedule(game_id: int) -> None:
+    """Queue the analysis of a finished game when enabled."""
+    if ON_FINISH:
+        _jobs.submit(_analyse_in_background, game_id)
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    with SessionLocal() as session:
+        print(f"Analysed {resume_all(session)} turns")
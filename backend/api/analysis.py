@@ -0,0 +1,57 @@
+"""Stateless position analysis for external tools.
+
+Positions are given in full with each request: nothing is read from the
+database or from the in-memory game state.
+"""
+
+import os
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from .. import game as game_module
+from ..lexicon import DEFAULT_LEXICON, get_lexicon
+from .games import Hint, Placement
+
+router = APIRouter()
+
+# Seconds of move generation allowed per request.
+TIME_BUDGET = float(os.getenv("ANALYSIS_TIME_BUDGET", "1.0"))
+MAX_MOVES = 50
+
+
+class BestMovesRequest(BaseModel):
+    board: str = Field(description="225 squares, row by row; '.' is empty")
+    rack: str = Field(pattern=r"^[A-Za-z?]{1,7}$")
+    n: int = Field(10, ge=1, le=MAX_MOVES)
+    lexicon: str = DEFAULT_LEXICON
+
+
+class BestMovesResponse(BaseModel):
+    moves: list[Hint]
+
+
+@router.post("/analysis/best-moves")
+def best_moves(req: BestMovesRequest) -> BestMovesResponse:
+    """Return the *n* best scoring moves for a rack on the given board."""
+    try:
+        lexicon = get_lexicon(req.lexicon)
+        grid = game_module.board_from_string(req.board, lexicon)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    moves = game_module.hint_moves(
+        grid, list(req.rack.upper()), req.n, TIME_BUDGET, lexicon
+    )
+    return BestMovesResponse(
+        moves=[
+            Hint(
+                word=word,
+                score=score,
+                placements=[
+                    Placement(row=r, col=c, letter=ch, blank=blank)
+                    for r, c, ch, blank in placements
+                ],
+            )
+            for placements, word, score in moves
+        ]
+    )
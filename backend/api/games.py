@@ -1,19 +1,30 @@
 import logging
+import os
 import random
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from .. import analysis
 from .. import game as game_module
 from .. import models
+from ..cache import LRUCache
 from ..database import get_db
 from ..game import draw_tiles, load_game_state, place_tiles, reset_game
+from ..lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Boards encoded by game.board_to_string, keyed by (game id, tiles placed):
+# tiles are only ever added, so the count identifies the board's version.
+BOARD_CACHE = LRUCache(
+    "game_boards", maxsize=int(os.getenv("GAME_BOARD_CACHE_SIZE", "1024"))
+)
+
 
 class Placement(BaseModel):
     row: int
@@ -26,11 +37,15 @@ class StartRequest(BaseModel):
     user_id: int | None = None
     max_players: int = 2
     vs_computer: bool = False
+    bot_level: Literal["normal", "hard"] = "normal"
+    lexicon: str = DEFAULT_LEXICON
 
 
 class CreateGameRequest(BaseModel):
     max_players: int = 2
     vs_computer: bool = False
+    bot_level: Literal["normal", "hard"] = "normal"
+    lexicon: str = DEFAULT_LEXICON
 
 
 class JoinGameRequest(BaseModel):
@@ -43,6 +58,48 @@ class MoveRequest(BaseModel):
     placements: list[Placement]
 
 
+class PreviewRequest(BaseModel):
+    placements: list[Placement]
+
+
+class WordScore(BaseModel):
+    word: str
+    score: int
+
+
+class PreviewResponse(BaseModel):
+    valid: bool
+    score: int
+    words: list[WordScore]
+    error: str | None = None
+    code: str | None = None
+
+
+class Hint(BaseModel):
+    word: str
+    score: int
+    placements: list[Placement]
+
+
+class HintsResponse(BaseModel):
+    hints: list[Hint]
+
+
+class TurnAnalysis(BaseModel):
+    number: int
+    player_id: int
+    score: int
+    best_word: str | None
+    best_score: int
+    best_placements: list[Placement]
+    equity_lost: float
+
+
+class GameAnalysis(BaseModel):
+    complete: bool
+    turns: list[TurnAnalysis]
+
+
 class ExchangeRequest(BaseModel):
     player_id: int
     letters: list[str]
@@ -111,6 +168,71 @@ def _state_response(
     }
 
 
+def _lexicon_key(name: str) -> str:
+    """Pin a new game to the current version of lexicon *name*."""
+    try:
+        return get_lexicon(name).key
+    except ValueError:
+        raise HTTPException(status_code=400, detail="unknown_lexicon")
+
+
+def _game_lexicon(game: models.Game, words: bool = True) -> Lexicon:
+    """Return the lexicon version *game* is played with.
+
+    A version that is no longer available, e.g. its file changed before a
+    restart, gives a 409 when its *words* are needed.  Otherwise the current
+    version stands in, as every version of a lexicon has the same tiles.
+    """
+    try:
+        return get_lexicon(game.lexicon)
+    except ValueError:
+        logger.warning("Game %s lexicon %s is unavailable", game.id, game.lexicon)
+    if not words:
+        try:
+            return get_lexicon(game.lexicon.partition("@")[0])
+        except ValueError:
+            pass
+    raise HTTPException(status_code=409, detail="lexicon_version_unavailable")
+
+
+def _cached_board(game_id: int, db: Session) -> tuple[str, int]:
+    """Return the game's board as a string and its version (tiles placed)."""
+    version = db.query(models.PlacedTile).filter_by(game_id=game_id).count()
+    key = (game_id, version)
+    text = BOARD_CACHE.get(key)
+    if text is None:
+        tiles = db.query(models.PlacedTile).filter_by(game_id=game_id).all()
+        grid: list[list[str | None]] = [
+            [None] * game_module.BOARD_SIZE for _ in range(game_module.BOARD_SIZE)
+        ]
+        for t in tiles:
+            grid[t.x][t.y] = t.letter
+        text = game_module.board_to_string(grid)
+        BOARD_CACHE.put(key, text)
+    return text, version
+
+
+def _record_turn(
+    db: Session,
+    game_id: int,
+    player: models.GamePlayer,
+    tiles: list[models.PlacedTile],
+    score: int,
+) -> None:
+    """Log a move with the rack it was played from, before the rack is refilled."""
+    number = db.query(models.Turn).filter_by(game_id=game_id).count() + 1
+    db.add(
+        models.Turn(
+            game_id=game_id,
+            player_id=player.id,
+            number=number,
+            rack=player.rack,
+            score=score,
+            tiles=tiles,
+        )
+    )
+
+
 def _maybe_play_bot(
     game_id: int, game: models.Game, db: Session
 ) -> tuple[list[models.GamePlayer], list[tuple[int, int, str, bool]] | None, int]:
@@ -143,19 +265,31 @@ def _maybe_play_bot(
         return players, bot_move, bot_score
 
     tiles = db.query(models.PlacedTile).filter_by(game_id=game_id).all()
-    load_game_state([(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players])
+    lexicon = _game_lexicon(game)
+    load_game_state(
+        [(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players], lexicon
+    )
 
-    logger.info("Game %s bot %s attempting move", game_id, bot_player.id)
-    move = game_module.bot_turn(list(bot_player.rack))
+    logger.info(
+        "Game %s bot %s attempting %s move", game_id, bot_player.id, game.bot_level
+    )
+    opponents = len(players) - 1
+    if game.bot_level == "hard":
+        move = game_module.hard_bot_turn(list(bot_player.rack), opponents, lexicon)
+    else:
+        move = game_module.bot_turn(list(bot_player.rack), game_id, opponents, lexicon)
     logger.debug("Game %s bot_turn result: %s", game_id, move)
     if not move:
         logger.info("Game %s bot could not find a move", game_id)
         return players, bot_move, bot_score
 
-    move_tiles, _ = move
+    move_tiles, move_score = move
     if move_tiles:
+        # The bot scores with the game's tables, so its score is authoritative
+        # and the move is not validated a second time.
         try:
-            bot_score, _words = place_tiles(move_tiles)
+            game_module.place_bot_tiles(move_tiles)
+            bot_score = move_score
             logger.info(
                 "Game %s bot placed tiles %s scoring %s",
                 game_id,
@@ -176,6 +310,7 @@ def _maybe_play_bot(
 
     bot_move = move_tiles
     rack_bot = list(bot_player.rack)
+    placed = []
     for r, c, letter, blank in bot_move:
         tile = models.PlacedTile(
             game_id=game_id,
@@ -185,7 +320,9 @@ def _maybe_play_bot(
             letter=letter.lower() if blank else letter.upper(),
         )
         db.add(tile)
+        placed.append(tile)
         rack_bot.remove("?" if blank else letter.upper())
+    _record_turn(db, game_id, bot_player, placed, bot_score)
     drawn = draw_tiles(7 - len(rack_bot))
     rack_bot.extend(drawn)
     bot_player.rack = "".join(rack_bot)
@@ -194,6 +331,8 @@ def _maybe_play_bot(
     idx = next(i for i, pl in enumerate(players_sorted) if pl.id == bot_player.id)
     game.next_player_id = players_sorted[(idx + 1) % len(players_sorted)].id
     db.commit()
+    # Warm the bot's tables for its next turn while the human is thinking.
+    game_module.speculate_bot_turn(game_id, lexicon)
 
     players = db.query(models.GamePlayer).filter_by(game_id=game_id).all()
     return players, bot_move, bot_score
@@ -204,8 +343,14 @@ def start(
     req: StartRequest, db: Session = Depends(get_db)
 ) -> dict[str, int | list[str]]:
     """Start a new game and return identifiers and an initial rack."""
-    reset_game()
-    game = models.Game(max_players=req.max_players, vs_computer=req.vs_computer)
+    lexicon = _lexicon_key(req.lexicon)
+    reset_game(get_lexicon(lexicon))
+    game = models.Game(
+        max_players=req.max_players,
+        vs_computer=req.vs_computer,
+        bot_level=req.bot_level,
+        lexicon=lexicon,
+    )
     db.add(game)
     db.flush()
     rack = draw_tiles(7)
@@ -223,6 +368,7 @@ def finish(req: FinishRequest, db: Session = Depends(get_db)) -> dict[str, str]:
         raise HTTPException(status_code=404, detail="Game not found")
     game.finished = True
     db.commit()
+    analysis.schedule(game.id)
     return {"status": "ok"}
 
 
@@ -254,7 +400,10 @@ def get_game(game_id: int, player_id: int, db: Session = Depends(get_db)) -> Gam
     game = db.get(models.Game, game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
-    load_game_state([(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players])
+    lexicon = _game_lexicon(game, words=False)
+    load_game_state(
+        [(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players], lexicon
+    )
     player = (
         db.query(models.GamePlayer).filter_by(game_id=game_id, id=player_id).first()
     )
@@ -285,7 +434,13 @@ def create_game(
     req: CreateGameRequest, db: Session = Depends(get_db)
 ) -> dict[str, int]:
     """Create a new game and return its identifier."""
-    game = models.Game(max_players=req.max_players, vs_computer=req.vs_computer)
+    lexicon = _lexicon_key(req.lexicon)
+    game = models.Game(
+        max_players=req.max_players,
+        vs_computer=req.vs_computer,
+        bot_level=req.bot_level,
+        lexicon=lexicon,
+    )
     db.add(game)
     db.commit()
     return {"game_id": game.id}
@@ -328,7 +483,7 @@ def start_game(
         raise HTTPException(status_code=400, detail="insufficient_players")
     if seed is not None:
         random.seed(seed)
-    reset_game()
+    reset_game(_game_lexicon(game, words=False))
     info: list[dict[str, object]] = []
     for p in players:
         rack = draw_tiles(7)
@@ -356,13 +511,18 @@ def play_move(
         raise HTTPException(status_code=409, detail="not_your_turn")
     tiles = db.query(models.PlacedTile).filter_by(game_id=game_id).all()
     players = db.query(models.GamePlayer).filter_by(game_id=game_id).all()
-    load_game_state([(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players])
+    lexicon = _game_lexicon(game)
+    load_game_state(
+        [(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players], lexicon
+    )
     try:
         score, words = place_tiles(
-            [(p.row, p.col, p.letter.upper(), p.blank) for p in req.placements]
+            [(p.row, p.col, p.letter.upper(), p.blank) for p in req.placements],
+            lexicon,
         )
     except ValueError as exc:  # pragma: no cover - validation passthrough
         raise HTTPException(status_code=400, detail=str(exc))
+    placed = []
     for p in req.placements:
         tile = models.PlacedTile(
             game_id=game_id,
@@ -372,9 +532,11 @@ def play_move(
             letter=p.letter.lower() if p.blank else p.letter.upper(),
         )
         db.add(tile)
+        placed.append(tile)
     player = db.get(models.GamePlayer, req.player_id)
     if player is None or player.game_id != game_id:
         raise HTTPException(status_code=404, detail="Player not found")
+    _record_turn(db, game_id, player, placed, score)
     rack_list = list(player.rack)
     for p in req.placements:
         letter = "?" if p.blank else p.letter.upper()
@@ -401,14 +563,84 @@ def play_move(
     return state
 
 
+@router.post("/games/{game_id}/preview")
+def preview_move(
+    game_id: int, req: PreviewRequest, db: Session = Depends(get_db)
+) -> PreviewResponse:
+    """Validate and score tentative placements without saving anything."""
+    game = db.get(models.Game, game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    lexicon = _game_lexicon(game)
+    text, version = _cached_board(game_id, db)
+    result = game_module.validate_move(
+        [(p.row, p.col, p.letter.upper(), p.blank) for p in req.placements],
+        game_module.board_from_string(text, lexicon),
+        first=version == 0,
+        lexicon=lexicon,
+    )
+    return PreviewResponse(
+        valid=result.valid,
+        score=result.total,
+        words=[WordScore(word=w, score=s) for w, s in result.words],
+        error=result.error,
+        code=result.code,
+    )
+
+
+@router.get("/games/{game_id}/hints")
+def get_hints(
+    game_id: int,
+    player_id: int,
+    n: int = Query(3, ge=1, le=20),
+    db: Session = Depends(get_db),
+) -> HintsResponse:
+    """Return the *n* best scoring moves for the player's rack."""
+    game = db.get(models.Game, game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    player = (
+        db.query(models.GamePlayer).filter_by(game_id=game_id, id=player_id).first()
+    )
+    if player is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    lexicon = _game_lexicon(game)
+    text, _version = _cached_board(game_id, db)
+    moves = game_module.hint_moves(
+        game_module.board_from_string(text, lexicon),
+        list(player.rack),
+        n,
+        lexicon=lexicon,
+    )
+    return HintsResponse(
+        hints=[
+            Hint(
+                word=word,
+                score=score,
+                placements=[
+                    Placement(row=r, col=c, letter=ch, blank=blank)
+                    for r, c, ch, blank in placements
+                ],
+            )
+            for placements, word, score in moves
+        ]
+    )
+
+
 @router.post("/games/{game_id}/exchange")
 def exchange_tiles(
     game_id: int, req: ExchangeRequest, db: Session = Depends(get_db)
 ) -> dict[str, list[str]]:
     """Exchange tiles from the player's rack with new ones."""
+    game = db.get(models.Game, game_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
     tiles = db.query(models.PlacedTile).filter_by(game_id=game_id).all()
     players = db.query(models.GamePlayer).filter_by(game_id=game_id).all()
-    load_game_state([(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players])
+    lexicon = _game_lexicon(game, words=False)
+    load_game_state(
+        [(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players], lexicon
+    )
     player = db.get(models.GamePlayer, req.player_id)
     if player is None or player.game_id != game_id:
         raise HTTPException(status_code=404, detail="Player not found")
@@ -474,9 +706,42 @@ def resign_game(
         raise HTTPException(status_code=404, detail="Game not found")
     game.finished = True
     db.commit()
+    analysis.schedule(game_id)
     return {"status": "resigned"}
 
 
+@router.get("/games/{game_id}/analysis")
+def get_game_analysis(game_id: int, db: Session = Depends(get_db)) -> GameAnalysis:
+    """Return the best alternative found for every analysed turn."""
+    if db.get(models.Game, game_id) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    turns = (
+        db.query(models.Turn)
+        .filter_by(game_id=game_id)
+        .order_by(models.Turn.number)
+        .all()
+    )
+    return GameAnalysis(
+        complete=all(t.analysis is not None for t in turns),
+        turns=[
+            TurnAnalysis(
+                number=t.number,
+                player_id=t.player_id,
+                score=t.score,
+                best_word=t.analysis.best_word,
+                best_score=t.analysis.best_score,
+                best_placements=[
+                    Placement(row=r, col=c, letter=ch, blank=blank)
+                    for r, c, ch, blank in t.analysis.best_tiles
+                ],
+                equity_lost=t.analysis.equity_lost,
+            )
+            for t in turns
+            if t.analysis is not None
+        ],
+    )
+
+
 @router.get("/games/{game_id}")
 def get_game_state(
     game_id: int, player_id: int, db: Session = Depends(get_db)
@@ -487,7 +752,10 @@ def get_game_state(
     game = db.get(models.Game, game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
-    load_game_state([(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players])
+    lexicon = _game_lexicon(game, words=False)
+    load_game_state(
+        [(t.x, t.y, t.letter) for t in tiles], [p.rack for p in players], lexicon
+    )
     player = (
         db.query(models.GamePlayer).filter_by(game_id=game_id, id=player_id).first()
     )
@@ -1,9 +1,25 @@
-from fastapi import APIRouter
+import os
 
-from ..game import DICTIONARY
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from .. import cache
+from ..lexicon import DEFAULT_LEXICON, Lexicon, get_lexicon
 
 router = APIRouter()
 
+MAX_BATCH_WORDS = int(os.getenv("VALIDATE_BATCH_MAX_WORDS", "64"))
+
+
+class BatchValidateRequest(BaseModel):
+    words: list[str] = Field(max_length=MAX_BATCH_WORDS)
+    lexicon: str = DEFAULT_LEXICON
+
+
+class WordValidity(BaseModel):
+    word: str
+    valid: bool
+
 
 @router.get("/health")
 def health() -> dict[str, str]:
@@ -11,7 +27,29 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+def _lexicon(name: str) -> Lexicon:
+    try:
+        return get_lexicon(name)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Lexicon not found")
+
+
 @router.get("/validate")
-def validate(word: str) -> dict[str, bool]:
-    """Validate a word against the ODS8 dictionary."""
-    return {"valid": word.upper() in DICTIONARY}
+def validate(word: str, lexicon: str = DEFAULT_LEXICON) -> dict[str, bool]:
+    """Validate a word against a dictionary, ODS8 by default."""
+    return {"valid": word.upper() in _lexicon(lexicon)}
+
+
+@router.post("/validate/batch")
+def validate_batch(req: BatchValidateRequest) -> dict[str, list[WordValidity]]:
+    """Validate several words against a dictionary, in request order."""
+    lexicon = _lexicon(req.lexicon)
+    return {
+        "results": [WordValidity(word=w, valid=w.upper() in lexicon) for w in req.words]
+    }
+
+
+@router.get("/metrics")
+def metrics() -> dict[str, dict[str, dict[str, float]]]:
+    """Report hit rates of the in-process caches."""
+    return {"caches": cache.all_stats()}
@@ -0,0 +1,109 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from .. import bot, lexicon
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Reloads run one at a time, off the request path.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lexicon-reload")
+# Lexicon name -> status of its last reload.
+RELOADS: dict[str, dict[str, object]] = {}
+
+
+class LexiconInfo(BaseModel):
+    key: str
+    name: str
+    version: int
+    current: bool
+    loaded: bool
+    words: int | None = None
+    load_seconds: float | None = None
+    words_bytes: int | None = None
+
+
+class ReloadRequest(BaseModel):
+    # File name in the directory of the current word list; defaults to it.
+    file: str | None = None
+
+
+def _info(lex: lexicon.Lexicon, current: bool) -> LexiconInfo:
+    info = LexiconInfo(
+        key=lex.key,
+        name=lex.name,
+        version=lex.version,
+        current=current,
+        loaded=lex.loaded,
+    )
+    if lex.loaded:
+        info.words = len(lex.words)
+        info.load_seconds = lex.load_seconds
+        info.words_bytes = lex.words_bytes()
+    return info
+
+
+@router.get("/lexicons")
+def list_lexicons() -> list[LexiconInfo]:
+    """Current and retired lexicon versions, with their load time and size."""
+    return [_info(lex, True) for lex in lexicon.REGISTRY.values()] + [
+        _info(lex, False) for lex in lexicon.RETIRED.values()
+    ]
+
+
+def _reload(name: str, path: Path | None) -> None:
+    start = time.perf_counter()
+    try:
+        # Compile the trie too, so the first game on the new version is fast.
+        new = lexicon.reload(name, path, warm=lambda lex: bot.get_trie(lex.words))
+    except Exception as exc:
+        logger.exception("Reload of lexicon %s failed", name)
+        RELOADS[name] = {"status": "failed", "error": str(exc)}
+        return
+    RELOADS[name] = {
+        "status": "ready",
+        "key": new.key,
+        "words": len(new.words),
+        "load_seconds": new.load_seconds,
+        "total_seconds": time.perf_counter() - start,
+        "words_bytes": new.words_bytes(),
+    }
+    logger.info("Lexicon %s reloaded: %s", name, RELOADS[name])
+
+
+@router.post("/admin/lexicons/{name}/reload", status_code=202)
+def reload_lexicon(name: str, req: ReloadRequest) -> dict[str, object]:
+    """Load a new version of a lexicon in the background.
+
+    New games use it once loaded; games in progress keep their version.
+    """
+    try:
+        current = lexicon.get_lexicon(name)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Lexicon not found")
+    if RELOADS.get(name, {}).get("status") == "loading":
+        raise HTTPException(status_code=409, detail="reload_in_progress")
+    path = None
+    if req.file is not None:
+        if current.path is None:
+            raise HTTPException(status_code=400, detail="lexicon_has_no_file")
+        path = current.path.parent / Path(req.file).name
+        if not path.is_file():
+            raise HTTPException(status_code=400, detail="file_not_found")
+    RELOADS[name] = {"status": "loading"}
+    _executor.submit(_reload, name, path)
+    return {"status": "loading"}
+
+
+@router.get("/admin/lexicons/{name}/reload")
+def reload_status(name: str) -> dict[str, object]:
+    """Status of the last reload of a lexicon."""
+    if name not in RELOADS:
+        raise HTTPException(status_code=404, detail="No reload")
+    return RELOADS[name]
@@ -0,0 +1,86 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+
+from .. import bot
+from ..lexicon import (
+    DEFAULT_LEXICON,
+    AnagramIndex,
+    Lexicon,
+    PatternIndex,
+    get_lexicon,
+)
+
+router = APIRouter()
+
+
+def _get_lexicon(lexicon: str = DEFAULT_LEXICON) -> Lexicon:
+    try:
+        return get_lexicon(lexicon)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Lexicon not found")
+
+
+class HooksResponse(BaseModel):
+    word: str
+    front: list[str]
+    back: list[str]
+
+
+class SearchResponse(BaseModel):
+    count: int
+    words: list[str]
+
+
+@router.get("/words/anagrams")
+def anagrams(
+    rack: str = Query(pattern=r"^[A-Za-z?]{1,7}$"),
+    min_len: int = Query(2, ge=1, le=15),
+    limit: int = Query(100, ge=1, le=1000),
+    exact: bool = False,
+    lexicon: Lexicon = Depends(_get_lexicon),
+) -> dict[str, list[str]]:
+    """Words that can be made from the rack, longest first; ``?`` is a blank.
+
+    With *exact*, only words using every tile are returned.
+    """
+    index = lexicon.index(AnagramIndex)
+    try:
+        if exact:
+            words = index.anagrams(rack)
+        else:
+            words = index.words_from(rack, min_len)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"words": words[:limit]}
+
+
+@router.get("/words/search")
+def search(
+    pattern: str | None = Query(None, pattern=r"^[A-Za-z.?]{1,15}$"),
+    contains: str = Query("", pattern=r"^[A-Za-z]{0,15}$"),
+    length: int | None = Query(None, alias="len", ge=1, le=15),
+    limit: int = Query(100, ge=1, le=1000),
+    lexicon: Lexicon = Depends(_get_lexicon),
+) -> SearchResponse:
+    """Words matching a pattern such as ``..A.E`` (``.`` or ``?`` for any letter).
+
+    Every letter of *contains* must appear in the word; *len* fixes its length.
+    """
+    index = lexicon.index(PatternIndex)
+    count, words = index.search(pattern, contains, length, limit)
+    return SearchResponse(count=count, words=words)
+
+
+def _letters(mask: int) -> list[str]:
+    return [ch for i, ch in enumerate(bot.ALPHABET) if mask >> i & 1]
+
+
+@router.get("/words/hooks")
+def hooks(
+    word: str = Query(pattern=r"^[A-Za-z]{1,15}$"),
+    lexicon: Lexicon = Depends(_get_lexicon),
+) -> HooksResponse:
+    """Letters that can be added in front of or after *word* to make a word."""
+    word = word.upper()
+    front, back = bot.get_trie(lexicon.words).hooks(word)
+    return HooksResponse(word=word, front=_letters(front), back=_letters(back))
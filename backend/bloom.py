@@ -0,0 +1,123 @@
+"""Build and benchmark the Bloom filters of the lexicons.
+
+The filter is written next to the word list (``ods8.txt`` gives
+``ods8.bloom``) and mapped by :attr:`backend.lexicon.Lexicon.bloom`::
+
+    python -m backend.bloom build --lexicon ods8
+    python -m backend.bloom bench --lexicon ods8 --probes 100000
+
+``bench`` compares the memory held by, and the lookup time of, the word set,
+the bot's trie and the filter, for words and for non-words.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from . import bot
+from .lexicon import ALPHABET, BLOOM_BITS_PER_WORD, BloomFilter, get_lexicon
+
+
+def build(name: str, bits_per_word: int = BLOOM_BITS_PER_WORD) -> BloomFilter:
+    """Compile the filter of lexicon *name* and write it next to its words."""
+    lexicon = get_lexicon(name)
+    if lexicon.path is None or lexicon.bloom_path is None:
+        raise ValueError(f"Lexicon {name} has no word list file")
+    bloom = BloomFilter(lexicon.words, bits_per_word)
+    bloom.save(lexicon.bloom_path, lexicon.path)
+    return bloom
+
+
+def _trie_bytes(trie: bot.Trie) -> int:
+    total = sys.getsizeof(trie.front_hooks)
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        total += sys.getsizeof(node) + sys.getsizeof(node.children)
+        stack.extend(node.children.values())
+    return total
+
+
+def _non_words(words: Set[str], n: int, rng: random.Random) -> List[str]:
+    lengths = [len(w) for w in words] or [2]
+    probes: List[str] = []
+    while len(probes) < n:
+        w = "".join(rng.choice(ALPHABET) for _ in range(rng.choice(lengths)))
+        if w not in words:
+            probes.append(w)
+    return probes
+
+
+def _ns_per_lookup(contains: Callable[[str], bool], probes: List[str]) -> float:
+    start = time.perf_counter()
+    for w in probes:
+        contains(w)
+    return (time.perf_counter() - start) / len(probes) * 1e9
+
+
+def benchmark(
+    words: Set[str],
+    probes: int = 10000,
+    bits_per_word: int = BLOOM_BITS_PER_WORD,
+    seed: Optional[int] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Bytes held and ns per lookup of the set, the trie and the filter."""
+    rng = random.Random(seed)
+    hits = rng.choices(sorted(words), k=probes) if words else []
+    misses = _non_words(words, probes, rng)
+    trie = bot.get_trie(words)
+    bloom = BloomFilter(words, bits_per_word)
+    structures = {
+        "set": (
+            sys.getsizeof(words) + sum(sys.getsizeof(w) for w in words),
+            words.__contains__,
+        ),
+        "trie": (_trie_bytes(trie), trie.has_word),
+        "bloom": (len(bloom.bits), bloom.__contains__),
+    }
+    report: Dict[str, Dict[str, float]] = {}
+    for name, (size, contains) in structures.items():
+        report[name] = {
+            "bytes": size,
+            "hit_ns": _ns_per_lookup(contains, hits) if hits else 0.0,
+            "miss_ns": _ns_per_lookup(contains, misses),
+        }
+    report["bloom"]["false_positive_rate"] = sum(w in bloom for w in misses) / len(
+        misses
+    )
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["build", "bench"])
+    parser.add_argument("--lexicon", default="ods8")
+    parser.add_argument("--bits-per-word", type=int, default=BLOOM_BITS_PER_WORD)
+    parser.add_argument("--probes", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        bloom = build(args.lexicon, args.bits_per_word)
+        path = get_lexicon(args.lexicon).bloom_path
+        print(f"Wrote {len(bloom.bits)} bytes, {bloom.hashes} hashes to {path}")
+        return
+    words = get_lexicon(args.lexicon).words
+    report = benchmark(words, args.probes, args.bits_per_word, args.seed)
+    print(f"{len(words)} words, {args.probes} probes")
+    for name, row in report.items():
+        line = (
+            f"{name:6} {row['bytes'] / 1e6:9.2f} MB"
+            f" {row['hit_ns']:8.0f} ns/hit {row['miss_ns']:8.0f} ns/miss"
+        )
+        if "false_positive_rate" in row:
+            line += f" {row['false_positive_rate']:.2%} false positives"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,42 +3,84 @@
 This module implements a simple Scrabble AI inspired by the reference
 implementation provided by the user.  Words are stored in a Trie, moves are
 generated by scanning anchor squares on the board and all candidates are scored
-with basic letter values.  The public helpers ``bot_turn`` and
-``is_valid_placement`` keep the same signature as the previous implementation so
-existing callers and tests continue to work.
+with the same letter values and bonus squares as :mod:`backend.game`.  The
+public helpers ``bot_turn`` and ``is_valid_placement`` keep the same signature
+as the previous implementation so existing callers and tests continue to work.
 """
 
+import heapq
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from . import game
+from .cache import LRUCache
+from .leaves import LeaveTable, default_table
+from .lexicon import Lexicon, get_lexicon
 
 # ---------------------------------------------------------------------------
 # Constants and helpers
 # ---------------------------------------------------------------------------
 
 BOARD_SIZE = game.BOARD_SIZE
+CENTER = BOARD_SIZE // 2
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 
 class TrieNode:
-    __slots__ = ("children", "is_word")
+    __slots__ = ("children", "is_word", "back_hooks")
 
     def __init__(self) -> None:
         self.children: Dict[str, "TrieNode"] = {}
         self.is_word: bool = False
+        # Mask of the letters that complete this prefix into a word.
+        self.back_hooks: int = 0
 
 
 class Trie:
     def __init__(self) -> None:
         self.root = TrieNode()
+        # Fragment -> mask of the letters that make a word in front of it.
+        self.front_hooks: Dict[str, int] = {}
 
     def insert(self, word: str) -> None:
+        if not word:
+            return
         node = self.root
-        for ch in word:
+        for ch in word[:-1]:
             node = node.children.setdefault(ch, TrieNode())
+        if len(word) > 1:
+            node.back_hooks |= LETTER_BIT.get(word[-1], 0)
+            rest = word[1:]
+            self.front_hooks[rest] = self.front_hooks.get(rest, 0) | LETTER_BIT.get(
+                word[0], 0
+            )
+        node = node.children.setdefault(word[-1], TrieNode())
         node.is_word = True
 
+    def find(self, prefix: str) -> Optional[TrieNode]:
+        """Node reached by *prefix*, or ``None`` when no word starts with it."""
+        node = self.root
+        for ch in prefix:
+            child = node.children.get(ch)
+            if child is None:
+                return None
+            node = child
+        return node
+
+    def hooks(self, fragment: str) -> Tuple[int, int]:
+        """Front and back hook masks of *fragment*."""
+        node = self.find(fragment)
+        return self.front_hooks.get(fragment, 0), node.back_hooks if node else 0
+
     def has_word(self, word: str) -> bool:
         node = self.root
         for ch in word:
@@ -51,68 +93,310 @@ class Trie:
         return node.children.get(ch)
 
 
-@dataclass
-class Cell:
-    letter: Optional[str] = None
-    letter_mult: int = 1
-    word_mult: int = 1
-    is_center: bool = False
+# One random 64-bit key per (square, letter); the second half is for blanks.
+_ZOBRIST_INDEX: Dict[str, int] = {ch: i for i, ch in enumerate(ALPHABET)}
+_zobrist_rng = random.Random(0x5C7A8B1E)
+ZOBRIST: List[List[int]] = [
+    [_zobrist_rng.getrandbits(64) for _ in range(2 * len(ALPHABET))]
+    for _ in range(BOARD_SIZE * BOARD_SIZE)
+]
+
+
+def _zobrist_key(i: int, ch: str, is_blank: bool) -> int:
+    return ZOBRIST[i][_ZOBRIST_INDEX[ch] + (len(ALPHABET) if is_blank else 0)]
+
+
+SQUARES = game.SQUARES
+
+# Letter stored under each byte value of :attr:`Board.tiles`; 0 is empty.
+_CHARS: Tuple[Optional[str], ...] = (None,) + tuple(chr(i) for i in range(1, 256))
 
 
-@dataclass
 class Move:
-    row: int
-    col: int
-    vertical: bool
-    letters: List[Tuple[int, int, str, bool]]  # (r, c, letter, is_blank)
-    main_word: str
-    score: int
+    """A candidate move, encoded compactly.
+
+    The main word starts on square ``start`` (``r * BOARD_SIZE + c``), runs
+    down if ``vertical`` and spells ``word``.  Bit *i* of ``placed`` is set
+    when the *i*-th letter of the word is a new tile, bit *i* of ``blanks``
+    when that tile is a blank.  :attr:`letters` converts to the
+    ``(row, col, letter, is_blank)`` tuples used outside the bot.
+    """
+
+    __slots__ = ("start", "vertical", "word", "placed", "blanks", "score")
+
+    def __init__(
+        self,
+        start: int,
+        vertical: bool,
+        word: str,
+        placed: int,
+        blanks: int = 0,
+        score: int = 0,
+    ) -> None:
+        self.start = start
+        self.vertical = vertical
+        self.word = word
+        self.placed = placed
+        self.blanks = blanks
+        self.score = score
+
+    @classmethod
+    def from_letters(cls, board: "Board", letters: "Letters", vertical: bool) -> "Move":
+        """Encode *letters*, played along one line of *board*."""
+        new = {r * BOARD_SIZE + c: (ch, is_blank) for r, c, ch, is_blank in letters}
+        dr, dc = (1, 0) if vertical else (0, 1)
+        r, c, _ch, _blank = min(letters)
+        while r - dr >= 0 and c - dc >= 0:
+            i = (r - dr) * BOARD_SIZE + c - dc
+            if not (board.tiles[i] or i in new):
+                break
+            r, c = r - dr, c - dc
+        start = r * BOARD_SIZE + c
+        word: List[str] = []
+        placed = blanks = 0
+        while r < BOARD_SIZE and c < BOARD_SIZE:
+            i = r * BOARD_SIZE + c
+            if i in new:
+                ch, is_blank = new[i]
+                placed |= 1 << len(word)
+                blanks |= is_blank << len(word)
+            elif board.tiles[i]:
+                ch = _CHARS[board.tiles[i]]
+            else:
+                break
+            word.append(ch)
+            r, c = r + dr, c + dc
+        if bin(placed).count("1") != len(new):
+            raise ValueError("Tiles must be contiguous")
+        return cls(start, vertical, "".join(word), placed, blanks)
 
+    @property
+    def row(self) -> int:
+        return self.start // BOARD_SIZE
 
-class Board:
-    """Simple board representation holding :class:`Cell` objects."""
-
-    def __init__(self, cells: Optional[List[List[Cell]]] = None) -> None:
-        if cells is None:
-            self.cells = [
-                [Cell() for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
-            ]
-            self.cells[7][7].is_center = True
-        else:
-            self.cells = cells
+    @property
+    def col(self) -> int:
+        return self.start % BOARD_SIZE
+
+    @property
+    def main_word(self) -> str:
+        return self.word
+
+    @property
+    def tile_count(self) -> int:
+        return bin(self.placed).count("1")
+
+    def tiles(self) -> Iterator[Tuple[int, str, bool]]:
+        """Yield ``(square, letter, is_blank)`` for each new tile."""
+        step = BOARD_SIZE if self.vertical else 1
+        placed, blanks = self.placed, self.blanks
+        for i, ch in enumerate(self.word):
+            if placed >> i & 1:
+                yield self.start + i * step, ch, bool(blanks >> i & 1)
+
+    @property
+    def letters(self) -> List[Tuple[int, int, str, bool]]:
+        return [(*divmod(sq, BOARD_SIZE), ch, blank) for sq, ch, blank in self.tiles()]
+
+    def key(self) -> Tuple[int, bool, str, int, int]:
+        return (self.start, self.vertical, self.word, self.placed, self.blanks)
+
+    def __repr__(self) -> str:
+        return f"Move({self.letters!r}, {self.word!r}, score={self.score})"
+
+
+# Cross-checks are 26-bit masks of the letters allowed on a square.
+LETTER_BIT: Dict[str, int] = {ch: 1 << i for i, ch in enumerate(ALPHABET)}
+FULL_MASK = (1 << len(ALPHABET)) - 1
+
+Letters = List[Tuple[int, int, str, bool]]
 
-    def get(self, r: int, c: int) -> Cell:
-        return self.cells[r][c]
+
+class Board:
+    """Flat 15x15 board.
+
+    ``tiles`` holds the code point of the (uppercase) letter on each square,
+    indexed by ``r * BOARD_SIZE + c``, or 0 when it is empty; ``blanks`` flags
+    the squares holding a blank.  The multiplier tables are shared with
+    :mod:`backend.game` and ``values`` are the letter values of the lexicon
+    played, see :func:`board_from_letters`.  Copying a board is two
+    ``bytearray`` copies and ``bytes(board.tiles)`` is a hashable snapshot.
+
+    Besides the tiles, the board keeps its tile count, Zobrist hash and anchor
+    squares up to date, and once :meth:`attach` has been called, its
+    cross-check masks as well.  Tiles must therefore be placed with
+    :meth:`apply` (or :meth:`set`) and removed with :meth:`undo`; after writing
+    to squares directly, call :meth:`resync`.
+    """
+
+    def __init__(
+        self,
+        tiles: Optional[bytes] = None,
+        blanks: Optional[bytes] = None,
+        letter_mult: bytes = game.LETTER_MULT,
+        word_mult: bytes = game.WORD_MULT,
+        values: Optional[bytes] = None,
+    ) -> None:
+        self.tiles = bytearray(tiles if tiles is not None else SQUARES)
+        self.blanks = bytearray(blanks if blanks is not None else SQUARES)
+        self.letter_mult = letter_mult
+        self.word_mult = word_mult
+        self.values = LETTER_VALUES if values is None else values
+        self.trie: Optional["Trie"] = None
+        # Masks for horizontal plays (set by vertical neighbours) and for
+        # vertical plays (set by horizontal neighbours), in board coordinates.
+        self.cross_h: Optional[List[List[int]]] = None
+        self.cross_v: Optional[List[List[int]]] = None
+        self._undo_stack: List[tuple] = []
+        self.resync()
+
+    def letter(self, r: int, c: int) -> Optional[str]:
+        """Uppercase letter on ``(r, c)``, blanks included, or ``None``."""
+        return _CHARS[self.tiles[r * BOARD_SIZE + c]]
 
     def in_bounds(self, r: int, c: int) -> bool:
         return 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE
 
-    def row_as_cells(self, r: int) -> List[Cell]:
-        return self.cells[r]
-
-    def transpose(self) -> "Board":
-        T = [[self.cells[r][c] for r in range(BOARD_SIZE)] for c in range(BOARD_SIZE)]
-        return Board(T)
+    def copy(self) -> "Board":
+        return Board(
+            self.tiles, self.blanks, self.letter_mult, self.word_mult, self.values
+        )
 
     def has_any_letter(self) -> bool:
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if self.cells[r][c].letter:
-                    return True
-        return False
+        return self.count > 0
 
+    def _has_neighbour(self, r: int, c: int) -> bool:
+        tiles = self.tiles
+        for rr, cc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if (
+                0 <= rr < BOARD_SIZE
+                and 0 <= cc < BOARD_SIZE
+                and tiles[rr * BOARD_SIZE + cc]
+            ):
+                return True
+        return False
 
-# Basic letter scores – not the full French Scrabble values but adequate for
-# testing and move selection.
-LETTER_SCORES: Dict[str, int] = {
-    **{ch: 1 for ch in "EAIONRTLSU"},
-    **{ch: 2 for ch in "DG"},
-    **{ch: 3 for ch in "BCMP"},
-    **{ch: 4 for ch in "FHVWY"},
-    "K": 5,
-    **{ch: 8 for ch in "JX"},
-    **{ch: 10 for ch in "QZ"},
-}
+    def resync(self) -> None:
+        """Recompute the incremental state from the tiles."""
+        self.count = SQUARES - self.tiles.count(0)
+        self.hash = self.zobrist()
+        self.anchors: Set[Tuple[int, int]] = {
+            (r, c)
+            for r in range(BOARD_SIZE)
+            for c in range(BOARD_SIZE)
+            if not self.tiles[r * BOARD_SIZE + c] and self._has_neighbour(r, c)
+        }
+        self._undo_stack.clear()
+        if self.trie is not None:
+            self.attach(self.trie)
+
+    def attach(self, trie: "Trie") -> None:
+        """Compute cross-check masks for *trie* and keep them up to date."""
+        self.trie = trie
+        self.cross_h = compute_cross_checks(self, trie, vertical_scan=False)
+        self.cross_v = compute_cross_checks(self, trie, vertical_scan=True)
+
+    def set(self, r: int, c: int, letter: str) -> None:
+        """Place a single tile; shorthand for :meth:`apply`."""
+        self.apply([(r, c, letter, False)])
+
+    def apply(self, letters: Letters) -> None:
+        """Place *letters* (uppercase) on the board; :meth:`undo` reverts it.
+
+        Only the squares around the placed tiles are updated: their anchors
+        and, when attached, the cross-checks at the ends of the lines they
+        extend.
+        """
+        tiles = self.tiles
+        for r, c, ch, is_blank in letters:
+            i = r * BOARD_SIZE + c
+            tiles[i] = ord(ch)
+            self.blanks[i] = is_blank
+        self.hash ^= zobrist_delta(letters)
+        self.count += len(letters)
+
+        removed: List[Tuple[int, int]] = []
+        added: List[Tuple[int, int]] = []
+        for r, c, _ch, _is_blank in letters:
+            if (r, c) in self.anchors:
+                self.anchors.discard((r, c))
+                removed.append((r, c))
+            for rr, cc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if (
+                    0 <= rr < BOARD_SIZE
+                    and 0 <= cc < BOARD_SIZE
+                    and not tiles[rr * BOARD_SIZE + cc]
+                    and (rr, cc) not in self.anchors
+                ):
+                    self.anchors.add((rr, cc))
+                    added.append((rr, cc))
+
+        saved: List[Tuple[List[List[int]], int, int, int]] = []
+        if self.trie is not None:
+            assert self.cross_h is not None and self.cross_v is not None
+            for r, c, _ch, _is_blank in letters:
+                for grid in (self.cross_h, self.cross_v):
+                    saved.append((grid, r, c, grid[r][c]))
+                    grid[r][c] = 0
+                for grid, vertical, dr, dc in (
+                    (self.cross_h, False, 1, 0),
+                    (self.cross_v, True, 0, 1),
+                ):
+                    for sign in (-1, 1):
+                        rr, cc = r, c
+                        while (
+                            0 <= rr < BOARD_SIZE
+                            and 0 <= cc < BOARD_SIZE
+                            and tiles[rr * BOARD_SIZE + cc]
+                        ):
+                            rr += sign * dr
+                            cc += sign * dc
+                        if 0 <= rr < BOARD_SIZE and 0 <= cc < BOARD_SIZE:
+                            saved.append((grid, rr, cc, grid[rr][cc]))
+                            grid[rr][cc] = cross_check_at(
+                                self, self.trie, rr, cc, vertical
+                            )
+        self._undo_stack.append((removed, added, saved))
+
+    def undo(self, letters: Letters) -> None:
+        """Revert the last :meth:`apply`, which must have placed *letters*."""
+        removed, added, saved = self._undo_stack.pop()
+        for grid, r, c, old in reversed(saved):
+            grid[r][c] = old
+        self.anchors.difference_update(added)
+        self.anchors.update(removed)
+        for r, c, _ch, _is_blank in letters:
+            i = r * BOARD_SIZE + c
+            self.tiles[i] = 0
+            self.blanks[i] = 0
+        self.hash ^= zobrist_delta(letters)
+        self.count -= len(letters)
+
+    def zobrist(self) -> int:
+        """Zobrist hash of the letters on the board, computed from scratch."""
+        h = 0
+        for i, code in enumerate(self.tiles):
+            if code:
+                h ^= _zobrist_key(i, _CHARS[code], bool(self.blanks[i]))
+        return h
+
+
+def zobrist_delta(letters: List[Tuple[int, int, str, bool]]) -> int:
+    """Value to XOR into :meth:`Board.zobrist` when *letters* are placed."""
+    h = 0
+    for r, c, ch, is_blank in letters:
+        h ^= _zobrist_key(r * BOARD_SIZE + c, ch, is_blank)
+    return h
+
+
+def rack_key(rack: Dict[str, int]) -> str:
+    """Order-independent key for a rack given as letter counts."""
+    return "".join(sorted(ch * n for ch, n in rack.items() if n > 0))
+
+
+# Scoring tables shared with backend.game, so the bot's scores are the game's.
+LETTER_VALUES = game.LETTER_VALUES
+BINGO_BONUS = game.BINGO_BONUS
 
 
 def letters_available(rack: Dict[str, int]) -> Set[str]:
@@ -135,15 +419,16 @@ def remove_letter(rack: Dict[str, int], ch: str) -> Tuple[Dict[str, int], bool]:
 
 def build_full_horizontal(board: Board, r: int, c: int, ch_mid: str) -> str:
     cc = c - 1
-    while board.in_bounds(r, cc) and board.get(r, cc).letter:
+    while board.in_bounds(r, cc) and board.letter(r, cc):
         cc -= 1
     cc += 1
     letters: List[str] = []
     while board.in_bounds(r, cc):
+        ch = board.letter(r, cc)
         if cc == c:
             letters.append(ch_mid)
-        elif board.get(r, cc).letter:
-            letters.append(board.get(r, cc).letter)
+        elif ch:
+            letters.append(ch)
         else:
             if cc > c:
                 break
@@ -153,15 +438,16 @@ def build_full_horizontal(board: Board, r: int, c: int, ch_mid: str) -> str:
 
 def build_full_vertical(board: Board, r: int, c: int, ch_mid: str) -> str:
     rr = r - 1
-    while board.in_bounds(rr, c) and board.get(rr, c).letter:
+    while board.in_bounds(rr, c) and board.letter(rr, c):
         rr -= 1
     rr += 1
     letters: List[str] = []
     while board.in_bounds(rr, c):
+        ch = board.letter(rr, c)
         if rr == r:
             letters.append(ch_mid)
-        elif board.get(rr, c).letter:
-            letters.append(board.get(rr, c).letter)
+        elif ch:
+            letters.append(ch)
         else:
             if rr > r:
                 break
@@ -169,166 +455,112 @@ def build_full_vertical(board: Board, r: int, c: int, ch_mid: str) -> str:
     return "".join(letters)
 
 
+def cross_check_at(
+    board: Board, trie: Trie, r: int, c: int, vertical_scan: bool
+) -> int:
+    """Mask of the letters allowed on ``(r, c)`` by the perpendicular word.
+
+    A fragment on one side only is answered from the trie's hook masks; with
+    fragments on both sides, each letter following *before* in the trie is
+    checked against *after*.
+    """
+    if board.letter(r, c):
+        return 0
+    dr, dc = (0, 1) if vertical_scan else (1, 0)
+    before = _fragment(board, r, c, -dr, -dc)
+    after = _fragment(board, r, c, dr, dc)
+    if not after:
+        if not before:
+            return FULL_MASK
+        node = trie.find(before)
+        return node.back_hooks if node else 0
+    if not before:
+        return trie.front_hooks.get(after, 0)
+    node = trie.find(before)
+    if node is None:
+        return 0
+    allowed = 0
+    for ch, child in node.children.items():
+        end: Optional[TrieNode] = child
+        for nxt in after:
+            end = end.children.get(nxt)
+            if end is None:
+                break
+        if end is not None and end.is_word:
+            allowed |= LETTER_BIT.get(ch, 0)
+    return allowed
+
+
+def _fragment(board: Board, r: int, c: int, dr: int, dc: int) -> str:
+    """Letters touching ``(r, c)`` in direction ``(dr, dc)``, in reading order."""
+    tiles = board.tiles
+    letters: List[str] = []
+    r, c = r + dr, c + dc
+    while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE and tiles[r * BOARD_SIZE + c]:
+        letters.append(_CHARS[tiles[r * BOARD_SIZE + c]])
+        r, c = r + dr, c + dc
+    if dr < 0 or dc < 0:
+        letters.reverse()
+    return "".join(letters)
+
+
 def compute_cross_checks(
     board: Board, trie: Trie, vertical_scan: bool
-) -> List[List[Set[str]]]:
-    cross: List[List[Set[str]]] = [
-        [set(ALPHABET) for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
+) -> List[List[int]]:
+    return [
+        [cross_check_at(board, trie, r, c, vertical_scan) for c in range(BOARD_SIZE)]
+        for r in range(BOARD_SIZE)
     ]
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if board.get(r, c).letter:
-                cross[r][c] = set()
-                continue
-            if vertical_scan is False:
-                if (board.in_bounds(r - 1, c) and board.get(r - 1, c).letter) or (
-                    board.in_bounds(r + 1, c) and board.get(r + 1, c).letter
-                ):
-                    allowed: Set[str] = set()
-                    for ch in ALPHABET:
-                        word = build_full_vertical(board, r, c, ch)
-                        if len(word) == 1 or trie.has_word(word):
-                            allowed.add(ch)
-                    cross[r][c] = allowed
-            else:
-                if (board.in_bounds(r, c - 1) and board.get(r, c - 1).letter) or (
-                    board.in_bounds(r, c + 1) and board.get(r, c + 1).letter
-                ):
-                    allowed = set()
-                    for ch in ALPHABET:
-                        word = build_full_horizontal(board, r, c, ch)
-                        if len(word) == 1 or trie.has_word(word):
-                            allowed.add(ch)
-                    cross[r][c] = allowed
-    return cross
-
-
-def find_anchors_in_row(
-    board: Board, r: int, first_move: bool
-) -> List[Tuple[int, int]]:
-    anchors: List[Tuple[int, int]] = []
-    row = board.row_as_cells(r)
-    for c in range(BOARD_SIZE):
-        if row[c].letter:
-            continue
-        is_anchor = False
-        if first_move and row[c].is_center:
-            is_anchor = True
-        else:
-            if (
-                (c > 0 and row[c - 1].letter)
-                or (c < BOARD_SIZE - 1 and row[c + 1].letter)
-                or (r > 0 and board.get(r - 1, c).letter)
-                or (r < BOARD_SIZE - 1 and board.get(r + 1, c).letter)
-            ):
-                is_anchor = True
-        if is_anchor:
-            left = 0
-            cc = c - 1
-            while cc >= 0 and not row[cc].letter:
-                left += 1
-                cc -= 1
-            anchors.append((c, left))
-    return anchors
-
-
-def score_move(board: Board, move: Move) -> int:
+
+
+def score_move(board: Board, move: Move, lexicon: Optional[Lexicon] = None) -> int:
+    """Score *move*, not yet played, with the tables of *board*.
+
+    The letter values are those of *lexicon* when given.  Like
+    :func:`backend.game.place_tiles`, only words of two letters or more
+    count, and the multipliers apply to the newly placed tiles only.
+    """
+    values = board.values if lexicon is None else lexicon.values
+    tiles, blanks = board.tiles, board.blanks
+    letter_mult, word_mult = board.letter_mult, board.word_mult
+    step = BOARD_SIZE if move.vertical else 1
     total = 0
-    r0, c0 = move.row, move.col
-    vertical = move.vertical
-    letters_used_positions = {(r, c) for (r, c, _, _) in move.letters}
-
-    if not vertical:  # horizontal main word
-        cc = c0
-        while cc > 0 and board.get(r0, cc - 1).letter:
-            cc -= 1
-        word_mult = 1
-        word_score = 0
-        while cc < BOARD_SIZE and (
-            board.get(r0, cc).letter or (r0, cc) in letters_used_positions
-        ):
-            if (r0, cc) in letters_used_positions:
-                ch = next(x[2] for x in move.letters if x[0] == r0 and x[1] == cc)
-                is_blank = next(x[3] for x in move.letters if x[0] == r0 and x[1] == cc)
-                letter_value = 0 if is_blank else LETTER_SCORES.get(ch, 0)
-                letter_mult = board.get(r0, cc).letter_mult
-                word_mult *= board.get(r0, cc).word_mult
-                word_score += letter_value * letter_mult
+    mult = 1
+    i = move.start
+    for k, ch in enumerate(move.word):
+        if move.placed >> k & 1:
+            if not move.blanks >> k & 1:
+                total += values[ord(ch)] * letter_mult[i]
+            mult *= word_mult[i]
+        elif not blanks[i]:
+            total += values[tiles[i]]
+        i += step
+    total = total * mult if len(move.word) > 1 else 0
+
+    # Cross words run the other way through each new tile.
+    dr, dc = (0, 1) if move.vertical else (1, 0)
+    for sq, ch, is_blank in move.tiles():
+        r, c = divmod(sq, BOARD_SIZE)
+        while r - dr >= 0 and c - dc >= 0 and tiles[(r - dr) * BOARD_SIZE + c - dc]:
+            r, c = r - dr, c - dc
+        score = 0
+        length = 0
+        while r < BOARD_SIZE and c < BOARD_SIZE:
+            i = r * BOARD_SIZE + c
+            if i == sq:
+                if not is_blank:
+                    score += values[ord(ch)] * letter_mult[i]
+            elif tiles[i]:
+                if not blanks[i]:
+                    score += values[tiles[i]]
             else:
-                ch = board.get(r0, cc).letter
-                word_score += LETTER_SCORES.get(ch, 0)
-            cc += 1
-        total += word_score * word_mult
-
-        for rr, cc, ch, is_blank in move.letters:
-            up = rr - 1
-            down = rr + 1
-            if (board.in_bounds(up, cc) and board.get(up, cc).letter) or (
-                board.in_bounds(down, cc) and board.get(down, cc).letter
-            ):
-                r_up = rr
-                while r_up > 0 and board.get(r_up - 1, cc).letter:
-                    r_up -= 1
-                word_mult = board.get(rr, cc).word_mult
-                word_score = (0 if is_blank else LETTER_SCORES.get(ch, 0)) * board.get(
-                    rr, cc
-                ).letter_mult
-                r_scan = r_up
-                while r_scan < BOARD_SIZE and (
-                    r_scan == rr or board.get(r_scan, cc).letter
-                ):
-                    if r_scan != rr:
-                        ch2 = board.get(r_scan, cc).letter
-                        word_score += LETTER_SCORES.get(ch2, 0)
-                    r_scan += 1
-                total += word_score * word_mult
-    else:  # vertical main word
-        rr = r0
-        while rr > 0 and board.get(rr - 1, c0).letter:
-            rr -= 1
-        word_mult = 1
-        word_score = 0
-        while rr < BOARD_SIZE and (
-            board.get(rr, c0).letter or (rr, c0) in letters_used_positions
-        ):
-            if (rr, c0) in letters_used_positions:
-                ch = next(x[2] for x in move.letters if x[0] == rr and x[1] == c0)
-                is_blank = next(x[3] for x in move.letters if x[0] == rr and x[1] == c0)
-                letter_value = 0 if is_blank else LETTER_SCORES.get(ch, 0)
-                letter_mult = board.get(rr, c0).letter_mult
-                word_mult *= board.get(rr, c0).word_mult
-                word_score += letter_value * letter_mult
-            else:
-                ch = board.get(rr, c0).letter
-                word_score += LETTER_SCORES.get(ch, 0)
-            rr += 1
-        total += word_score * word_mult
-
-        for rr, cc, ch, is_blank in move.letters:
-            left = cc - 1
-            right = cc + 1
-            if (board.in_bounds(rr, left) and board.get(rr, left).letter) or (
-                board.in_bounds(rr, right) and board.get(rr, right).letter
-            ):
-                c_left = cc
-                while c_left > 0 and board.get(rr, c_left - 1).letter:
-                    c_left -= 1
-                word_mult = board.get(rr, cc).word_mult
-                word_score = (0 if is_blank else LETTER_SCORES.get(ch, 0)) * board.get(
-                    rr, cc
-                ).letter_mult
-                c_scan = c_left
-                while c_scan < BOARD_SIZE and (
-                    c_scan == cc or board.get(rr, c_scan).letter
-                ):
-                    if c_scan != cc:
-                        ch2 = board.get(rr, c_scan).letter
-                        word_score += LETTER_SCORES.get(ch2, 0)
-                    c_scan += 1
-                total += word_score * word_mult
-
-    if len(move.letters) == 7:
-        total += 50
+                break
+            length += 1
+            r, c = r + dr, c + dc
+        if length > 1:
+            total += score * word_mult[sq]
+    if move.tile_count == 7:
+        total += BINGO_BONUS
     return total
 
 
@@ -342,285 +574,587 @@ def build_move_from_state(
 ) -> Optional[Move]:
     if not placed:
         return None
-    if (row, anchor_col) not in {(r, c) for (r, c, _, _) in placed} and not board.get(
-        row, anchor_col
-    ).letter:
+    used = {(r, c) for (r, c, _, _) in placed}
+    if (row, anchor_col) not in used and not board.letter(row, anchor_col):
         return None
-    tmp_board = Board(
-        [
-            [Cell(letter=board.get(r, c).letter) for c in range(BOARD_SIZE)]
-            for r in range(BOARD_SIZE)
-        ]
-    )
-    for r, c, ch, _ in placed:
-        tmp_board.get(r, c).letter = ch
-    if not vertical:
-        c = min(c for (r, c, _, _) in placed if r == row)
-        while c > 0 and tmp_board.get(row, c - 1).letter:
-            c -= 1
-        letters: List[str] = []
-        cc = c
-        used = {(r, c) for (r, c, _, _) in placed}
-        while cc < BOARD_SIZE and (tmp_board.get(row, cc).letter or (row, cc) in used):
-            letters.append(tmp_board.get(row, cc).letter)
-            cc += 1
-        main_word = "".join(letters)
-    else:
-        r = min(r for (r, c, _, _) in placed if c == anchor_col)
-        while r > 0 and tmp_board.get(r - 1, anchor_col).letter:
-            r -= 1
-        letters = []
-        rr = r
-        used = {(r, c) for (r, c, _, _) in placed}
-        while rr < BOARD_SIZE and (
-            tmp_board.get(rr, anchor_col).letter or (rr, anchor_col) in used
-        ):
-            letters.append(tmp_board.get(rr, anchor_col).letter)
-            rr += 1
-        main_word = "".join(letters)
-    if not trie.has_word(main_word):
+    try:
+        mv = Move.from_letters(board, placed, vertical)
+    except ValueError:
+        return None
+    if not trie.has_word(mv.word):
         return None
-    mv = Move(
-        row=row,
-        col=anchor_col,
-        vertical=vertical,
-        letters=placed.copy(),
-        main_word=main_word,
-        score=0,
-    )
     mv.score = score_move(board, mv)
     return mv
 
 
-def dfs_left(
+def iter_line_moves(
     board: Board,
     trie: Trie,
     rack: Dict[str, int],
-    row: int,
-    anchor_col: int,
-    left_rest: int,
-    cross: List[List[Set[str]]],
-    moves: List[Move],
+    line: int,
     vertical: bool,
-):
-    def extend_left(
-        node: TrieNode,
-        col: int,
-        left_left: int,
-        placed: List[Tuple[int, int, str, bool]],
-        used_from_rack: bool,
-    ) -> None:
-        extend_right(node, anchor_col, placed, used_from_rack)
-        if left_left == 0:
-            return
-        next_col = col - 1
-        if next_col < 0:
+    cross: Sequence[int],
+    anchors: Sequence[int],
+) -> Iterator[Move]:
+    """Yield the moves through *anchors* along one row (or column) of *board*.
+
+    The line is read straight from the flat tile array with a stride of 1 for
+    a row and ``BOARD_SIZE`` for a column, so both orientations share the same
+    board and moves come out in board coordinates.  *cross* holds the
+    cross-check mask of each square of the line and *anchors* the positions
+    to play through.  *rack* is updated in place during the search.
+    """
+    stride = BOARD_SIZE if vertical else 1
+    start = line if vertical else line * BOARD_SIZE
+    tiles = board.tiles
+    letters = [_CHARS[tiles[start + p * stride]] for p in range(BOARD_SIZE)]
+    anchor_set = set(anchors)
+    prefix: List[Tuple[str, bool]] = []
+    placed: List[Tuple[int, bool]] = []
+
+    def make_move(word: str, end: int) -> Move:
+        first = end - len(word)
+        placed_bits = blank_bits = 0
+        for i, (_ch, blank) in enumerate(prefix):
+            placed_bits |= 1 << i
+            blank_bits |= blank << i
+        for p, blank in placed:
+            placed_bits |= 1 << (p - first)
+            blank_bits |= blank << (p - first)
+        mv = Move(start + first * stride, vertical, word, placed_bits, blank_bits)
+        mv.score = score_move(board, mv)
+        return mv
+
+    def take(ch: str) -> Optional[str]:
+        """Rack entry used to play *ch*: the letter itself, else a blank."""
+        if rack.get(ch, 0) > 0:
+            return ch
+        if rack.get("?", 0) > 0:
+            return "?"
+        return None
+
+    def extend_right(node: TrieNode, p: int, word: str, anchor: int) -> Iterator[Move]:
+        if p < BOARD_SIZE and letters[p]:
+            child = node.children.get(letters[p])
+            if child is not None:
+                yield from extend_right(child, p + 1, word + letters[p], anchor)
             return
-        cell = board.get(row, next_col)
-        if cell.letter:
-            node2 = trie.step(node, cell.letter)
-            if node2:
-                # Existing letters to the left extend the prefix but do not
-                # belong to the placement list since the bot does not place
-                # tiles on already occupied cells.
-                extend_left(node2, next_col, left_left - 1, placed, used_from_rack)
+        # The word ends here; it must cover the anchor to connect.
+        if node.is_word and p > anchor:
+            yield make_move(word, p)
+        if p == BOARD_SIZE:
             return
-        for ch in letters_available(rack):
-            if ch not in cross[row][next_col]:
+        mask = cross[p]
+        for ch, child in node.children.items():
+            if not mask & LETTER_BIT[ch]:
                 continue
-            node2 = trie.step(node, ch)
-            if not node2:
+            key = take(ch)
+            if key is None:
                 continue
-            try:
-                new_rack, used_blank = remove_letter(rack, ch)
-            except ValueError:
+            rack[key] -= 1
+            placed.append((p, key == "?"))
+            yield from extend_right(child, p + 1, word + ch, anchor)
+            placed.pop()
+            rack[key] += 1
+
+    def left_part(node: TrieNode, word: str, limit: int, anchor: int) -> Iterator[Move]:
+        yield from extend_right(node, anchor, word, anchor)
+        if limit == 0:
+            return
+        # Squares left of the anchor have no neighbours: no cross-checks.
+        for ch, child in node.children.items():
+            key = take(ch)
+            if key is None:
                 continue
-            old_rack = dict(rack)
-            rack.clear()
-            rack.update(new_rack)
-            extend_left(
-                node2,
-                next_col,
-                left_left - 1,
-                [(row, next_col, ch, used_blank)] + placed,
-                True,
-            )
-            rack.clear()
-            rack.update(old_rack)
-
-    def extend_right(
-        node: TrieNode,
-        col: int,
-        placed: List[Tuple[int, int, str, bool]],
-        used_from_rack: bool,
-    ) -> None:
-        c = col
-        made_progress = False
-        while c < BOARD_SIZE:
-            cell = board.get(row, c)
-            if cell.letter:
-                node = trie.step(node, cell.letter)
-                if not node:
-                    return
-                c += 1
+            rack[key] -= 1
+            prefix.append((ch, key == "?"))
+            yield from left_part(child, word + ch, limit - 1, anchor)
+            prefix.pop()
+            rack[key] += 1
+
+    for anchor in anchors:
+        if anchor > 0 and letters[anchor - 1]:
+            # Tiles already left of the anchor form a fixed prefix.
+            p = anchor - 1
+            while p > 0 and letters[p - 1]:
+                p -= 1
+            node: Optional[TrieNode] = trie.root
+            for ch in letters[p:anchor]:
+                node = node.children.get(ch) if node is not None else None
+            if node is not None:
+                yield from extend_right(
+                    node, anchor, "".join(letters[p:anchor]), anchor
+                )
+            continue
+        # Otherwise play up to as many tiles as there are free, non-anchor
+        # squares to the left; longer prefixes are found from other anchors.
+        limit = 0
+        p = anchor - 1
+        while p >= 0 and not letters[p] and p not in anchor_set:
+            limit += 1
+            p -= 1
+        yield from left_part(trie.root, "", limit, anchor)
+
+
+def _mirror(move: Move) -> Move:
+    r, c = divmod(move.start, BOARD_SIZE)
+    return Move(
+        c * BOARD_SIZE + r,
+        not move.vertical,
+        move.word,
+        move.placed,
+        move.blanks,
+        move.score,
+    )
+
+
+def iter_moves(
+    board: Board,
+    rack: Dict[str, int],
+    trie: Trie,
+    cross: Optional[Tuple[List[List[int]], List[List[int]]]] = None,
+) -> Iterator[Move]:
+    """Yield every legal move for *rack* on *board*, each placement once.
+
+    Moves are produced lazily, so consumers can stop early; *board* must not
+    change until the iterator is exhausted or dropped.  *cross* optionally
+    provides the cross-check grids for horizontal and vertical plays, e.g.
+    from :func:`precompute`, so they are not rebuilt.  A board attached to
+    *trie* supplies its own incrementally kept masks.
+    """
+    # The search updates the rack in place; work on a copy so callers sharing
+    # a rack (e.g. simulation workers) never observe intermediate states.
+    rack = dict(rack)
+    if not board.has_any_letter():
+        # Openings are searched across the centre only: every vertical one is
+        # the mirror image of one of these across the diagonal.
+        for mv in iter_line_moves(
+            board, trie, rack, CENTER, False, [FULL_MASK] * BOARD_SIZE, [CENTER]
+        ):
+            yield mv
+            mirrored = _mirror(mv)
+            mirrored.score = score_move(board, mirrored)
+            yield mirrored
+        return
+    if cross is None and board.trie is trie:
+        assert board.cross_h is not None and board.cross_v is not None
+        cross = board.cross_h, board.cross_v
+    if cross is None:
+        cross = (
+            compute_cross_checks(board, trie, vertical_scan=False),
+            compute_cross_checks(board, trie, vertical_scan=True),
+        )
+    cross_h, cross_v = cross
+    rows: Dict[int, List[int]] = {}
+    cols: Dict[int, List[int]] = {}
+    for r, c in board.anchors:
+        rows.setdefault(r, []).append(c)
+        cols.setdefault(c, []).append(r)
+    # Each line yields a placement of several tiles once, from the leftmost
+    # anchor it covers; only single tiles also show up across, so only their
+    # keys need remembering.
+    singles: Set[Tuple[int, str, bool]] = set()
+    for r in sorted(rows):
+        for mv in iter_line_moves(
+            board, trie, rack, r, False, cross_h[r], sorted(rows[r])
+        ):
+            if mv.tile_count == 1:
+                singles.add(next(mv.tiles()))
+            yield mv
+    for c in sorted(cols):
+        column = [cross_v[r][c] for r in range(BOARD_SIZE)]
+        for mv in iter_line_moves(board, trie, rack, c, True, column, sorted(cols[c])):
+            if mv.tile_count == 1 and next(mv.tiles()) in singles:
                 continue
-            legal_here = False
-            for ch in letters_available(rack):
-                if ch not in cross[row][c]:
-                    continue
-                node2 = trie.step(node, ch)
-                if not node2:
-                    continue
-                try:
-                    new_rack, used_blank = remove_letter(rack, ch)
-                except ValueError:
-                    continue
-                old_rack = dict(rack)
-                rack.clear()
-                rack.update(new_rack)
-                placed.append((row, c, ch, used_blank))
-                made_progress = True
-                if node2.is_word and used_from_rack:
-                    mv = build_move_from_state(
-                        board, row, anchor_col, placed, vertical, trie
-                    )
-                    if mv:
-                        moves.append(mv)
-                extend_right(node2, c + 1, placed, True)
-                placed.pop()
-                rack.clear()
-                rack.update(old_rack)
-                legal_here = True
-            break
-        if not made_progress and node.is_word and used_from_rack:
-            mv = build_move_from_state(board, row, anchor_col, placed, vertical, trie)
-            if mv:
-                moves.append(mv)
-
-    extend_left(trie.root, anchor_col, left_rest, [], False)
-
-
-def generate_moves(board: Board, rack: Dict[str, int], trie: Trie) -> List[Move]:
-    moves: List[Move] = []
-    first_move = not board.has_any_letter()
-    cross_h = compute_cross_checks(board, trie, vertical_scan=False)
-    for r in range(BOARD_SIZE):
-        anchors = find_anchors_in_row(board, r, first_move)
-        for anchor_col, left_limit in anchors:
-            extra = 1 if anchor_col > 0 and board.get(r, anchor_col - 1).letter else 0
-            dfs_left(
-                board,
-                trie,
-                rack,
-                r,
-                anchor_col,
-                left_limit + extra,
-                cross_h,
-                moves,
-                vertical=False,
-            )
+            yield mv
 
-    t_board = board.transpose()
-    cross_v = compute_cross_checks(t_board, trie, vertical_scan=False)
-    for r in range(BOARD_SIZE):
-        anchors = find_anchors_in_row(t_board, r, first_move)
-        for anchor_col, left_limit in anchors:
-            tmp: List[Move] = []
-            extra = 1 if anchor_col > 0 and t_board.get(r, anchor_col - 1).letter else 0
-            dfs_left(
-                t_board,
-                trie,
-                rack,
-                r,
-                anchor_col,
-                left_limit + extra,
-                cross_v,
-                tmp,
-                vertical=False,
-            )
-            for mv in tmp:
-                new_letters = [
-                    (c, r_, ch, is_blank) for (r_, c, ch, is_blank) in mv.letters
-                ]
-                moves.append(
-                    Move(
-                        row=mv.col,
-                        col=mv.row,
-                        vertical=True,
-                        letters=new_letters,
-                        main_word=mv.main_word,
-                        score=mv.score,
-                    )
-                )
-    for mv in moves:
-        mv.score = score_move(board, mv)
-    return moves
 
+def generate_moves(
+    board: Board,
+    rack: Dict[str, int],
+    trie: Trie,
+    cross: Optional[Tuple[List[List[int]], List[List[int]]]] = None,
+) -> List[Move]:
+    """Return every legal move for *rack* on *board*, see :func:`iter_moves`."""
+    return list(iter_moves(board, rack, trie, cross))
+
+
+def leave_after(rack: Dict[str, int], move: Move) -> str:
+    """Sorted letters left on *rack* once *move* is played."""
+    remaining = dict(rack)
+    for _sq, ch, is_blank in move.tiles():
+        remaining["?" if is_blank else ch] -= 1
+    return rack_key(remaining)
 
-def best_move(board: Board, rack: Dict[str, int], trie: Trie) -> Optional[Move]:
-    all_moves = generate_moves(board, rack, trie)
-    if not all_moves:
-        return None
-    return max(all_moves, key=lambda m: m.score)
+
+def equity(move: Move, rack: Dict[str, int], leaves: LeaveTable) -> float:
+    """Score of *move* plus the value of the tiles it keeps on the rack."""
+    return move.score + leaves.value(leave_after(rack, move))
+
+
+def best_move(
+    board: Board,
+    rack: Dict[str, int],
+    trie: Trie,
+    cross: Optional[Tuple[List[List[int]], List[List[int]]]] = None,
+    leaves: Optional[LeaveTable] = None,
+) -> Optional[Move]:
+    """Return the move with the highest equity, see :func:`equity`."""
+    if leaves is None:
+        leaves = default_table()
+    return max(
+        iter_moves(board, rack, trie, cross),
+        key=lambda m: equity(m, rack, leaves),
+        default=None,
+    )
+
+
+def top_moves(
+    board: Board,
+    rack: Dict[str, int],
+    trie: Trie,
+    n: int,
+    deadline: Optional[float] = None,
+) -> Tuple[List[Move], bool]:
+    """Return the *n* highest scoring moves, best first, and whether all were seen.
+
+    Generation stops once *deadline* (``time.monotonic``) has passed; the
+    moves are then the best of those seen so far, which favour the top rows
+    and left columns, and the flag is false.
+    """
+    heap: List[Tuple[int, int, Move]] = []
+    complete = True
+    for i, mv in enumerate(iter_moves(board, rack, trie)):
+        # Ties keep the move generated first.
+        item = (mv.score, -i, mv)
+        if len(heap) < n:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+        if deadline is not None and i & 63 == 0 and time.monotonic() > deadline:
+            complete = False
+            break
+    return [mv for _score, _i, mv in sorted(heap, reverse=True)], complete
 
 
 # ---------------------------------------------------------------------------
 # Public helpers compatible with previous API
 # ---------------------------------------------------------------------------
 
-DICTIONARY: Set[str] = set(game.DICTIONARY)
-DICTIONARY_BY_LENGTH: Dict[int, List[str]] = {}
+# The same set as game.DICTIONARY.  Functions taking a ``lexicon`` use its
+# words instead.
+DICTIONARY: Set[str]
 
 
-def _rebuild_dicts() -> None:
-    DICTIONARY_BY_LENGTH.clear()
-    for w in DICTIONARY:
-        DICTIONARY_BY_LENGTH.setdefault(len(w), []).append(w)
+def __getattr__(name: str) -> object:
+    if name == "DICTIONARY":
+        return get_lexicon().words
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-_rebuild_dicts()
+def _dictionary(lexicon: Optional[Lexicon] = None) -> Set[str]:
+    return (get_lexicon() if lexicon is None else lexicon).words
 
 
-def _build_trie() -> Trie:
+def _build_trie(words: Set[str]) -> Trie:
     trie = Trie()
-    for w in DICTIONARY:
+    for w in words:
         trie.insert(w.upper())
     return trie
 
 
+# Tries of the word lists in use, least recently used first, keyed by the
+# identity of the list: (words, trie, fingerprint).
+_tries: "OrderedDict[int, Tuple[Set[str], Trie, str]]" = OrderedDict()
+TRIE_SLOTS = 4
+_tries_lock = threading.Lock()
+
+
+def _trie_entry(words: Optional[Set[str]] = None) -> Tuple[Set[str], Trie, str]:
+    source = _dictionary() if words is None else words
+    with _tries_lock:
+        entry = _tries.get(id(source))
+        if entry is not None and entry[0] is source:
+            _tries.move_to_end(id(source))
+            return entry
+    # Built outside the lock: a lexicon compiled in the background must not
+    # hold up the games in play.
+    checksum = 0
+    for w in source:
+        checksum ^= zlib.crc32(w.encode())
+    entry = (source, _build_trie(source), f"{len(source)}:{checksum:08x}")
+    with _tries_lock:
+        _tries[id(source)] = entry
+        while len(_tries) > TRIE_SLOTS:
+            _tries.popitem(last=False)
+    return entry
+
+
+def get_trie(words: Optional[Set[str]] = None) -> Trie:
+    """Return the trie for *words*, :data:`DICTIONARY` by default.
+
+    Tries are built once per word list object and shared by every game that
+    plays with it; a list is rebuilt only when it is replaced.
+    """
+    return _trie_entry(words)[1]
+
+
+def dictionary_fingerprint(lexicon: Optional[Lexicon] = None) -> str:
+    """Identify the words of *lexicon*, :data:`DICTIONARY` by default."""
+    return _trie_entry(_dictionary(lexicon))[2]
+
+
+def _scoring_fingerprint(values: bytes) -> str:
+    return f"{zlib.crc32(values + game.LETTER_MULT + game.WORD_MULT):08x}"
+
+
+SCORING_FINGERPRINT = _scoring_fingerprint(LETTER_VALUES)
+
+
+def engine_fingerprint(lexicon: Optional[Lexicon] = None) -> str:
+    """Identify the dictionary, leave table and scoring behind a cached move."""
+    if lexicon is None:
+        scoring = SCORING_FINGERPRINT
+    else:
+        scoring = _scoring_fingerprint(lexicon.values)
+    return (
+        f"{dictionary_fingerprint(lexicon)}/{default_table().fingerprint}" f"/{scoring}"
+    )
+
+
+def board_from_letters(
+    board: List[List[Optional[str]]], lexicon: Optional[Lexicon] = None
+) -> Board:
+    """Build a :class:`Board` from the game's letter grid (blanks lowercase).
+
+    Moves on it are scored with the letter values of *lexicon*.
+    """
+    tiles = bytearray(SQUARES)
+    blanks = bytearray(SQUARES)
+    for r, row in enumerate(board):
+        for c, ch in enumerate(row):
+            if ch:
+                tiles[r * BOARD_SIZE + c] = ord(ch.upper())
+                blanks[r * BOARD_SIZE + c] = ch.islower()
+    values = None if lexicon is None else lexicon.values
+    return Board(tiles, blanks, values=values)
+
+
+# ---------------------------------------------------------------------------
+# Speculative precomputation
+# ---------------------------------------------------------------------------
+
+SPECULATION_SLOTS = 64
+
+
+@dataclass
+class Precomputed:
+    """Cross-check grids computed for a snapshot of the board."""
+
+    tiles: bytes
+    trie: Trie
+    cross_h: List[List[int]]
+    cross_v: List[List[int]]
+
+
+def precompute(board: Board, trie: Trie) -> Precomputed:
+    return Precomputed(
+        tiles=bytes(board.tiles),
+        trie=trie,
+        cross_h=compute_cross_checks(board, trie, vertical_scan=False),
+        cross_v=compute_cross_checks(board, trie, vertical_scan=True),
+    )
+
+
+def refresh(pre: Precomputed, board: Board) -> Optional[Precomputed]:
+    """Bring *pre* up to date with *board*, recomputing only the touched lines.
+
+    Returns ``None`` when *board* is not the snapshot of *pre* plus new tiles.
+    """
+    added: List[Tuple[int, int]] = []
+    for i, (old, new) in enumerate(zip(pre.tiles, board.tiles)):
+        if old == new:
+            continue
+        if old:
+            return None
+        added.append(divmod(i, BOARD_SIZE))
+    if not added:
+        return pre
+    # A new tile only changes the vertical cross words of its column and the
+    # horizontal cross words of its row.
+    cross_h = [row[:] for row in pre.cross_h]
+    for c in {c for _, c in added}:
+        for r in range(BOARD_SIZE):
+            cross_h[r][c] = cross_check_at(board, pre.trie, r, c, vertical_scan=False)
+    cross_v = [row[:] for row in pre.cross_v]
+    for r in {r for r, _ in added}:
+        for c in range(BOARD_SIZE):
+            cross_v[r][c] = cross_check_at(board, pre.trie, r, c, vertical_scan=True)
+    return Precomputed(
+        tiles=bytes(board.tiles), trie=pre.trie, cross_h=cross_h, cross_v=cross_v
+    )
+
+
+_speculation: "OrderedDict[object, Precomputed]" = OrderedDict()
+_speculation_lock = threading.Lock()
+_speculation_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="bot-speculation"
+)
+
+
+def _store_precomputed(key: object, board: Board, lexicon: Optional[Lexicon]) -> None:
+    pre = precompute(board, get_trie(_dictionary(lexicon)))
+    with _speculation_lock:
+        _speculation[key] = pre
+        _speculation.move_to_end(key)
+        while len(_speculation) > SPECULATION_SLOTS:
+            _speculation.popitem(last=False)
+
+
+def speculate(
+    key: object, board: List[List[Optional[str]]], lexicon: Optional[Lexicon] = None
+) -> Future:
+    """Precompute the cross-check tables of *board* in the background.
+
+    Meant to run while the human is thinking: :func:`bot_turn` later picks the
+    result up and only recomputes the lines touched by the tiles placed since.
+    """
+    return _speculation_executor.submit(
+        _store_precomputed, key, board_from_letters(board, lexicon), lexicon
+    )
+
+
+def _precomputed_cross(
+    key: object, board: Board, trie: Trie
+) -> Optional[Tuple[List[List[int]], List[List[int]]]]:
+    """Cross-checks of *board* from the snapshot speculated for game *key*."""
+    with _speculation_lock:
+        pre = _speculation.get(key)
+    if pre is None or pre.trie is not trie:
+        return None
+    fresh = refresh(pre, board)
+    if fresh is None:
+        return None
+    with _speculation_lock:
+        if _speculation.get(key) is pre:
+            _speculation[key] = fresh
+    return fresh.cross_h, fresh.cross_v
+
+
+# ---------------------------------------------------------------------------
+# Move cache
+# ---------------------------------------------------------------------------
+
+# Best moves keyed by (engine fingerprint, Zobrist hash, sorted rack).
+MOVE_CACHE = LRUCache(
+    "bot_moves",
+    maxsize=int(os.getenv("BOT_CACHE_SIZE", "4096")),
+    ttl=float(os.getenv("BOT_CACHE_TTL", "86400")),
+    path=os.getenv("BOT_CACHE_PATH"),
+)
+
+# Hints keyed like MOVE_CACHE plus the number of moves asked for.  Only
+# complete searches are stored, so entries do not depend on the time budget.
+HINT_CACHE = LRUCache(
+    "bot_hints", maxsize=int(os.getenv("BOT_HINT_CACHE_SIZE", "1024"))
+)
+HINT_TIME_BUDGET = float(os.getenv("BOT_HINT_TIME_BUDGET", "0.5"))
+
+
+# ---------------------------------------------------------------------------
+# Opening book
+# ---------------------------------------------------------------------------
+
+# Built offline with ``python -m backend.opening_book``.
+OPENING_BOOK_PATH = Path(
+    os.getenv("BOT_OPENING_BOOK", Path(__file__).with_name("opening_book.json"))
+)
+_opening_books: Dict[Tuple[str, str], Dict[str, list]] = {}
+
+
+def _opening_book(fingerprint: str) -> Dict[str, list]:
+    """Return the book built for the engine *fingerprint*, or an empty one."""
+    key = (str(OPENING_BOOK_PATH), fingerprint)
+    if key not in _opening_books:
+        try:
+            data = json.loads(Path(OPENING_BOOK_PATH).read_text())
+        except (OSError, ValueError):
+            data = {}
+        moves = data.get("moves", {}) if data.get("dictionary") == fingerprint else {}
+        _opening_books[key] = moves
+    return _opening_books[key]
+
+
 def bot_turn(
-    board: List[List[Optional[str]]], rack: List[str]
+    board: List[List[Optional[str]]],
+    rack: List[str],
+    key: object = None,
+    lexicon: Optional[Lexicon] = None,
 ) -> Tuple[List[Tuple[int, int, str, bool]], int]:
-    trie = _build_trie()
-    board_obj = Board(
-        [
-            [Cell(letter=board[r][c]) for c in range(BOARD_SIZE)]
-            for r in range(BOARD_SIZE)
-        ]
-    )
+    """Best move for *rack* with *lexicon*, the default one if None.
+
+    *key* identifies the game for :func:`speculate`.
+    """
+    trie = get_trie(_dictionary(lexicon))
+    board_obj = board_from_letters(board, lexicon)
     rack_counts: Dict[str, int] = {}
     for ch in rack:
         rack_counts[ch.upper()] = rack_counts.get(ch.upper(), 0) + 1
-    move = best_move(board_obj, rack_counts, trie)
+    fingerprint = engine_fingerprint(lexicon)
+    cache_key = (fingerprint, board_obj.hash, rack_key(rack_counts))
+    cached = MOVE_CACHE.get(cache_key)
+    if cached is None and not board_obj.has_any_letter():
+        cached = _opening_book(fingerprint).get(cache_key[2])
+    if cached is not None:
+        placements, score = cached
+        return [tuple(p) for p in placements], score
+    cross = _precomputed_cross(key, board_obj, trie) if key is not None else None
+    move = best_move(board_obj, rack_counts, trie, cross)
     if move is None:
+        MOVE_CACHE.put(cache_key, ([], 0))
         return [], 0
+    MOVE_CACHE.put(cache_key, (move.letters, move.score))
     return move.letters, move.score
 
 
+def hint_moves(
+    board: List[List[Optional[str]]],
+    rack: List[str],
+    n: int,
+    time_budget: float = HINT_TIME_BUDGET,
+    lexicon: Optional[Lexicon] = None,
+) -> List[Tuple[List[Tuple[int, int, str, bool]], str, int]]:
+    """Return up to *n* ``(placements, main word, score)`` hints for *rack*.
+
+    A search cut short by *time_budget* is returned but not cached.
+    """
+    board_obj = board_from_letters(board, lexicon)
+    rack_counts: Dict[str, int] = {}
+    for ch in rack:
+        rack_counts[ch.upper()] = rack_counts.get(ch.upper(), 0) + 1
+    key = (engine_fingerprint(lexicon), board_obj.hash, rack_key(rack_counts), n)
+    cached = HINT_CACHE.get(key)
+    if cached is None:
+        trie = get_trie(_dictionary(lexicon))
+        moves, complete = top_moves(
+            board_obj, rack_counts, trie, n, time.monotonic() + time_budget
+        )
+        cached = [(mv.letters, mv.main_word, mv.score) for mv in moves]
+        if complete:
+            HINT_CACHE.put(key, cached)
+    return cached
+
+
 def is_valid_placement(
     board: List[List[Optional[str]]],
     word: str,
     row: int,
     col: int,
     direction: str,
+    lexicon: Optional[Lexicon] = None,
 ) -> Tuple[bool, int, List[Tuple[int, int, str]]]:
-    trie = _build_trie()
-    board_before = Board(
-        [
-            [Cell(letter=board[r][c]) for c in range(BOARD_SIZE)]
-            for r in range(BOARD_SIZE)
-        ]
-    )
+    trie = get_trie(_dictionary(lexicon))
+    board_before = board_from_letters(board, lexicon)
     placements: List[Tuple[int, int, str, bool]] = []
     word = word.upper()
     for i, ch in enumerate(word):
@@ -628,9 +1162,9 @@ def is_valid_placement(
         c = col + (i if direction == "across" else 0)
         if not board_before.in_bounds(r, c):
             return False, 0, []
-        cell = board_before.get(r, c)
-        if cell.letter:
-            if cell.letter != ch:
+        letter = board_before.letter(r, c)
+        if letter:
+            if letter != ch:
                 return False, 0, []
 
         else:
@@ -638,18 +1172,9 @@ def is_valid_placement(
     if not placements:
         return False, 0, []
 
-    board_after = Board(
-        [
-            [Cell(letter=board[r][c]) for c in range(BOARD_SIZE)]
-            for r in range(BOARD_SIZE)
-        ]
-    )
-    for r, c, ch, _ in placements:
-        board_after.get(r, c).letter = ch
-
     # first move must cover center
     if not board_before.has_any_letter():
-        if not board_after.get(7, 7).letter:
+        if (7, 7) not in {(r, c) for r, c, _, _ in placements}:
             return False, 0, []
     else:
 
@@ -657,7 +1182,7 @@ def is_valid_placement(
         for r, c, _, _ in placements:
             for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 rr, cc = r + dr, c + dc
-                if board_before.in_bounds(rr, cc) and board_before.get(rr, cc).letter:
+                if board_before.in_bounds(rr, cc) and board_before.letter(rr, cc):
 
                     connected = True
                     break
@@ -666,36 +1191,36 @@ def is_valid_placement(
         if not connected:
             return False, 0, []
 
-    for r, c, ch, _ in placements:
+    # Read the formed words with the tiles placed, then take them back so the
+    # move is scored against the board as it was.
+    board_after = board_before
+    board_after.apply(placements)
+    try:
+        for r, c, ch, _ in placements:
+            if direction == "across":
+                word_cross = build_full_vertical(board_after, r, c, ch)
+            else:
+                word_cross = build_full_horizontal(board_after, r, c, ch)
+            if len(word_cross) > 1 and not trie.has_word(word_cross):
+                return False, 0, []
+
         if direction == "across":
-            word_cross = build_full_vertical(board_after, r, c, ch)
+            main_word = build_full_horizontal(
+                board_after, row, col, board_after.letter(row, col)
+            )
         else:
-            word_cross = build_full_horizontal(board_after, r, c, ch)
-        if len(word_cross) > 1 and not trie.has_word(word_cross):
+            main_word = build_full_vertical(
+                board_after, row, col, board_after.letter(row, col)
+            )
+        if not trie.has_word(main_word):
             return False, 0, []
+    finally:
+        board_after.undo(placements)
 
-    if direction == "across":
-        main_word = build_full_horizontal(
-            board_after, row, col, board_after.get(row, col).letter
-        )
-    else:
-        main_word = build_full_vertical(
-            board_after, row, col, board_after.get(row, col).letter
-        )
-    if not trie.has_word(main_word):
-        return False, 0, []
-
-    move = Move(
-        row=row,
-        col=col,
-        vertical=(direction == "down"),
-        letters=placements,
-        main_word=main_word,
-        score=0,
-    )
+    move = Move.from_letters(board_before, placements, direction == "down")
     score = score_move(board_before, move)
     placements_simple = [(r, c, ch) for (r, c, ch, _blank) in placements]
     return True, score, placements_simple
 
 
-__all__ = ["bot_turn", "is_valid_placement", "BOARD_SIZE", "DICTIONARY"]
+__all__ = ["bot_turn", "is_valid_placement", "speculate", "BOARD_SIZE", "DICTIONARY"]
@@ -0,0 +1,123 @@
+"""Small in-process caches with hit-rate accounting."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+# Every cache registers itself here so the metrics endpoint can report on it.
+CACHES: Dict[str, "LRUCache"] = {}
+
+
+class LRUCache:
+    """Thread-safe LRU cache with an optional time-to-live.
+
+    When *path* is given, entries are also written to a SQLite table so they
+    survive restarts; values must then be JSON serialisable and keys are
+    stored by their ``repr``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "name TEXT, key TEXT, value TEXT, stored_at REAL, "
+                "PRIMARY KEY (name, key))"
+            )
+            self._db.commit()
+        CACHES[name] = self
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def _load(self, key: Hashable, now: float) -> Any:
+        if self._db is None:
+            return _MISSING
+        row = self._db.execute(
+            "SELECT value, stored_at FROM cache_entries WHERE name = ? AND key = ?",
+            (self.name, repr(key)),
+        ).fetchone()
+        if row is None or self._expired(row[1], now):
+            return _MISSING
+        value = json.loads(row[0])
+        self._remember(key, value, row[1])
+        return value
+
+    def _remember(self, key: Hashable, value: Any, stored_at: float) -> None:
+        self._data[key] = (stored_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic() if self._db is None else time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and not self._expired(entry[0], now):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            value = self._load(key, now)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic() if self._db is None else time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?)",
+                    (self.name, repr(key), json.dumps(value), now),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM cache_entries WHERE name = ?", (self.name,)
+                )
+                self._db.commit()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def all_stats() -> Dict[str, Dict[str, float]]:
+    """Return the statistics of every registered cache."""
+    return {name: cache.stats() for name, cache in CACHES.items()}
@@ -0,0 +1,186 @@
+"""Endgame solver used once the bag is empty.
+
+With no tiles left to draw, the opponent's rack is exactly the set of unseen
+tiles and the game is one of perfect information.  :func:`solve` runs an
+iterative-deepening negamax with alpha-beta pruning over the bot's move
+generator, plays moves on a single board with :meth:`Board.apply` /
+:meth:`Board.undo` (which keep its hash and cross-checks current), and
+memoises positions in a transposition table keyed by the Zobrist hash and
+both racks.  The best move of the deepest completed
+iteration is returned when the time budget runs out.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from . import bot
+from .lexicon import Lexicon
+
+TIME_BUDGET = float(os.getenv("BOT_ENDGAME_TIME_BUDGET", "2.0"))
+MAX_DEPTH = 8
+TABLE_SIZE = 200_000
+
+Placements = List[Tuple[int, int, str, bool]]
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class _Timeout(Exception):
+    pass
+
+
+def rack_value(rack: Dict[str, int], values: bytes) -> int:
+    return sum(values[ord(ch)] * n for ch, n in rack.items())
+
+
+class Solver:
+    """Negamax search over a shared board; values are score spreads."""
+
+    def __init__(self, board: bot.Board, trie: bot.Trie, deadline: float) -> None:
+        self.board = board
+        self.trie = trie
+        self.deadline = deadline
+        board.attach(trie)
+        # key -> (depth, value, flag, best move key)
+        self.table: Dict[tuple, Tuple[int, int, int, Optional[tuple]]] = {}
+        self.nodes = 0
+
+    def _moves(self, rack: Dict[str, int], hint: Optional[tuple]) -> List[bot.Move]:
+        moves = bot.generate_moves(self.board, rack, self.trie)
+        # Best move from the table first, then highest scores: good moves
+        # early make alpha-beta cut the most.
+        moves.sort(key=lambda m: (m.key() != hint, -m.score))
+        return moves
+
+    def negamax(
+        self,
+        me: Dict[str, int],
+        opp: Dict[str, int],
+        depth: int,
+        alpha: int,
+        beta: int,
+        passes: int,
+    ) -> Tuple[int, Optional[bot.Move]]:
+        self.nodes += 1
+        if self.nodes & 63 == 0 and time.monotonic() > self.deadline:
+            raise _Timeout
+        if depth == 0:
+            return 0, None
+
+        key = (self.board.hash, bot.rack_key(me), bot.rack_key(opp), passes)
+        entry = self.table.get(key)
+        hint = None
+        if entry is not None:
+            e_depth, e_value, e_flag, hint = entry
+            if e_depth >= depth and (
+                e_flag == EXACT
+                or (e_flag == LOWER and e_value >= beta)
+                or (e_flag == UPPER and e_value <= alpha)
+            ):
+                return e_value, None
+        alpha_orig = alpha
+
+        best_value = None
+        best: Optional[bot.Move] = None
+        for mv in self._moves(me, hint):
+            letters = mv.letters
+            self.board.apply(letters)
+            for _r, _c, ch, is_blank in letters:
+                me["?" if is_blank else ch] -= 1
+            try:
+                if not any(me.values()):
+                    # Going out ends the game: the opponent's tiles count twice.
+                    value = mv.score + 2 * rack_value(opp, self.board.values)
+                else:
+                    child, _ = self.negamax(opp, me, depth - 1, -beta, -alpha, 0)
+                    value = mv.score - child
+            finally:
+                for _r, _c, ch, is_blank in letters:
+                    me["?" if is_blank else ch] += 1
+                self.board.undo(letters)
+            if best_value is None or value > best_value:
+                best_value, best = value, mv
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if alpha < beta:
+            if passes:
+                # Two passes in a row end the game with the racks as they are.
+                values = self.board.values
+                value = rack_value(opp, values) - rack_value(me, values)
+            else:
+                child, _ = self.negamax(opp, me, depth - 1, -beta, -alpha, 1)
+                value = -child
+            if best_value is None or value > best_value:
+                best_value, best = value, None
+
+        assert best_value is not None
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        if len(self.table) >= TABLE_SIZE:
+            self.table.clear()
+        best_key = best.key() if best is not None else None
+        self.table[key] = (depth, best_value, flag, best_key)
+        return best_value, best
+
+
+def solve(
+    board: bot.Board,
+    rack: Dict[str, int],
+    opp_rack: Dict[str, int],
+    time_budget: float = TIME_BUDGET,
+    max_depth: int = MAX_DEPTH,
+    trie: Optional[bot.Trie] = None,
+) -> Tuple[Optional[bot.Move], int, int]:
+    """Search the endgame from *board* with the bot to move.
+
+    Returns ``(move, value, depth)``: the best move (``None`` to pass), the
+    spread it secures and the deepest fully searched depth.  Words come from
+    *trie*, the default lexicon's if None.
+    """
+    if trie is None:
+        trie = bot.get_trie()
+    solver = Solver(board, trie, time.monotonic() + time_budget)
+    best: Optional[bot.Move] = None
+    value = 0
+    depth = 0
+    inf = 10_000
+    try:
+        for d in range(1, max_depth + 1):
+            value, best = solver.negamax(dict(rack), dict(opp_rack), d, -inf, inf, 0)
+            depth = d
+    except _Timeout:
+        pass
+    if depth == 0:
+        # Not even one ply in time: fall back to the highest scoring move.
+        moves = bot.iter_moves(board, rack, solver.trie)
+        best = max(moves, key=lambda m: m.score, default=None)
+    return best, value, depth
+
+
+def solve_turn(
+    letters: List[List[Optional[str]]],
+    rack: List[str],
+    unseen: List[str],
+    lexicon: Optional[Lexicon] = None,
+) -> Tuple[Placements, int]:
+    """Same contract as :func:`backend.bot.bot_turn` for an empty bag."""
+    board = bot.board_from_letters(letters, lexicon)
+    move, _value, _depth = solve(
+        board,
+        dict(Counter(ch.upper() for ch in rack)),
+        dict(Counter(ch.upper() for ch in unseen)),
+        trie=bot.get_trie(bot._dictionary(lexicon)),
+    )
+    if move is None:
+        return [], 0
+    return move.letters, move.score
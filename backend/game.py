@@ -3,50 +3,45 @@
 from __future__ import annotations
 
 import random
-from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .lexicon import DEFAULT_LEXICON, REGISTRY, Lexicon, get_lexicon
 
 BOARD_SIZE = 15
 
 # ---------------------------------------------------------------------------
-# Letter distribution and values (French Scrabble)
+# Lexicon: dictionary, letter distribution and values
 # ---------------------------------------------------------------------------
 
+# The module-level tables belong to the default lexicon.  Functions taking a
+# ``lexicon`` argument use these when it is None, else that lexicon's own.
+# Every version of a lexicon has the same tiles, so they are read from the
+# registered one without looking up reloaded versions at import.
+_lexicon = REGISTRY[DEFAULT_LEXICON]
+
 # Each entry: letter -> (count, points)
-LETTER_DISTRIBUTION: dict[str, tuple[int, int]] = {
-    "A": (9, 1),
-    "B": (2, 3),
-    "C": (2, 3),
-    "D": (3, 2),
-    "E": (15, 1),
-    "F": (2, 4),
-    "G": (2, 2),
-    "H": (2, 4),
-    "I": (8, 1),
-    "J": (1, 8),
-    "K": (1, 10),
-    "L": (5, 1),
-    "M": (3, 2),
-    "N": (6, 1),
-    "O": (6, 1),
-    "P": (2, 3),
-    "Q": (1, 8),
-    "R": (6, 1),
-    "S": (6, 1),
-    "T": (6, 1),
-    "U": (6, 1),
-    "V": (2, 4),
-    "W": (1, 10),
-    "X": (1, 10),
-    "Y": (1, 10),
-    "Z": (1, 10),
-    "?": (2, 0),  # Jokers
-}
-
-LETTER_POINTS = {ltr: pts for ltr, (_, pts) in LETTER_DISTRIBUTION.items()}
-
-# Load dictionary
-DICTIONARY = set(Path("backend/ods8.txt").read_text().splitlines())
+LETTER_DISTRIBUTION: dict[str, tuple[int, int]] = _lexicon.distribution
+LETTER_POINTS = _lexicon.points
+# Letter values by code point; lowercase letters are blanks and score 0.
+LETTER_VALUES = _lexicon.values
+# The words of the current version of the default lexicon, see __getattr__.
+DICTIONARY: Set[str]
+
+
+def __getattr__(name: str) -> object:
+    if name == "DICTIONARY":
+        return get_lexicon().words
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _dictionary(lexicon: Optional[Lexicon] = None) -> Set[str]:
+    return (get_lexicon() if lexicon is None else lexicon).words
+
+
+def _distribution(lexicon: Optional[Lexicon]) -> Dict[str, Tuple[int, int]]:
+    return LETTER_DISTRIBUTION if lexicon is None else lexicon.distribution
+
 
 # ---------------------------------------------------------------------------
 # Board bonuses configuration
@@ -142,6 +137,16 @@ for r, c in [
 # Center star
 BONUS[7][7] = "CENTER"
 
+# Flat per-square multiplier tables, indexed by ``r * BOARD_SIZE + c``.
+SQUARES = BOARD_SIZE * BOARD_SIZE
+_LETTER_BONUS = {"DL": 2, "TL": 3}
+_WORD_BONUS = {"DW": 2, "CENTER": 2, "TW": 3}
+LETTER_MULT = bytes(_LETTER_BONUS.get(bonus, 1) for row in BONUS for bonus in row)
+WORD_MULT = bytes(_WORD_BONUS.get(bonus, 1) for row in BONUS for bonus in row)
+
+# Extra points for playing all seven tiles in one move.
+BINGO_BONUS = 50
+
 # ---------------------------------------------------------------------------
 # Game state
 # ---------------------------------------------------------------------------
@@ -151,11 +156,11 @@ board: List[List[str | None]] = []
 first_move = True
 
 
-def reset_game() -> None:
+def reset_game(lexicon: Optional[Lexicon] = None) -> None:
     """Reset bag, board and first-move flag."""
     global bag, board, first_move
     bag = []
-    for letter, (count, _) in LETTER_DISTRIBUTION.items():
+    for letter, (count, _) in _distribution(lexicon).items():
         bag.extend([letter] * count)
     random.shuffle(bag)
     board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
@@ -170,12 +175,15 @@ reset_game()
 
 
 def load_game_state(
-    tiles: Iterable[Tuple[int, int, str]], racks: Iterable[str]
+    tiles: Iterable[Tuple[int, int, str]],
+    racks: Iterable[str],
+    lexicon: Optional[Lexicon] = None,
 ) -> None:
     """Populate board and bag from persisted *tiles* and *racks*."""
     global bag, board, first_move
-    reset_game()
-    counts = {ltr: count for ltr, (count, _) in LETTER_DISTRIBUTION.items()}
+    reset_game(lexicon)
+    distribution = _distribution(lexicon)
+    counts = {ltr: count for ltr, (count, _) in distribution.items()}
     board = [[None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
     for r, c, letter in tiles:
         board[r][c] = letter
@@ -184,7 +192,7 @@ def load_game_state(
         for letter in rack:
             counts[letter.upper()] -= 1
     bag = []
-    for letter, (total, _) in LETTER_DISTRIBUTION.items():
+    for letter, (total, _) in distribution.items():
         bag.extend([letter] * counts[letter])
     random.shuffle(bag)
     first_move = not list(tiles)
@@ -195,6 +203,33 @@ def load_game_state(
 # ---------------------------------------------------------------------------
 
 
+EMPTY_SQUARE = "."
+
+
+def board_to_string(grid: List[List[Optional[str]]]) -> str:
+    """Encode *grid* as 225 characters, row by row; blanks stay lowercase."""
+    return "".join(letter or EMPTY_SQUARE for row in grid for letter in row)
+
+
+def board_from_string(
+    text: str, lexicon: Optional[Lexicon] = None
+) -> List[List[Optional[str]]]:
+    """Decode a board encoded by :func:`board_to_string`."""
+    points = LETTER_POINTS if lexicon is None else lexicon.points
+    if len(text) != SQUARES:
+        raise ValueError(f"Board must have {SQUARES} squares")
+    grid: List[List[Optional[str]]] = [
+        [None for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)
+    ]
+    for i, ch in enumerate(text):
+        if ch == EMPTY_SQUARE:
+            continue
+        if ch == "?" or ch.upper() not in points:
+            raise ValueError(f"Invalid board square: {ch}")
+        grid[i // BOARD_SIZE][i % BOARD_SIZE] = ch
+    return grid
+
+
 def draw_tiles(n: int) -> List[str]:
     """Draw up to *n* tiles from the bag."""
     draw = bag[:n]
@@ -209,14 +244,17 @@ class Placement(Tuple[int, int, str, bool]):
     blank: bool
 
 
+LetterAt = Callable[[int, int], Optional[str]]
+
+
 def _word_from_board(
-    r: int, c: int, dr: int, dc: int
+    r: int, c: int, dr: int, dc: int, letter_at: LetterAt
 ) -> Tuple[str, List[Tuple[int, int]]]:
-    """Read a word from the board starting at (r,c) moving (dr,dc)."""
+    """Read a word starting at (r,c) moving (dr,dc)."""
     letters = []
     coords = []
-    while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE and board[r][c] is not None:
-        letters.append(board[r][c])
+    while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE and letter_at(r, c) is not None:
+        letters.append(letter_at(r, c))
         coords.append((r, c))
         r += dr
         c += dc
@@ -224,7 +262,10 @@ def _word_from_board(
 
 
 def _score_word(
-    coords: List[Tuple[int, int]], new_tiles: Iterable[Tuple[int, int]]
+    coords: List[Tuple[int, int]],
+    new_tiles: Iterable[Tuple[int, int]],
+    letter_at: LetterAt,
+    values: bytes,
 ) -> int:
     """Compute score for the word covering *coords*.
 
@@ -233,116 +274,109 @@ def _score_word(
     word_multiplier = 1
     score = 0
     for r, c in coords:
-        letter = board[r][c]
-        letter_score = 0 if letter.islower() else LETTER_POINTS.get(letter.upper(), 0)
+        letter_score = values[ord(letter_at(r, c))]
         if (r, c) in new_set:
-            bonus = BONUS[r][c]
-            if bonus == "DL":
-                letter_score *= 2
-            elif bonus == "TL":
-                letter_score *= 3
-            elif bonus in {"DW", "CENTER"}:
-                word_multiplier *= 2
-            elif bonus == "TW":
-                word_multiplier *= 3
+            i = r * BOARD_SIZE + c
+            letter_score *= LETTER_MULT[i]
+            word_multiplier *= WORD_MULT[i]
         score += letter_score
     return score * word_multiplier
 
 
-def place_tiles(
-    placements: List[Tuple[int, int, str, bool]]
-) -> Tuple[int, List[Tuple[str, int]]]:
-    """Place tiles on the board according to *placements*.
+@dataclass
+class MoveResult:
+    """Outcome of :func:`validate_move`.
 
-    Each placement is (row, col, letter, blank).
-    Returns a tuple (total_score, [(word, score), ...]) or raises ValueError if the move is invalid."""
-    global first_move
+    ``words`` lists ``(word, score)`` with the main word first; ``code`` is a
+    short machine-readable reason when the move is invalid.
+    """
+
+    valid: bool
+    total: int = 0
+    words: List[Tuple[str, int]] = field(default_factory=list)
+    error: Optional[str] = None
+    code: Optional[str] = None
+
+
+def _invalid(code: str, error: str) -> MoveResult:
+    return MoveResult(valid=False, error=error, code=code)
+
+
+def validate_move(
+    placements: List[Tuple[int, int, str, bool]],
+    grid: Optional[List[List[Optional[str]]]] = None,
+    first: Optional[bool] = None,
+    lexicon: Optional[Lexicon] = None,
+) -> MoveResult:
+    """Check and score *placements* on *grid* without modifying anything.
+
+    *grid* and *first* default to the current :data:`board` and
+    :data:`first_move`.  Tentative tiles are kept aside, so any number of
+    validations can run at once on the same snapshot.  Words are checked and
+    scored with *lexicon*, the default one if None.
+    """
+    if grid is None:
+        grid = board
+    if first is None:
+        first = first_move
 
     if not placements:
-        raise ValueError("No tiles placed")
+        return _invalid("no_tiles", "No tiles placed")
 
     # ----- 1) Alignement sur une ligne ou une colonne -----
     rows = {r for r, _, _, _ in placements}
     cols = {c for _, c, _, _ in placements}
     if len(rows) != 1 and len(cols) != 1:
-        raise ValueError("Tiles must be in a single row or column")
+        return _invalid("not_aligned", "Tiles must be in a single row or column")
     horizontal = len(rows) == 1
 
-    # ----- 2) Vérif cases libres + poser temporairement -----
-    # (on pose pour pouvoir lire les mots ensuite)
-    # NB: on suppose que 'board', 'BOARD_SIZE' existent
-    used_positions = set()
+    # ----- 2) Vérif cases libres; les lettres posées restent à part -----
+    new: Dict[Tuple[int, int], str] = {}
     for r, c, letter, is_blank in placements:
         if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
-            raise ValueError("Placement out of board")
-        if board[r][c] is not None:
-            raise ValueError("Cell already occupied")
-        # on stocke la lettre posée (minuscule si joker)
-        board[r][c] = letter.lower() if is_blank else letter.upper()
-        used_positions.add((r, c))
+            return _invalid("out_of_board", "Placement out of board")
+        if grid[r][c] is not None or (r, c) in new:
+            return _invalid("occupied", "Cell already occupied")
+        # lettre posée en minuscule si joker
+        new[(r, c)] = letter.lower() if is_blank else letter.upper()
+
+    def letter_at(r: int, c: int) -> Optional[str]:
+        return new.get((r, c)) or grid[r][c]
 
     # ----- 3) Continuité (pas de trous) + connexion au plateau -----
-    # Continuité sur la ligne/colonne
     if horizontal:
         r = next(iter(rows))
         cmin = min(c for _, c, _, _ in placements)
         cmax = max(c for _, c, _, _ in placements)
-        # il faut qu'entre cmin..cmax, au moins les emplacements posés ou existants remplissent la chaîne
-        for c in range(cmin, cmax + 1):
-            if board[r][c] is None:
-                # trou -> invalide
-                # revert
-                for rr, cc in used_positions:
-                    board[rr][cc] = None
-                raise ValueError("Tiles must be contiguous")
+        if any(letter_at(r, c) is None for c in range(cmin, cmax + 1)):
+            return _invalid("not_contiguous", "Tiles must be contiguous")
     else:
         c = next(iter(cols))
         rmin = min(r for r, _, _, _ in placements)
         rmax = max(r for r, _, _, _ in placements)
-        for r in range(rmin, rmax + 1):
-            if board[r][c] is None:
-                for rr, cc in used_positions:
-                    board[rr][cc] = None
-                raise ValueError("Tiles must be contiguous")
-
-    # Connexion au plateau (hors premier coup)
-    if first_move:
-        if (7, 7) not in used_positions:
-            for rr, cc in used_positions:
-                board[rr][cc] = None
-            raise ValueError("First move must cover the center square")
-
-    else:
-        # au moins un voisin existant
-        connected = False
-        for r, c, _, _ in placements:
-            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-                rr, cc = r + dr, c + dc
-                if (
-                    0 <= rr < BOARD_SIZE
-                    and 0 <= cc < BOARD_SIZE
-                    and board[rr][cc] is not None
-                    and (rr, cc) not in used_positions
-                ):
-                    connected = True
-                    break
-            if connected:
-                break
-        if not connected:
-            for rr, cc in used_positions:
-                board[rr][cc] = None
-            raise ValueError("Move must connect to existing tiles")
+        if any(letter_at(r, c) is None for r in range(rmin, rmax + 1)):
+            return _invalid("not_contiguous", "Tiles must be contiguous")
+
+    if first:
+        if (7, 7) not in new:
+            return _invalid("center", "First move must cover the center square")
+    elif not any(
+        0 <= r + dr < BOARD_SIZE
+        and 0 <= c + dc < BOARD_SIZE
+        and grid[r + dr][c + dc] is not None
+        for r, c in new
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+    ):
+        return _invalid("not_connected", "Move must connect to existing tiles")
 
     # Ajuster l'orientation si une seule tuile est posée en fonction des voisins
     if len(placements) == 1:
         r0, c0, _ltr, _blk = placements[0]
-        horiz_neighbor = (
-            (c0 > 0 and board[r0][c0 - 1] is not None)
-            or (c0 + 1 < BOARD_SIZE and board[r0][c0 + 1] is not None)
+        horiz_neighbor = (c0 > 0 and grid[r0][c0 - 1] is not None) or (
+            c0 + 1 < BOARD_SIZE and grid[r0][c0 + 1] is not None
         )
-        vert_neighbor = (
-            (r0 > 0 and board[r0 - 1][c0] is not None)
-            or (r0 + 1 < BOARD_SIZE and board[r0 + 1][c0] is not None)
+        vert_neighbor = (r0 > 0 and grid[r0 - 1][c0] is not None) or (
+            r0 + 1 < BOARD_SIZE and grid[r0 + 1][c0] is not None
         )
         if vert_neighbor and not horiz_neighbor:
             horizontal = False
@@ -352,84 +386,126 @@ def place_tiles(
     # ----- 4) Déterminer le mot principal -----
     if horizontal:
         r = next(iter(rows))
-        # remonter à gauche
         c_start = min(c for _, c, _, _ in placements)
-        while c_start > 0 and board[r][c_start - 1] is not None:
+        while c_start > 0 and letter_at(r, c_start - 1) is not None:
             c_start -= 1
-        main_word, main_coords = _word_from_board(r, c_start, 0, 1)
+        main_word, main_coords = _word_from_board(r, c_start, 0, 1, letter_at)
     else:
         c = next(iter(cols))
         r_start = min(r for r, _, _, _ in placements)
-        while r_start > 0 and board[r_start - 1][c] is not None:
+        while r_start > 0 and letter_at(r_start - 1, c) is not None:
             r_start -= 1
-        main_word, main_coords = _word_from_board(r_start, c, 1, 0)
+        main_word, main_coords = _word_from_board(r_start, c, 1, 0, letter_at)
 
     # ----- 5) Valider le mot principal -----
-    if main_word.upper() not in DICTIONARY:
-        for rr, cc in used_positions:
-            board[rr][cc] = None
-        raise ValueError("Main word not in dictionary")
+    dictionary = _dictionary(lexicon)
+    if main_word.upper() not in dictionary:
+        return _invalid("main_word", "Main word not in dictionary")
 
     # ----- 6) Construire et valider tous les mots secondaires -----
-    # (le cœur du correctif : on vérifie les mots croisés formés par chaque tuile posée)
     cross_words: List[Tuple[str, List[Tuple[int, int]]]] = []
     for r, c, _, _ in placements:
         if horizontal:
             # le mot secondaire est vertical à cette colonne
-            rr = r
-            # si pas de voisin vertical => pas de mot secondaire
-            above = rr > 0 and board[rr - 1][c] is not None
-            below = rr + 1 < BOARD_SIZE and board[rr + 1][c] is not None
-            if not (above or below):
-                continue
-            # remonter
-            r0 = rr
-            while r0 > 0 and board[r0 - 1][c] is not None:
-                r0 -= 1
-            word, coords = _word_from_board(r0, c, 1, 0)
+            dr, dc = 1, 0
         else:
             # le mot secondaire est horizontal à cette ligne
-            cc = c
-            left = cc > 0 and board[r][cc - 1] is not None
-            right = cc + 1 < BOARD_SIZE and board[r][cc + 1] is not None
-            if not (left or right):
-                continue
-            c0 = cc
-            while c0 > 0 and board[r][c0 - 1] is not None:
-                c0 -= 1
-            word, coords = _word_from_board(r, c0, 0, 1)
-
-        # On ne garde que les "mots" de longueur >= 2
-        if len(coords) > 1:
-            if word.upper() not in DICTIONARY:
-                # revert et échec si un seul mot secondaire n'est pas valide
-                for rr, cc in used_positions:
-                    board[rr][cc] = None
-                raise ValueError(f"Invalid cross word: {word}")
-            cross_words.append((word.upper(), coords))
+            dr, dc = 0, 1
+        before = letter_at(r - dr, c - dc) if r - dr >= 0 and c - dc >= 0 else None
+        after = (
+            letter_at(r + dr, c + dc)
+            if r + dr < BOARD_SIZE and c + dc < BOARD_SIZE
+            else None
+        )
+        # si pas de voisin => pas de mot secondaire
+        if before is None and after is None:
+            continue
+        r0, c0 = r, c
+        while r0 - dr >= 0 and c0 - dc >= 0 and letter_at(r0 - dr, c0 - dc):
+            r0 -= dr
+            c0 -= dc
+        word, coords = _word_from_board(r0, c0, dr, dc, letter_at)
+        if word.upper() not in dictionary:
+            return _invalid("cross_word", f"Invalid cross word: {word}")
+        cross_words.append((word.upper(), coords))
 
     # ----- 7) Calcul du score : mot principal + tous les mots secondaires -----
-    main_score = _score_word(main_coords, used_positions)
+    values = LETTER_VALUES if lexicon is None else lexicon.values
+    main_score = _score_word(main_coords, new, letter_at, values)
     word_scores: List[Tuple[str, int]] = [(main_word.upper(), main_score)]
     total = main_score
     for word, coords in cross_words:
-        score = _score_word(coords, used_positions)
+        score = _score_word(coords, new, letter_at, values)
         total += score
         word_scores.append((word, score))
     # Bingo: 50 points si 7 tuiles posées en un seul coup
     if len(placements) == 7:
-        total += 50
-    # ----- 8) Fin de coup OK -----
-    # (ici tu peux conserver ton éventuel bonus de scrabble/bingo si tu l'avais ailleurs)
+        total += BINGO_BONUS
+    return MoveResult(valid=True, total=total, words=word_scores)
+
+
+def commit_move(placements: List[Tuple[int, int, str, bool]]) -> None:
+    """Write *placements*, already validated, to the board."""
+    global first_move
+    for r, c, letter, is_blank in placements:
+        board[r][c] = letter.lower() if is_blank else letter.upper()
     first_move = False
-    return total, word_scores
 
 
-def bot_turn(rack: List[str]) -> Optional[Tuple[List[Tuple[int, int, str, bool]], int]]:
+def place_tiles(
+    placements: List[Tuple[int, int, str, bool]], lexicon: Optional[Lexicon] = None
+) -> Tuple[int, List[Tuple[str, int]]]:
+    """Place tiles on the board according to *placements*.
+
+    Each placement is (row, col, letter, blank).
+    Returns a tuple (total_score, [(word, score), ...]) or raises ValueError if the move is invalid."""
+    result = validate_move(placements, lexicon=lexicon)
+    if not result.valid:
+        raise ValueError(result.error)
+    commit_move(placements)
+    return result.total, result.words
+
+
+def place_bot_tiles(placements: List[Tuple[int, int, str, bool]]) -> None:
+    """Put a move found by the bot on the board without re-validating it.
+
+    The bot only generates legal moves and scores them with the same tables
+    as :func:`place_tiles`, so its score is kept as is.  Only the squares are
+    checked here, against a board that may have changed since the bot ran.
+    Raises ValueError like :func:`place_tiles`.
+    """
+    if not placements:
+        raise ValueError("No tiles placed")
+    squares = {(r, c) for r, c, _, _ in placements}
+    for r, c in squares:
+        if not (0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE):
+            raise ValueError("Placement out of board")
+        if board[r][c] is not None:
+            raise ValueError("Cell already occupied")
+    if not first_move and not any(
+        0 <= r + dr < BOARD_SIZE
+        and 0 <= c + dc < BOARD_SIZE
+        and board[r + dr][c + dc] is not None
+        for r, c in squares
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+    ):
+        raise ValueError("Move must connect to existing tiles")
+    commit_move(placements)
+
+
+def bot_turn(
+    rack: List[str],
+    key: object = None,
+    opponents: int = 1,
+    lexicon: Optional[Lexicon] = None,
+) -> Optional[Tuple[List[Tuple[int, int, str, bool]], int]]:
     """Make a move for the bot.
 
     Args:
         rack: List of letters in the bot's rack
+        key: Game identifier passed to :func:`speculate_bot_turn`, if any
+        opponents: Number of other players in the game
+        lexicon: Lexicon of the game, the default one if None
 
     Returns:
         Tuple of (placements, score) where:
@@ -440,12 +516,94 @@ def bot_turn(rack: List[str]) -> Optional[Tuple[List[Tuple[int, int, str, bool]]
     try:
         from . import bot as bot_module
 
-        return bot_module.bot_turn(board, rack)
+        endgame = _endgame_turn(rack, opponents, lexicon)
+        if endgame is not None:
+            return endgame
+        return bot_module.bot_turn(board, rack, key, lexicon)
     except Exception as e:
         print(f"Error in bot_turn: {e}")
         return None
 
 
+def hint_moves(
+    grid: List[List[Optional[str]]],
+    rack: List[str],
+    n: int,
+    time_budget: Optional[float] = None,
+    lexicon: Optional[Lexicon] = None,
+) -> List[Tuple[List[Tuple[int, int, str, bool]], str, int]]:
+    """Return the *n* best scoring ``(placements, word, score)`` for *rack*."""
+    from . import bot as bot_module
+
+    if time_budget is None:
+        return bot_module.hint_moves(grid, rack, n, lexicon=lexicon)
+    return bot_module.hint_moves(grid, rack, n, time_budget, lexicon)
+
+
+def _endgame_turn(
+    rack: List[str], opponents: int, lexicon: Optional[Lexicon] = None
+) -> Optional[Tuple[List[Tuple[int, int, str, bool]], int]]:
+    """Solve the endgame exactly once the bag is empty, else return None.
+
+    The solver assumes the unseen tiles are the rack of the one opponent, so
+    games with more players keep the regular bot.
+    """
+    if bag or opponents != 1:
+        return None
+    unseen = unseen_tiles(rack, lexicon)
+    if not unseen or len(unseen) > 7:
+        return None
+    from . import endgame
+
+    return endgame.solve_turn([row[:] for row in board], rack, unseen, lexicon)
+
+
+def unseen_tiles(rack: Iterable[str], lexicon: Optional[Lexicon] = None) -> List[str]:
+    """Tiles neither on the board nor in *rack*: the bag plus the other racks."""
+    counts = {ltr: count for ltr, (count, _) in _distribution(lexicon).items()}
+    for row in board:
+        for letter in row:
+            if letter is not None:
+                counts["?" if letter.islower() else letter] -= 1
+    for letter in rack:
+        counts[letter.upper()] -= 1
+    return [ltr for ltr, count in counts.items() for _ in range(max(count, 0))]
+
+
+def hard_bot_turn(
+    rack: List[str], opponents: int = 1, lexicon: Optional[Lexicon] = None
+) -> Optional[Tuple[List[Tuple[int, int, str, bool]], int]]:
+    """Make a move for the bot by simulating the opponent's replies.
+
+    Same contract as :func:`bot_turn`; used for the ``hard`` difficulty.
+    """
+    try:
+        from . import simulation
+
+        endgame = _endgame_turn(rack, opponents, lexicon)
+        if endgame is not None:
+            return endgame
+        snapshot = [row[:] for row in board]
+        unseen = unseen_tiles(rack, lexicon)
+        return simulation.simulate_turn(snapshot, rack, unseen, lexicon=lexicon)
+    except Exception as e:
+        print(f"Error in hard_bot_turn: {e}")
+        return None
+
+
+def speculate_bot_turn(key: object, lexicon: Optional[Lexicon] = None) -> None:
+    """Start precomputing the bot's move tables for the current board.
+
+    Runs in the background while the human thinks; *key* identifies the game.
+    """
+    try:
+        from . import bot as bot_module
+
+        bot_module.speculate(key, board, lexicon)
+    except Exception as e:
+        print(f"Error in speculate_bot_turn: {e}")
+
+
 def generate_valid_moves(board, rack, dictionary):
     """Generate all valid moves for the given rack and board state.
 
@@ -0,0 +1,202 @@
+"""Rack leave values for the equity-based bot.
+
+The bot ranks moves by ``score + leave value`` where the leave value estimates
+what the tiles kept on the rack are worth for the following turns.  Values are
+read in O(1) from a table keyed by the sorted leave, built offline through
+self-play::
+
+    python -m backend.leaves --games 200 --output backend/leaves.json
+
+No table ships with the repository, as it must be built with the word list
+played.  Self-play only records the leaves seen at least ``--min-count``
+times, so a table covers the single tiles and the common multisets but not
+every leave of up to :data:`MAX_LEAVE` tiles.  A missing leave is valued tile
+by tile: with the table's single-tile values where it has them, else with
+:data:`TILE_VALUES`, less a penalty for duplicates.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import zlib
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+LEAVES_PATH = Path(os.getenv("BOT_LEAVES", Path(__file__).with_name("leaves.json")))
+
+MAX_LEAVE = 6
+
+# Rough worth of keeping each tile of the French bag, used for leaves absent
+# from the table.  S, E and the blanks combine well; the ten-point letters and
+# the tiles with few short words are worth playing away.
+TILE_VALUES: Dict[str, float] = {
+    "?": 25.0,
+    "S": 8.0,
+    "E": 3.0,
+    "R": 1.5,
+    "A": 1.0,
+    "I": 0.5,
+    "L": 0.5,
+    "N": 0.5,
+    "T": 0.5,
+    "O": 0.0,
+    "C": 0.0,
+    "M": 0.0,
+    "U": -0.5,
+    "D": -0.5,
+    "P": -0.5,
+    "X": -1.0,
+    "Z": -1.5,
+    "G": -2.0,
+    "B": -2.0,
+    "F": -2.0,
+    "H": -2.0,
+    "Q": -3.0,
+    "J": -3.0,
+    "V": -3.5,
+    "Y": -4.0,
+    "K": -6.0,
+    "W": -7.0,
+}
+DUPLICATE_PENALTY = 2.0
+
+
+def heuristic_value(leave: str, tiles: Dict[str, float] = TILE_VALUES) -> float:
+    """Per-tile estimate from *tiles* with a penalty for duplicated letters."""
+    counts = Counter(leave)
+    value = sum(tiles.get(ch, 0.0) * n for ch, n in counts.items())
+    value -= DUPLICATE_PENALTY * sum(n - 1 for ch, n in counts.items() if ch != "?")
+    return value
+
+
+class LeaveTable:
+    """Leave values keyed by the sorted letters kept on the rack.
+
+    Leaves missing from *values* are valued per tile, preferring the
+    single-tile values of the table to :data:`TILE_VALUES`.
+    """
+
+    __slots__ = ("values", "fingerprint", "tiles")
+
+    def __init__(self, values: Dict[str, float], fingerprint: str = "heuristic"):
+        self.values = values
+        self.fingerprint = fingerprint
+        self.tiles = {**TILE_VALUES}
+        self.tiles.update((k, v) for k, v in values.items() if len(k) == 1)
+
+    def value(self, leave: str) -> float:
+        v = self.values.get(leave)
+        if v is None:
+            if not leave:
+                return 0.0
+            v = heuristic_value(leave, self.tiles)
+        return v
+
+    @classmethod
+    def load(cls, path: Path) -> "LeaveTable":
+        try:
+            raw = Path(path).read_bytes()
+        except OSError:
+            return cls({})
+        return cls(json.loads(raw), f"table:{zlib.crc32(raw):08x}")
+
+
+_default: Optional[LeaveTable] = None
+
+
+def default_table() -> LeaveTable:
+    """Return the table at :data:`LEAVES_PATH`, loaded once."""
+    global _default
+    if _default is None:
+        _default = LeaveTable.load(LEAVES_PATH)
+    return _default
+
+
+# ---------------------------------------------------------------------------
+# Offline self-play
+# ---------------------------------------------------------------------------
+
+
+def self_play(
+    games: int, seed: Optional[int] = None, min_count: int = 5
+) -> Dict[str, float]:
+    """Play *games* bot-versus-bot games and derive leave values.
+
+    A leave is worth the average score of the next turn played from it, minus
+    the average score of all turns.  Leaves seen fewer than *min_count* times
+    are dropped, except single tiles, which value the missing leaves.
+    """
+    from . import bot, game
+
+    rng = random.Random(seed)
+    trie = bot.get_trie()
+    table = default_table()
+    totals: Dict[str, float] = defaultdict(float)
+    counts: Dict[str, int] = defaultdict(int)
+    all_scores: List[int] = []
+
+    for _ in range(games):
+        board = bot.Board()
+        board.attach(trie)
+        bag = [
+            ltr for ltr, (n, _) in game.LETTER_DISTRIBUTION.items() for _ in range(n)
+        ]
+        rng.shuffle(bag)
+        racks = [Counter(bag[:7]), Counter(bag[7:14])]
+        del bag[:14]
+        pending: List[Optional[str]] = [None, None]
+        passes = 0
+        player = 0
+        while passes < 2:
+            rack = racks[player]
+            mv = bot.best_move(board, dict(rack), trie, leaves=table)
+            if mv is None:
+                passes += 1
+                player = 1 - player
+                continue
+            passes = 0
+            if pending[player] is not None:
+                totals[pending[player]] += mv.score
+                counts[pending[player]] += 1
+            all_scores.append(mv.score)
+            board.apply(mv.letters)
+            for _r, _c, ch, is_blank in mv.letters:
+                rack["?" if is_blank else ch] -= 1
+            leave = bot.rack_key(rack)
+            pending[player] = leave if 0 < len(leave) <= MAX_LEAVE else None
+            need = 7 - sum(rack.values())
+            for ch in bag[:need]:
+                rack[ch] += 1
+            del bag[:need]
+            if not bag and not sum(rack.values()):
+                break
+            player = 1 - player
+
+    mean = sum(all_scores) / len(all_scores) if all_scores else 0.0
+    return {
+        leave: round(totals[leave] / n - mean, 2)
+        for leave, n in counts.items()
+        if n >= min_count or len(leave) == 1
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the bot's leave table.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--min-count", type=int, default=5)
+    parser.add_argument("--output", default=str(LEAVES_PATH))
+    args = parser.parse_args(argv)
+
+    values = self_play(args.games, args.seed, args.min_count)
+    with open(args.output, "w") as fh:
+        json.dump(values, fh, separators=(",", ":"), sort_keys=True)
+    print(f"Wrote {len(values)} leave values to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,630 @@
+"""Named lexicons and the indexes over their word lists.
+
+A :class:`Lexicon` pairs a word list with the tiles it is played with.  Games
+pick one by name from :data:`REGISTRY` when they are created; word lists are
+read on first use and shared by every game, and each index over them is built
+once per lexicon.  Until the list is read, a :class:`BloomFilter` compiled
+next to it (see :mod:`backend.bloom`) answers lookups of non-words.
+
+Extra lexicons are registered from ``LEXICONS``, a comma separated list of
+``name=path:distribution`` entries, e.g. ``twl06=/data/twl06.txt:english``.
+Versions loaded by :func:`reload` are recorded in :data:`MANIFEST_PATH`;
+:func:`get_lexicon` looks them up there when they are not in memory, so games
+keep their version across restarts and reloads made by other processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from itertools import combinations_with_replacement, product
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+MAX_BLANKS = 2
+WILDCARDS = ".?"
+
+T = TypeVar("T")
+
+# Each entry: letter -> (count, points)
+FRENCH_DISTRIBUTION: Dict[str, Tuple[int, int]] = {
+    "A": (9, 1),
+    "B": (2, 3),
+    "C": (2, 3),
+    "D": (3, 2),
+    "E": (15, 1),
+    "F": (2, 4),
+    "G": (2, 2),
+    "H": (2, 4),
+    "I": (8, 1),
+    "J": (1, 8),
+    "K": (1, 10),
+    "L": (5, 1),
+    "M": (3, 2),
+    "N": (6, 1),
+    "O": (6, 1),
+    "P": (2, 3),
+    "Q": (1, 8),
+    "R": (6, 1),
+    "S": (6, 1),
+    "T": (6, 1),
+    "U": (6, 1),
+    "V": (2, 4),
+    "W": (1, 10),
+    "X": (1, 10),
+    "Y": (1, 10),
+    "Z": (1, 10),
+    "?": (2, 0),  # Jokers
+}
+
+ENGLISH_DISTRIBUTION: Dict[str, Tuple[int, int]] = {
+    "A": (9, 1),
+    "B": (2, 3),
+    "C": (2, 3),
+    "D": (4, 2),
+    "E": (12, 1),
+    "F": (2, 4),
+    "G": (3, 2),
+    "H": (2, 4),
+    "I": (9, 1),
+    "J": (1, 8),
+    "K": (1, 5),
+    "L": (4, 1),
+    "M": (2, 3),
+    "N": (6, 1),
+    "O": (8, 1),
+    "P": (2, 3),
+    "Q": (1, 10),
+    "R": (6, 1),
+    "S": (4, 1),
+    "T": (6, 1),
+    "U": (4, 1),
+    "V": (2, 4),
+    "W": (2, 4),
+    "X": (1, 8),
+    "Y": (2, 4),
+    "Z": (1, 10),
+    "?": (2, 0),
+}
+
+DISTRIBUTIONS = {"french": FRENCH_DISTRIBUTION, "english": ENGLISH_DISTRIBUTION}
+
+
+def signature(word: str) -> str:
+    """Letters of *word* in sorted order, shared by all its anagrams."""
+    return "".join(sorted(word))
+
+
+class AnagramIndex:
+    """Words grouped by their sorted letters."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.groups: Dict[str, List[str]] = {}
+        for w in words:
+            w = w.upper()
+            self.groups.setdefault(signature(w), []).append(w)
+        for group in self.groups.values():
+            group.sort()
+
+    def anagrams(self, letters: str) -> List[str]:
+        """Words using exactly *letters*, ``?`` standing for any letter."""
+        letters = letters.upper()
+        blanks = letters.count("?")
+        if blanks > MAX_BLANKS:
+            raise ValueError(f"At most {MAX_BLANKS} blanks are supported")
+        fixed = letters.replace("?", "")
+        found: Set[str] = set()
+        for extra in combinations_with_replacement(ALPHABET, blanks):
+            found.update(self.groups.get(signature(fixed + "".join(extra)), ()))
+        return sorted(found)
+
+    def words_from(self, rack: str, min_len: int = 2) -> List[str]:
+        """Every word that can be made from some of the tiles on *rack*.
+
+        Each distinct sub-multiset of the fixed letters is looked up with
+        every letter choice for up to as many blanks as the rack holds.
+        Results are sorted longest first.
+        """
+        rack = rack.upper()
+        blanks = rack.count("?")
+        if blanks > MAX_BLANKS:
+            raise ValueError(f"At most {MAX_BLANKS} blanks are supported")
+        counts = sorted(Counter(rack.replace("?", "")).items())
+        fillers = [
+            "".join(extra)
+            for n in range(blanks + 1)
+            for extra in combinations_with_replacement(ALPHABET, n)
+        ]
+        found: Set[str] = set()
+        seen: Set[str] = set()
+        for picks in product(*(range(n + 1) for _ch, n in counts)):
+            part = "".join(ch * k for (ch, _n), k in zip(counts, picks))
+            for extra in fillers:
+                if len(part) + len(extra) < min_len:
+                    continue
+                key = signature(part + extra)
+                if key in seen:
+                    continue
+                seen.add(key)
+                found.update(self.groups.get(key, ()))
+        return sorted(found, key=lambda w: (-len(w), w))
+
+
+def _bitset(indexes: List[int], size: int) -> int:
+    """Pack sorted word *indexes* into an int with those bits set."""
+    buf = bytearray((size + 7) // 8)
+    for i in indexes:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+class PatternIndex:
+    """Per-length, per-position letter bitsets over the word list.
+
+    Bit *i* of ``positions[n][p][ch]`` is set when the *i*-th word of length
+    *n* has *ch* at position *p*, so a pattern is answered by AND-ing one int
+    per fixed letter.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        by_length: Dict[int, List[str]] = {}
+        for w in words:
+            by_length.setdefault(len(w), []).append(w.upper())
+        self.words: Dict[int, List[str]] = {}
+        self.positions: Dict[int, List[Dict[str, int]]] = {}
+        self.contains: Dict[int, Dict[str, int]] = {}
+        for n, group in by_length.items():
+            group.sort()
+            at: List[Dict[str, List[int]]] = [{} for _ in range(n)]
+            has: Dict[str, List[int]] = {}
+            for i, w in enumerate(group):
+                for p, ch in enumerate(w):
+                    at[p].setdefault(ch, []).append(i)
+                for ch in set(w):
+                    has.setdefault(ch, []).append(i)
+            size = len(group)
+            self.words[n] = group
+            self.positions[n] = [
+                {ch: _bitset(ix, size) for ch, ix in pos.items()} for pos in at
+            ]
+            self.contains[n] = {ch: _bitset(ix, size) for ch, ix in has.items()}
+
+    def _match(self, n: int, pattern: Optional[str], contains: str) -> int:
+        bits = (1 << len(self.words[n])) - 1
+        if pattern is not None:
+            for p, ch in enumerate(pattern):
+                if ch not in WILDCARDS:
+                    bits &= self.positions[n][p].get(ch, 0)
+        for ch in set(contains):
+            bits &= self.contains[n].get(ch, 0)
+        return bits
+
+    def search(
+        self,
+        pattern: Optional[str] = None,
+        contains: str = "",
+        length: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[int, List[str]]:
+        """Return the number of matches and the first *limit* of them.
+
+        *pattern* fixes letters by position, ``.`` or ``?`` matching any
+        letter, and also fixes the length.  Every letter of *contains* must
+        appear in the word, as many times as it is repeated.
+        """
+        contains = contains.upper()
+        if pattern is not None:
+            pattern = pattern.upper()
+            if length is not None and length != len(pattern):
+                return 0, []
+            lengths = [len(pattern)]
+        elif length is not None:
+            lengths = [length]
+        else:
+            lengths = sorted(self.words)
+        repeated = [(ch, k) for ch, k in Counter(contains).items() if k > 1]
+        count = 0
+        found: List[str] = []
+        for n in lengths:
+            if n not in self.words:
+                continue
+            bits = self._match(n, pattern, contains)
+            if not bits:
+                continue
+            if not repeated:
+                count += bits.bit_count()
+                if limit is not None and len(found) >= limit:
+                    continue
+            group = self.words[n]
+            # Reversed binary digits: character i is bit i.
+            digits = bin(bits)[:1:-1]
+            i = digits.find("1")
+            while i != -1:
+                w = group[i]
+                if not repeated or all(w.count(ch) >= k for ch, k in repeated):
+                    if repeated:
+                        count += 1
+                    if limit is None or len(found) < limit:
+                        found.append(w)
+                    elif not repeated:
+                        break
+                i = digits.find("1", i + 1)
+        return count, found
+
+
+BLOOM_BITS_PER_WORD = 10
+# Magic, hashes, size in bits, then the size and mtime of the word list.
+_BLOOM_HEADER = struct.Struct("<4sIQQQ")
+_BLOOM_MAGIC = b"BLM1"
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Approximate set of words: a miss is never a word, a hit may be one.
+
+    About 1% of non-words hit with :data:`BLOOM_BITS_PER_WORD` bits per word.
+    """
+
+    def __init__(
+        self, words: Iterable[str] = (), bits_per_word: int = BLOOM_BITS_PER_WORD
+    ) -> None:
+        words = list(words)
+        self.size = max(64, len(words) * bits_per_word)
+        self.hashes = max(1, round(bits_per_word * math.log(2)))
+        bits = bytearray((self.size + 7) // 8)
+        for w in words:
+            h1, h2 = self._hash(w)
+            for i in range(self.hashes):
+                pos = (h1 + i * h2) % self.size
+                bits[pos >> 3] |= 1 << (pos & 7)
+        self.bits: Any = bits
+
+    @staticmethod
+    def _hash(word: str) -> Tuple[int, int]:
+        digest = hashlib.blake2b(word.encode(), digest_size=16).digest()
+        h = int.from_bytes(digest, "little")
+        return h & _MASK64, h >> 64 | 1
+
+    def __contains__(self, word: str) -> bool:
+        h1, h2 = self._hash(word)
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % size
+            if not bits[pos >> 3] >> (pos & 7) & 1:
+                return False
+        return True
+
+    def save(self, path: Path, source: Path) -> None:
+        """Write the filter for the word list at *source* to *path*."""
+        st = os.stat(source)
+        header = _BLOOM_HEADER.pack(
+            _BLOOM_MAGIC, self.hashes, self.size, st.st_size, st.st_mtime_ns
+        )
+        with open(path, "wb") as fh:
+            fh.write(header)
+            fh.write(self.bits)
+
+    @classmethod
+    def load(cls, path: Path, source: Path) -> Optional["BloomFilter"]:
+        """Map the filter at *path*, or ``None`` if missing or out of date.
+
+        The filter is stale once *source* changes size or modification time.
+        """
+        try:
+            with open(path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            st = os.stat(source)
+        except (OSError, ValueError):
+            return None
+        if len(mm) < _BLOOM_HEADER.size:
+            return None
+        magic, hashes, size, src_size, src_mtime = _BLOOM_HEADER.unpack_from(mm)
+        if (
+            magic != _BLOOM_MAGIC
+            or (src_size, src_mtime) != (st.st_size, st.st_mtime_ns)
+            or len(mm) != _BLOOM_HEADER.size + (size + 7) // 8
+        ):
+            return None
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.hashes = size, hashes
+        bloom.bits = memoryview(mm)[_BLOOM_HEADER.size :]
+        return bloom
+
+
+class Lexicon:
+    """A word list with the tile distribution and letter values it uses."""
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[Path] = None,
+        distribution: Dict[str, Tuple[int, int]] = FRENCH_DISTRIBUTION,
+        words: Optional[Set[str]] = None,
+        version: int = 1,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.version = version
+        self.distribution = distribution
+        self.points = {ltr: pts for ltr, (_, pts) in distribution.items()}
+        # Letter values by code point; lowercase letters are blanks and score 0.
+        self.values = bytes(self.points.get(chr(i), 0) for i in range(128))
+        self._words = words if words is not None or path is not None else set()
+        self._indexes: Dict[type, Any] = {}
+        self._lock = threading.RLock()
+        self.load_seconds: Optional[float] = None
+        self._digest: Optional[str] = None
+        self._bloom: Optional[BloomFilter] = None
+        self._bloom_checked = False
+
+    @property
+    def key(self) -> str:
+        """Name and version, as stored on the games that use this lexicon."""
+        return f"{self.name}@{self.version}"
+
+    @property
+    def loaded(self) -> bool:
+        return self._words is not None
+
+    @property
+    def words(self) -> Set[str]:
+        """The word list, read from :attr:`path` on first access."""
+        if self._words is None:
+            with self._lock:
+                if self._words is None:
+                    assert self.path is not None
+                    start = time.perf_counter()
+                    data = Path(self.path).read_bytes()
+                    self._digest = hashlib.sha256(data).hexdigest()
+                    words = {w.strip().upper() for w in data.decode().splitlines()}
+                    words.discard("")
+                    self._words = words
+                    self.load_seconds = time.perf_counter() - start
+        return self._words
+
+    @property
+    def digest(self) -> Optional[str]:
+        """SHA-256 of the word list file, as read if it already was."""
+        if self._digest is None and self.path is not None:
+            return file_digest(self.path)
+        return self._digest
+
+    @property
+    def bloom_path(self) -> Optional[Path]:
+        return Path(self.path).with_suffix(".bloom") if self.path else None
+
+    @property
+    def bloom(self) -> Optional[BloomFilter]:
+        """The filter compiled next to the word list, if up to date."""
+        if not self._bloom_checked:
+            with self._lock:
+                if not self._bloom_checked and self.bloom_path is not None:
+                    self._bloom = BloomFilter.load(self.bloom_path, self.path)
+                self._bloom_checked = True
+        return self._bloom
+
+    def __contains__(self, word: str) -> bool:
+        """Whether *word*, in uppercase, is in the list.
+
+        Before the list is read, words missing from :attr:`bloom` are
+        rejected without reading it.
+        """
+        if self._words is None:
+            bloom = self.bloom
+            if bloom is not None and word not in bloom:
+                return False
+        return word in self.words
+
+    def words_bytes(self) -> int:
+        """Approximate memory held by the word list."""
+        words = self.words
+        return sys.getsizeof(words) + sum(sys.getsizeof(w) for w in words)
+
+    def index(self, cls: Type[T]) -> T:
+        """Return the *cls* index over :attr:`words`, built once."""
+        with self._lock:
+            if cls not in self._indexes:
+                self._indexes[cls] = cls(self.words)
+            return self._indexes[cls]
+
+
+def file_digest(path: Path) -> Optional[str]:
+    """SHA-256 of the file at *path*, or ``None`` if it cannot be read."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+DEFAULT_LEXICON = os.getenv("DEFAULT_LEXICON", "ods8")
+
+REGISTRY: Dict[str, Lexicon] = {
+    "ods8": Lexicon("ods8", Path(__file__).with_name("ods8.txt"), FRENCH_DISTRIBUTION),
+}
+
+
+# Versions replaced by :func:`reload`, kept for the games still using them.
+RETIRED: Dict[str, Lexicon] = {}
+_reload_lock = threading.RLock()
+
+# Lexicon name -> version -> {"path", "sha256"} of every reloaded version.
+MANIFEST_PATH = Path(
+    os.getenv("LEXICON_MANIFEST", Path(__file__).with_name("lexicons.json"))
+)
+
+
+def register(lexicon: Lexicon) -> None:
+    REGISTRY[lexicon.name] = lexicon
+
+
+def get_lexicon(name: str = DEFAULT_LEXICON) -> Lexicon:
+    """Return the lexicon for *name*, raising ``ValueError`` if unknown.
+
+    A bare name gives the current version; ``name@version`` gives that
+    version, current or retired.  Versions recorded in the manifest are
+    loaded on demand, unless their file has changed since.
+    """
+    base, _, version = name.partition("@")
+    _sync(base)
+    lexicon = REGISTRY.get(base)
+    if lexicon is not None and (not version or version == str(lexicon.version)):
+        return lexicon
+    if name in RETIRED:
+        return RETIRED[name]
+    if lexicon is not None and version.isdigit():
+        recorded = _recorded(lexicon, int(version))
+        if recorded is not None:
+            with _reload_lock:
+                return RETIRED.setdefault(name, recorded)
+    raise ValueError(f"Unknown lexicon: {name}")
+
+
+def reload(
+    name: str,
+    path: Optional[Path] = None,
+    warm: Optional[Callable[[Lexicon], None]] = None,
+) -> Lexicon:
+    """Load a new version of lexicon *name* and make it current.
+
+    The word list is read, and *warm* run on it, before the swap, so games
+    created afterwards start on a fully built lexicon; games created before
+    keep the version they recorded.  Raises ``ValueError`` if the file holds
+    the same words as the current version.
+    """
+    with _reload_lock:
+        old = get_lexicon(name)
+        # Pin the old version's words before its file is read as the new one,
+        # in case it was edited in place.
+        old.words
+        new = Lexicon(
+            name,
+            Path(path) if path is not None else old.path,
+            old.distribution,
+            version=old.version + 1,
+        )
+        new.words
+        if old.digest is not None and new.digest == old.digest:
+            raise ValueError(f"{new.path} is unchanged since {old.key}")
+        if warm is not None:
+            warm(new)
+        manifest = _read_manifest()
+        versions = manifest.setdefault(name, {})
+        for lex in (old, new):
+            if lex.path is not None:
+                versions.setdefault(
+                    str(lex.version),
+                    {"path": str(Path(lex.path).resolve()), "sha256": lex.digest},
+                )
+        _write_manifest(manifest)
+        RETIRED[old.key] = old
+        REGISTRY[name] = new
+    return new
+
+
+def _read_manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp, MANIFEST_PATH)
+
+
+def _manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """The manifest, read again only once its file changes."""
+    global _manifest_cache
+    try:
+        st = MANIFEST_PATH.stat()
+    except OSError:
+        return {}
+    stamp = (str(MANIFEST_PATH), st.st_mtime_ns, st.st_size)
+    if _manifest_cache[0] != stamp:
+        _manifest_cache = (stamp, _read_manifest())
+    return _manifest_cache[1]
+
+
+_manifest_cache: Tuple[Any, Dict[str, Dict[str, Dict[str, Any]]]] = (None, {})
+
+
+def _recorded(current: Lexicon, version: int) -> Optional[Lexicon]:
+    """Version *version* of *current*'s lexicon as recorded, if its file is intact."""
+    entry = _manifest().get(current.name, {}).get(str(version))
+    if entry is None or file_digest(Path(entry["path"])) != entry["sha256"]:
+        return None
+    return Lexicon(
+        current.name, Path(entry["path"]), current.distribution, version=version
+    )
+
+
+def _sync(name: str) -> None:
+    """Make the latest version of *name* in the manifest current.
+
+    Only a loaded version is kept in :data:`RETIRED`, since its file may have
+    been edited in place; the others are looked up in the manifest again.
+    When the latest file has changed since, the registered one becomes a new
+    version.
+    """
+    versions = _manifest().get(name)
+    current = REGISTRY.get(name)
+    if not versions or current is None:
+        return
+    latest = max(map(int, versions))
+    if current.version >= latest:
+        return
+    with _reload_lock:
+        current = REGISTRY[name]
+        if current.version >= latest:
+            return
+        new = _recorded(current, latest)
+        if new is None:
+            new = Lexicon(name, current.path, current.distribution, version=latest + 1)
+            if new.path is not None:
+                manifest = _read_manifest()
+                manifest.setdefault(name, {})[str(new.version)] = {
+                    "path": str(Path(new.path).resolve()),
+                    "sha256": new.digest,
+                }
+                _write_manifest(manifest)
+        if current.loaded:
+            RETIRED[current.key] = current
+        REGISTRY[name] = new
+
+
+for _entry in filter(None, os.getenv("LEXICONS", "").split(",")):
+    _name, _, _spec = _entry.partition("=")
+    _path, _, _dist = _spec.rpartition(":")
+    register(Lexicon(_name.strip(), Path(_path), DISTRIBUTIONS[_dist.strip()]))
+
+
+def anagram_index(name: str = DEFAULT_LEXICON) -> AnagramIndex:
+    """Return the :class:`AnagramIndex` of lexicon *name*."""
+    return get_lexicon(name).index(AnagramIndex)
+
+
+def pattern_index(name: str = DEFAULT_LEXICON) -> PatternIndex:
+    """Return the :class:`PatternIndex` of lexicon *name*."""
+    return get_lexicon(name).index(PatternIndex)
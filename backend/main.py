@@ -55,9 +55,12 @@ uploads_dir.mkdir(parents=True, exist_ok=True)
 app.mount("/uploads", StaticFiles(directory=uploads_dir), name="uploads")
 
 # 4) Importer les routers APRÈS le chargement du .env et les middlewares
-from .api import auth, deletion, games, health  # noqa: E402
+from .api import analysis, auth, deletion, games, health, lexicons, words  # noqa: E402
 
 app.include_router(health.router)
 app.include_router(auth.router)
 app.include_router(games.router)
 app.include_router(deletion.router)
+app.include_router(analysis.router)
+app.include_router(words.router)
+app.include_router(lexicons.router)
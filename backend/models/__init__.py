@@ -1,5 +1,5 @@
 from .base import Base, TimestampMixin
-from .game import Game, GamePlayer, PlacedTile, Word
+from .game import Game, GamePlayer, MoveAnalysis, PlacedTile, Turn, Word
 from .refreshToken import RefreshToken
 from .user import OAuthAccount, User
 from .deletion import DeletionRequest, PrivacyAuditLog
@@ -13,6 +13,8 @@ __all__ = [
     "GamePlayer",
     "PlacedTile",
     "Word",
+    "Turn",
+    "MoveAnalysis",
     "RefreshToken",
     "DeletionRequest",
     "PrivacyAuditLog",
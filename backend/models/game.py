@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import CheckConstraint, ForeignKey, String
+from sqlalchemy import JSON, CheckConstraint, Float, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -24,6 +24,8 @@ class Game(Base):
     phase: Mapped[str] = mapped_column(
         String, default="waiting_players", nullable=False
     )
+    bot_level: Mapped[str] = mapped_column(String, default="normal", nullable=False)
+    lexicon: Mapped[str] = mapped_column(String, default="ods8", nullable=False)
 
     __table_args__ = (
         CheckConstraint("max_players >= 2 AND max_players <= 4", name="ck_max_players"),
@@ -66,9 +68,11 @@ class PlacedTile(Base):
     x: Mapped[int] = mapped_column(nullable=False)
     y: Mapped[int] = mapped_column(nullable=False)
     letter: Mapped[str] = mapped_column(String(1), nullable=False)
+    turn_id: Mapped[int | None] = mapped_column(ForeignKey("turns.id"), nullable=True)
 
     game: Mapped["Game"] = relationship("Game", back_populates="tiles")
     player: Mapped["GamePlayer"] = relationship("GamePlayer")
+    turn: Mapped["Turn | None"] = relationship("Turn", back_populates="tiles")
 
 
 class Word(Base):
@@ -84,3 +88,43 @@ class Word(Base):
 
     game: Mapped["Game"] = relationship("Game", back_populates="words")
     player: Mapped["GamePlayer"] = relationship("GamePlayer")
+
+
+class Turn(Base):
+    """A move that placed tiles, with the rack it was played from."""
+
+    __tablename__ = "turns"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    game_id: Mapped[int] = mapped_column(ForeignKey("games.id"), nullable=False)
+    player_id: Mapped[int] = mapped_column(
+        ForeignKey("game_players.id"), nullable=False
+    )
+    number: Mapped[int] = mapped_column(nullable=False)
+    rack: Mapped[str] = mapped_column(String, nullable=False)
+    score: Mapped[int] = mapped_column(nullable=False)
+
+    tiles: Mapped[List["PlacedTile"]] = relationship(
+        "PlacedTile", back_populates="turn"
+    )
+    analysis: Mapped["MoveAnalysis | None"] = relationship(
+        "MoveAnalysis", back_populates="turn", uselist=False
+    )
+
+
+class MoveAnalysis(Base):
+    """Best move that was available on a turn and the equity given up."""
+
+    __tablename__ = "move_analyses"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    turn_id: Mapped[int] = mapped_column(
+        ForeignKey("turns.id"), unique=True, nullable=False
+    )
+    best_word: Mapped[str | None] = mapped_column(String, nullable=True)
+    best_score: Mapped[int] = mapped_column(nullable=False)
+    # [[row, col, letter, blank], ...]
+    best_tiles: Mapped[list] = mapped_column(JSON, nullable=False)
+    equity_lost: Mapped[float] = mapped_column(Float, nullable=False)
+
+    turn: Mapped["Turn"] = relationship("Turn", back_populates="analysis")
@@ -0,0 +1,63 @@
+"""Build the bot's opening book.
+
+The book maps a sorted rack to the best first move on the empty board and is
+looked up by :func:`backend.bot.bot_turn` before any move generation::
+
+    python -m backend.opening_book --sample 20000 --output backend/opening_book.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from . import bot, game
+
+
+def sample_racks(n: int, seed: Optional[int] = None) -> Set[str]:
+    """Draw *n* opening racks from a full bag and return their sorted keys."""
+    rng = random.Random(seed)
+    bag: List[str] = []
+    for letter, (count, _) in game.LETTER_DISTRIBUTION.items():
+        bag.extend([letter] * count)
+    return {"".join(sorted(rng.sample(bag, 7))) for _ in range(n)}
+
+
+def build(racks: Iterable[str]) -> Dict[str, object]:
+    """Return the book for *racks* against the current dictionary."""
+    trie = bot.get_trie()
+    board = bot.Board()
+    moves: Dict[str, object] = {}
+    for rack in racks:
+        key = bot.rack_key(Counter(rack.upper()))
+        if key in moves:
+            continue
+        mv = bot.best_move(board, dict(Counter(key)), trie)
+        moves[key] = ([list(p) for p in mv.letters], mv.score) if mv else ([], 0)
+    return {"dictionary": bot.engine_fingerprint(), "moves": moves}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--racks", help="file with one rack per line")
+    parser.add_argument("--sample", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=str(bot.OPENING_BOOK_PATH))
+    args = parser.parse_args(argv)
+
+    if args.racks:
+        with open(args.racks) as fh:
+            racks: Iterable[str] = [line.strip() for line in fh if line.strip()]
+    else:
+        racks = sample_racks(args.sample, args.seed)
+    book = build(racks)
+    with open(args.output, "w") as fh:
+        json.dump(book, fh, separators=(",", ":"))
+    print(f"Wrote {len(book['moves'])} openings to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Process pools whose workers share the bot's tables.
+
+Each lexicon version gets its own pool, so games on different lexicons never
+replace each other's.  Workers keep the tables they were forked with, so a
+pool is replaced when the engine fingerprint of its lexicon changes; the old
+one finishes the jobs already submitted before its workers exit.  Jobs name
+their lexicon by key so that they pickle small.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from . import bot
+from .lexicon import Lexicon, get_lexicon
+
+PoolKey = Tuple[str, Optional[str]]
+PoolSetup = Tuple[str, int]
+
+# (pool name, lexicon key) -> ((engine fingerprint, workers), pool)
+_pools: Dict[PoolKey, Tuple[PoolSetup, ProcessPoolExecutor]] = {}
+_lock = threading.Lock()
+
+
+def resolve(lexicon: Optional[str]) -> Optional[Lexicon]:
+    """Return the lexicon with key *lexicon*, or None for the default tables."""
+    return None if lexicon is None else get_lexicon(lexicon)
+
+
+def _warm(lexicon: Optional[str]) -> None:
+    bot.get_trie(bot._dictionary(resolve(lexicon)))
+
+
+def get_pool(
+    name: str, workers: int, lexicon: Optional[Lexicon] = None
+) -> ProcessPoolExecutor:
+    """Return pool *name* with *workers* processes set up for *lexicon*."""
+    lexicon_key = None if lexicon is None else lexicon.key
+    setup = (bot.engine_fingerprint(lexicon), workers)
+    with _lock:
+        entry = _pools.get((name, lexicon_key))
+        if entry is not None and entry[0] == setup:
+            return entry[1]
+        if entry is not None:
+            # Other callers may still wait on its futures: let them finish.
+            entry[1].shutdown(wait=False)
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_warm, initargs=(lexicon_key,)
+        )
+        _pools[name, lexicon_key] = (setup, pool)
+        return pool
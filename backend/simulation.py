@@ -0,0 +1,171 @@
+"""Monte Carlo simulation bot used for the hard difficulty.
+
+The best candidates by equity are each played on a copy of the board, then
+the opponent's best reply is searched for many random racks drawn from the
+unseen tiles (2-ply).  Candidates are ranked by their equity minus the average
+reply score.  Simulations are spread over a process pool and bounded by a time
+budget; only candidates simulated at least once are considered.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import bot
+from .lexicon import Lexicon
+from .pools import get_pool, resolve
+
+CANDIDATES = int(os.getenv("BOT_SIM_CANDIDATES", "8"))
+ITERATIONS = int(os.getenv("BOT_SIM_ITERATIONS", "48"))
+TIME_BUDGET = float(os.getenv("BOT_SIM_TIME_BUDGET", "3.0"))
+WORKERS = int(os.getenv("BOT_SIM_WORKERS", str(os.cpu_count() or 1)))
+
+Letters = List[List[Optional[str]]]
+Placements = List[Tuple[int, int, str, bool]]
+
+
+def simulate(
+    letters: Letters,
+    placements: Placements,
+    unseen: Sequence[str],
+    iterations: int,
+    seed: int,
+    deadline: float,
+    lexicon: Optional[str] = None,
+) -> Tuple[float, int]:
+    """Sum of the opponent's best reply scores after *placements* is played.
+
+    Returns ``(total, samples)``; stops early once *deadline* (``time.time``)
+    has passed.  *lexicon* is a lexicon key, so that the job pickles small.
+    """
+    resolved = resolve(lexicon)
+    board = bot.board_from_letters(letters, resolved)
+    trie = bot.get_trie(bot._dictionary(resolved))
+    board.attach(trie)
+    board.apply(placements)
+    rng = random.Random(seed)
+    draw = min(7, len(unseen))
+    total = 0.0
+    samples = 0
+    for _ in range(iterations):
+        if time.time() > deadline:
+            break
+        reply = bot.best_move(board, dict(Counter(rng.sample(unseen, draw))), trie)
+        total += reply.score if reply else 0
+        samples += 1
+    return total, samples
+
+
+def simulate_turn(
+    letters: Letters,
+    rack: List[str],
+    unseen: Sequence[str],
+    candidates: int = CANDIDATES,
+    iterations: int = ITERATIONS,
+    time_budget: float = TIME_BUDGET,
+    workers: int = WORKERS,
+    lexicon: Optional[Lexicon] = None,
+) -> Tuple[Placements, int]:
+    """Pick a move for *rack* with *lexicon* by simulating opponent replies.
+
+    With ``workers=0`` simulations run in the calling process.
+    """
+    deadline = time.time() + time_budget
+    trie = bot.get_trie(bot._dictionary(lexicon))
+    board = bot.board_from_letters(letters, lexicon)
+    rack_counts: Dict[str, int] = dict(Counter(ch.upper() for ch in rack))
+    leaves = bot.default_table()
+    moves = bot.generate_moves(board, rack_counts, trie)
+    if not moves:
+        return [], 0
+    ranked = sorted(
+        moves, key=lambda m: bot.equity(m, rack_counts, leaves), reverse=True
+    )
+    top = ranked[:candidates]
+    static = [bot.equity(m, rack_counts, leaves) for m in top]
+    if len(top) == 1 or not unseen:
+        return top[0].letters, top[0].score
+
+    totals, samples = simulate_candidates(
+        letters,
+        [mv.letters for mv in top],
+        unseen,
+        iterations,
+        deadline,
+        workers,
+        lexicon,
+    )
+    simulated = [i for i in range(len(top)) if samples[i]]
+    if not simulated:
+        return top[0].letters, top[0].score
+    best = max(simulated, key=lambda i: static[i] - totals[i] / samples[i])
+    return top[best].letters, top[best].score
+
+
+def simulate_candidates(
+    letters: Letters,
+    candidates: Sequence[Placements],
+    unseen: Sequence[str],
+    iterations: int,
+    deadline: float,
+    workers: int = WORKERS,
+    lexicon: Optional[Lexicon] = None,
+) -> Tuple[List[float], List[int]]:
+    """Simulate every candidate; return the reply score totals and samples."""
+    # Split each candidate's iterations into chunks so every worker gets work,
+    # interleaved so that all candidates progress before the deadline.
+    if workers <= 0:
+        chunks = iterations
+    else:
+        chunks = max(1, min(iterations, workers // len(candidates) + 1))
+    per_chunk = -(-iterations // chunks)
+    totals = [0.0] * len(candidates)
+    samples = [0] * len(candidates)
+    seed = random.randrange(1 << 30)
+    jobs = [
+        (
+            i,
+            (
+                letters,
+                placements,
+                list(unseen),
+                per_chunk,
+                seed + i * chunks + k,
+                deadline,
+                None if lexicon is None else lexicon.key,
+            ),
+        )
+        for k in range(chunks)
+        for i, placements in enumerate(candidates)
+    ]
+    if workers <= 0:
+        for i, args in jobs:
+            total, n = simulate(*args)
+            totals[i] += total
+            samples[i] += n
+    else:
+        pool = get_pool("simulation", workers, lexicon)
+        pending: Dict[Future, int] = {
+            pool.submit(simulate, *args): i for i, args in jobs
+        }
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=max(0.0, deadline - time.time()),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for fut in done:
+                i = pending.pop(fut)
+                total, n = fut.result()
+                totals[i] += total
+                samples[i] += n
+        for fut in pending:
+            fut.cancel()
+    return totals, samples
@@ -0,0 +1,128 @@
+import pathlib
+import random
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot  # type: ignore
+
+
+def _trie(*words: str) -> bot.Trie:
+    trie = bot.Trie()
+    for w in words:
+        trie.insert(w)
+    return trie
+
+
+def _state(board: bot.Board):
+    return (
+        board.count,
+        board.hash,
+        set(board.anchors),
+        [row[:] for row in board.cross_h],
+        [row[:] for row in board.cross_v],
+    )
+
+
+def _fresh(board: bot.Board, trie: bot.Trie):
+    copy = bot.Board(board.tiles, board.blanks)
+    copy.attach(trie)
+    return _state(copy)
+
+
+def test_apply_keeps_incremental_state_in_sync():
+    trie = _trie("NUE", "NUES", "ET", "TE", "UT", "EN", "SET")
+    board = bot.Board()
+    board.attach(trie)
+    moves = [
+        [(7, 7, "N", False), (7, 8, "U", False), (7, 9, "E", False)],
+        [(8, 9, "T", False)],
+        [(7, 10, "S", False), (8, 10, "E", False), (9, 10, "T", False)],
+    ]
+    snapshots = []
+    for letters in moves:
+        snapshots.append(_state(board))
+        board.apply(letters)
+        assert _state(board) == _fresh(board, trie)
+
+    for letters in reversed(moves):
+        board.undo(letters)
+        assert _state(board) == snapshots.pop()
+    assert board.count == 0 and board.hash == 0
+
+
+def test_generate_moves_on_attached_board_matches_detached():
+    trie = _trie("NUE", "NUES", "ET", "TE", "UT", "EN")
+    attached = bot.Board()
+    attached.attach(trie)
+    detached = bot.Board()
+    for board in (attached, detached):
+        board.apply([(7, 7, "N", False), (7, 8, "U", False), (7, 9, "E", False)])
+    rack = {"T": 1, "S": 1, "E": 1}
+
+    def key(moves):
+        return sorted((tuple(m.letters), m.score) for m in moves)
+
+    assert key(bot.generate_moves(attached, rack, trie)) == key(
+        bot.generate_moves(detached, rack, trie)
+    )
+
+
+def test_board_from_letters_reads_blanks_as_letters():
+    letters = [[None] * bot.BOARD_SIZE for _ in range(bot.BOARD_SIZE)]
+    letters[7][7:10] = ["N", "u", "E"]
+    board = bot.board_from_letters(letters)
+    assert board.letter(7, 8) == "U"
+    assert board.blanks[7 * bot.BOARD_SIZE + 8]
+    assert bytes(board.copy().tiles) == bytes(board.tiles)
+
+    mv = bot.build_move_from_state(
+        board, 7, 10, [(7, 10, "S", False)], False, _trie("NUES")
+    )
+    assert mv is not None
+    # The blank scores nothing, as in game.place_tiles.
+    assert mv.score == 3  # N, E and S
+    assert board.word_mult[0] == 3
+    assert board.letter_mult[3] == 2
+
+
+def test_cross_checks_match_probing_every_letter():
+    rng = random.Random(7)
+    words = {
+        "".join(rng.choice("AENRSTU") for _ in range(rng.randint(2, 5)))
+        for _ in range(400)
+    }
+    trie = bot.Trie()
+    for w in words:
+        trie.insert(w)
+    board = bot.Board()
+    for _ in range(60):
+        board.set(
+            rng.randrange(bot.BOARD_SIZE),
+            rng.randrange(bot.BOARD_SIZE),
+            rng.choice("AENRSTU"),
+        )
+    for r in range(bot.BOARD_SIZE):
+        for c in range(bot.BOARD_SIZE):
+            for vertical_scan, build in (
+                (False, bot.build_full_vertical),
+                (True, bot.build_full_horizontal),
+            ):
+                expected = 0
+                if not board.letter(r, c):
+                    for ch in bot.ALPHABET:
+                        word = build(board, r, c, ch)
+                        if len(word) == 1 or word in words:
+                            expected |= bot.LETTER_BIT[ch]
+                assert bot.cross_check_at(board, trie, r, c, vertical_scan) == expected
+
+
+def test_trie_hooks():
+    trie = bot.Trie()
+    for w in ("NUE", "NUES", "UNE", "ETE", "ET"):
+        trie.insert(w)
+    front, back = trie.hooks("UE")
+    assert front == bot.LETTER_BIT["N"] and back == 0
+    assert trie.hooks("NUE") == (0, bot.LETTER_BIT["S"])
+    assert trie.hooks("E") == (0, bot.LETTER_BIT["T"])
+    assert trie.hooks("TE") == (bot.LETTER_BIT["E"], 0)
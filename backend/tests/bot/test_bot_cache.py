@@ -0,0 +1,58 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot, lexicon  # type: ignore
+from backend.cache import LRUCache  # type: ignore
+
+
+def test_zobrist_depends_on_letters_and_blanks():
+    board = bot.Board()
+    empty = board.zobrist()
+    board.apply([(7, 7, "A", False)])
+    upper = board.zobrist()
+    board.undo([(7, 7, "A", False)])
+    board.apply([(7, 7, "A", True)])
+    assert len({empty, upper, board.zobrist()}) == 3
+    board.undo([(7, 7, "A", True)])
+    assert board.zobrist() == empty
+
+
+def test_rack_key_is_order_independent():
+    assert bot.rack_key({"B": 1, "A": 2, "?": 1}) == bot.rack_key(
+        {"?": 1, "A": 2, "B": 1, "C": 0}
+    )
+
+
+def test_lru_cache_evicts_and_expires():
+    cache = LRUCache("test_lru", maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+
+    expiring = LRUCache("test_ttl", ttl=-1)
+    expiring.put("a", 1)
+    assert expiring.get("a") is None
+
+
+def test_cache_persists_to_sqlite(tmp_path):
+    path = str(tmp_path / "cache.db")
+    LRUCache("test_sqlite", path=path).put(("k", 1), [[7, 7, "A", False]])
+    assert LRUCache("test_sqlite", path=path).get(("k", 1)) == [[7, 7, "A", False]]
+
+
+def test_bot_turn_hits_cache_on_repeated_position(monkeypatch):
+    board = [[None for _ in range(bot.BOARD_SIZE)] for _ in range(bot.BOARD_SIZE)]
+    board[7][7] = "N"
+    board[7][8] = "U"
+    board[7][9] = "E"
+    words = {"NUE", "ET"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    first = bot.bot_turn(board, list("TCCCCCC"))
+    hits = bot.MOVE_CACHE.hits
+    assert bot.bot_turn(board, list("CCCTCCC")) == first
+    assert bot.MOVE_CACHE.hits == hits + 1
@@ -0,0 +1,65 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot, endgame, game, lexicon  # type: ignore
+
+
+def _board() -> bot.Board:
+    board = bot.Board()
+    for c, ch in zip(range(7, 10), "NUE"):
+        board.set(7, c, ch)
+    return board
+
+
+def test_apply_and_undo_restore_the_board():
+    board = _board()
+    before = board.zobrist()
+    letters = [(8, 9, "T", False), (9, 9, "S", False)]
+    board.apply(letters)
+    assert board.letter(9, 9) == "S"
+    assert board.zobrist() == before ^ bot.zobrist_delta(letters)
+    board.undo(letters)
+    assert board.zobrist() == before
+    assert board.letter(8, 9) is None
+
+
+def test_solver_prefers_going_out_over_greedy_score(monkeypatch):
+    words = {"ES", "ETS", "AE"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    board = bot.Board()
+    board.set(4, 3, "E")  # (4, 4) is a double word square
+    board.set(5, 5, "Q")  # rules out ETS across
+    before = board.zobrist()
+    greedy = bot.best_move(board, {"S": 1, "T": 1}, bot.get_trie())
+    assert greedy is not None and greedy.letters == [(4, 4, "S", False)]
+
+    # After ES the opponent goes out with AE; ETS goes out first instead.
+    move, value, depth = endgame.solve(board, {"S": 1, "T": 1}, {"A": 1})
+    assert move is not None
+    assert move.main_word == "ETS"
+    assert value == 5
+    assert depth >= 2
+    assert board.zobrist() == before
+
+
+def test_solve_turn_passes_without_moves(monkeypatch):
+    words = {"NUE"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    letters = [[None] * bot.BOARD_SIZE for _ in range(bot.BOARD_SIZE)]
+    letters[7][7:10] = list("NUE")
+    assert endgame.solve_turn(letters, ["Q"], ["K"]) == ([], 0)
+
+
+def test_endgame_needs_a_single_opponent(monkeypatch):
+    letters = [[None] * bot.BOARD_SIZE for _ in range(bot.BOARD_SIZE)]
+    letters[7][7:10] = list("NUE")
+    monkeypatch.setattr(game, "bag", [])
+    monkeypatch.setattr(game, "board", letters)
+    monkeypatch.setattr(game, "unseen_tiles", lambda rack, lexicon=None: ["K"])
+    monkeypatch.setitem(
+        lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words={"NUE"})
+    )
+    assert game._endgame_turn(["Q"], opponents=1) == ([], 0)
+    assert game._endgame_turn(["Q"], opponents=2) is None
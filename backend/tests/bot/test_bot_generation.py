@@ -0,0 +1,80 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot  # type: ignore
+
+
+def _trie(*words: str) -> bot.Trie:
+    trie = bot.Trie()
+    for w in words:
+        trie.insert(w)
+    return trie
+
+
+def _board() -> bot.Board:
+    board = bot.Board()
+    board.apply([(7, 7, "N", False), (7, 8, "U", False), (7, 9, "E", False)])
+    return board
+
+
+def test_moves_extend_existing_words_and_stop_early():
+    trie = _trie("NUE", "NUES", "ET", "ETS")
+    moves = bot.generate_moves(_board(), {"S": 1, "T": 1}, trie)
+    found = {(mv.main_word, tuple(mv.letters)) for mv in moves}
+    # The whole fragment to the left of the anchor is used as a prefix.
+    assert ("NUES", ((7, 10, "S", False),)) in found
+    # A word is kept even when a longer one continues past it.
+    assert ("ET", ((8, 9, "T", False),)) in found
+    assert ("ETS", ((8, 9, "T", False), (9, 9, "S", False))) in found
+
+
+def test_vertical_moves_use_board_coordinates():
+    trie = _trie("NUE", "UT")
+    moves = bot.generate_moves(_board(), {"T": 1}, trie)
+    vertical = [mv for mv in moves if mv.vertical]
+    assert [mv.letters for mv in vertical] == [[(8, 8, "T", False)]]
+    assert vertical[0].main_word == "UT"
+
+
+def test_iter_moves_yields_each_placement_once():
+    trie = _trie("NUE", "ET", "ST", "US")
+    board = _board()
+    board.set(8, 9, "T")
+    moves = list(bot.iter_moves(board, {"S": 1, "?": 1}, trie))
+    keys = [tuple(sorted(mv.letters)) for mv in moves]
+    assert len(keys) == len(set(keys))
+    # S on (8, 8) makes ST across and US down but is reported once.
+    assert keys.count(((8, 8, "S", False),)) == 1
+    assert len(bot.generate_moves(board, {"S": 1}, trie)) == 1
+
+
+def test_iter_moves_is_lazy():
+    trie = _trie("NUE", "NUES", "ET", "ETS")
+    moves = bot.iter_moves(_board(), {"S": 1, "T": 1}, trie)
+    first = next(moves)
+    assert first.letters
+    moves.close()
+
+
+def test_move_encoding_round_trips_to_tuples():
+    board = _board()
+    board.set(7, 10, "E")
+    mv = bot.Move.from_letters(board, [(6, 10, "T", False), (8, 10, "S", True)], True)
+    assert (mv.row, mv.col, mv.vertical, mv.word) == (6, 10, True, "TES")
+    assert mv.placed == 0b101 and mv.blanks == 0b100
+    assert mv.letters == [(6, 10, "T", False), (8, 10, "S", True)]
+    assert mv.tile_count == 2
+
+
+def test_top_moves_are_the_best_scores_in_order():
+    trie = _trie("NUE", "NUES", "ET", "ETS", "TE", "SET")
+    rack = {"S": 1, "T": 1, "E": 1}
+    scores = sorted((mv.score for mv in bot.iter_moves(_board(), rack, trie)))
+    top, complete = bot.top_moves(_board(), rack, trie, 3)
+    assert complete
+    assert [mv.score for mv in top] == scores[::-1][:3]
+    # A deadline already passed stops after the first move.
+    top, complete = bot.top_moves(_board(), rack, trie, 3, deadline=0.0)
+    assert len(top) == 1 and not complete
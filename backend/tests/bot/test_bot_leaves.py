@@ -0,0 +1,37 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot  # type: ignore
+from backend.leaves import LeaveTable, heuristic_value  # type: ignore
+
+
+def test_table_lookup_and_heuristic_fallback():
+    table = LeaveTable({"ES": 9.5})
+    assert table.value("ES") == 9.5
+    assert table.value("") == 0.0
+    assert table.value("?") == heuristic_value("?")
+    assert heuristic_value("UU") < 2 * heuristic_value("U")
+
+
+def test_missing_leaves_use_the_table_single_tiles():
+    table = LeaveTable({"E": 4.0, "S": 7.0, "ES": 12.0})
+    assert table.value("ES") == 12.0
+    assert table.value("EES") == heuristic_value("EES", {"E": 4.0, "S": 7.0})
+    # Tiles the table has no value for keep the heuristic one.
+    assert table.value("EK") == 4.0 + heuristic_value("K")
+
+
+def test_best_move_keeps_valuable_leave():
+    trie = bot.Trie()
+    for w in ("NU", "NUEE"):
+        trie.insert(w)
+    rack = {"N": 1, "U": 1, "E": 1, "?": 1}
+    greedy = max(bot.generate_moves(bot.Board(), rack, trie), key=lambda m: m.score)
+    assert greedy.main_word == "NUEE"
+
+    mv = bot.best_move(bot.Board(), rack, trie, leaves=LeaveTable({"?E": 10.0}))
+    assert mv is not None
+    assert mv.main_word == "NU"
+    assert bot.leave_after(rack, mv) == "?E"
@@ -0,0 +1,49 @@
+import json
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot, lexicon, opening_book  # type: ignore
+
+
+def _trie(*words: str) -> bot.Trie:
+    trie = bot.Trie()
+    for w in words:
+        trie.insert(w)
+    return trie
+
+
+def test_opening_moves_cross_the_centre():
+    moves = bot.generate_moves(bot.Board(), {"N": 1, "U": 1, "E": 1}, _trie("NUE"))
+    moves = [mv for mv in moves if not mv.vertical]
+    assert moves
+    for mv in moves:
+        assert all(r == bot.CENTER for r, _c, _ch, _b in mv.letters)
+        assert any(c == bot.CENTER for _r, c, _ch, _b in mv.letters)
+
+
+def test_generate_moves_mirrors_openings():
+    moves = bot.generate_moves(bot.Board(), {"N": 1, "U": 1, "E": 1}, _trie("NUE"))
+    horizontal = {tuple(mv.letters) for mv in moves if not mv.vertical}
+    vertical = {
+        tuple((c, r, ch, b) for r, c, ch, b in mv.letters)
+        for mv in moves
+        if mv.vertical
+    }
+    assert horizontal and horizontal == vertical
+
+
+def test_bot_turn_reads_opening_book(tmp_path, monkeypatch):
+    empty = [[None for _ in range(bot.BOARD_SIZE)] for _ in range(bot.BOARD_SIZE)]
+    words = {"NUE", "NUS"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    book = opening_book.build(["EUNSSSS"])
+    assert book["moves"]["ENSSSSU"][1] > 0
+    book["moves"]["ENSSSSU"] = ([[7, 7, "N", False], [7, 8, "U", False]], 99)
+    path = tmp_path / "book.json"
+    path.write_text(json.dumps(book))
+    monkeypatch.setattr(bot, "OPENING_BOOK_PATH", path)
+    placements, score = bot.bot_turn(empty, list("SSSSUNE"))
+    assert score == 99
+    assert placements == [(7, 7, "N", False), (7, 8, "U", False)]
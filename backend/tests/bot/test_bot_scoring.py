@@ -0,0 +1,23 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot, game, lexicon  # type: ignore
+
+
+def test_bot_scores_match_place_tiles(monkeypatch):
+    words = {"NUE", "NUES", "ET", "ETS", "TE", "TES", "ES", "SET", "EST", "UT", "US"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    game.load_game_state([(7, 7, "N"), (7, 8, "u"), (7, 9, "E")], [])
+    moves = bot.generate_moves(
+        bot.board_from_letters(game.board),
+        {"S": 1, "T": 1, "E": 1, "?": 1},
+        bot.get_trie(),
+    )
+    assert len(moves) > 10
+    for mv in moves:
+        snapshot = [row[:] for row in game.board]
+        total, _words = game.place_tiles(mv.letters)
+        assert total == mv.score, mv
+        game.board, game.first_move = snapshot, False
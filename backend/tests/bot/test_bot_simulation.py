@@ -0,0 +1,83 @@
+import pathlib
+import sys
+import time
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot, game, lexicon, pools, simulation  # type: ignore
+
+
+def _board():
+    board = [[None for _ in range(bot.BOARD_SIZE)] for _ in range(bot.BOARD_SIZE)]
+    board[7][7] = "N"
+    board[7][8] = "U"
+    board[7][9] = "E"
+    return board
+
+
+def _legal_moves(board, rack):
+    moves = bot.generate_moves(
+        bot.board_from_letters(board),
+        {ch: rack.count(ch) for ch in rack},
+        bot.get_trie(),
+    )
+    return {tuple(mv.letters) for mv in moves}
+
+
+def test_unseen_tiles_excludes_board_and_rack():
+    game.load_game_state([(7, 7, "A"), (7, 8, "b")], [])
+    unseen = game.unseen_tiles(["A", "?"])
+    assert unseen.count("A") == 7
+    assert unseen.count("?") == 0
+    assert unseen.count("B") == 2
+    assert len(unseen) == 102 - 2 - 2
+
+
+def test_simulate_turn_inline_picks_a_legal_move(monkeypatch):
+    words = {"NUE", "NUES", "ET", "TE", "ES", "SU", "NU"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    board = _board()
+    rack = list("TSEAAAA")
+    placements, score = simulation.simulate_turn(
+        board, rack, list("TSEUNTSE"), iterations=4, workers=0
+    )
+    assert score > 0
+    assert tuple(placements) in _legal_moves(board, rack)
+
+
+def test_simulate_turn_uses_process_pool(monkeypatch):
+    words = {"NUE", "NUES", "ET", "TE", "ES"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    board = _board()
+    rack = list("TSEAAAA")
+    placements, _score = simulation.simulate_turn(
+        board, rack, list("TSEUNTSE"), iterations=4, workers=2
+    )
+    assert tuple(placements) in _legal_moves(board, rack)
+
+    candidates = [[(8, 9, "T", False)], [(8, 9, "S", False)]]
+    totals, samples = simulation.simulate_candidates(
+        board, candidates, list("TSEUNTSE"), 4, time.time() + 30, workers=2
+    )
+    assert samples == [4, 4]
+    assert all(total >= 0 for total in totals)
+
+
+def test_pool_is_replaced_when_scoring_changes(monkeypatch):
+    pool = pools.get_pool("test", 1)
+    assert pools.get_pool("test", 1) is pool
+    monkeypatch.setattr(bot, "SCORING_FINGERPRINT", "other")
+    assert pools.get_pool("test", 1) is not pool
+
+
+def test_pools_of_other_lexicons_are_left_running(monkeypatch):
+    other = lexicon.Lexicon("test-pool", words={"NUE"})
+    monkeypatch.setitem(lexicon.REGISTRY, "test-pool", other)
+    pool = pools.get_pool("test", 1)
+    pending = pool.submit(sum, [1, 2])
+    assert pools.get_pool("test", 1, other) is not pool
+    assert pools.get_pool("test", 1) is pool
+    # A replaced pool still completes what was submitted to it.
+    monkeypatch.setattr(bot, "SCORING_FINGERPRINT", "changed")
+    assert pools.get_pool("test", 1) is not pool
+    assert pending.result(timeout=30) == 3
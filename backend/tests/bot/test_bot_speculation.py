@@ -0,0 +1,74 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bot, lexicon  # type: ignore
+
+
+def _trie(*words: str) -> bot.Trie:
+    trie = bot.Trie()
+    for w in words:
+        trie.insert(w)
+    return trie
+
+
+def test_refresh_matches_full_recompute():
+    trie = _trie("NUE", "NUES", "ET", "TE", "UT", "EN")
+    board = bot.Board()
+    for c, ch in zip(range(7, 10), "NUE"):
+        board.set(7, c, ch)
+    pre = bot.precompute(board, trie)
+
+    board.set(8, 9, "T")
+    fresh = bot.refresh(pre, board)
+
+    full = bot.precompute(board, trie)
+    assert fresh is not None
+    assert fresh.cross_h == full.cross_h
+    assert fresh.cross_v == full.cross_v
+
+
+def test_refresh_rejects_removed_tiles():
+    trie = _trie("NUE")
+    board = bot.Board()
+    board.set(7, 7, "N")
+    pre = bot.precompute(board, trie)
+    board.undo([(7, 7, "N", False)])
+    assert bot.refresh(pre, board) is None
+
+
+def test_bot_turn_uses_speculation(monkeypatch):
+    board = [[None for _ in range(bot.BOARD_SIZE)] for _ in range(bot.BOARD_SIZE)]
+    board[7][7] = "N"
+    board[7][8] = "U"
+    words = {"NUE", "ET"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    bot.speculate("game", board).result()
+    snapshot = bot._speculation["game"]
+    board[7][9] = "E"
+    # Only the lines touched since are refreshed: no full recompute.
+    recomputed = []
+    compute = bot.compute_cross_checks
+    monkeypatch.setattr(
+        bot,
+        "compute_cross_checks",
+        lambda *args, **kw: recomputed.append(args) or compute(*args, **kw),
+    )
+    bot.MOVE_CACHE.clear()
+    placements, score = bot.bot_turn(board, list("TBBBBBB"), "game")
+    assert score > 0
+    assert (8, 9, "T", False) in placements
+    assert recomputed == []
+    assert bot._speculation["game"] is not snapshot
+
+
+def test_speculation_is_only_used_for_its_own_game():
+    trie = bot.get_trie()
+    board = bot.Board()
+    board.set(7, 7, "N")
+    bot.speculate("other", [[None] * bot.BOARD_SIZE for _ in range(bot.BOARD_SIZE)])
+    bot._speculation_executor.submit(lambda: None).result()
+    before = bot._speculation["other"]
+    assert bot._precomputed_cross("mine", board, trie) is None
+    assert bot._speculation["other"] is before
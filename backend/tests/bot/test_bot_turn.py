@@ -142,7 +142,7 @@ def test_bot_reloads_board_before_playing():
     # Clear the in-memory board to mimic a fresh process
     game_module.reset_game()
 
-    def fake_bot_turn(rack):
+    def fake_bot_turn(rack, key, opponents, lexicon):
         # Board should be reloaded with the player's move before bot_turn is called
         assert game_module.board[7][7] is not None
         return ([(7, 10, rack_bot[0].upper(), False)], 1)
@@ -8,3 +8,14 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 os.environ.setdefault("DATABASE_URL", f"sqlite:///{ROOT / 'test.db'}")
+os.environ.setdefault("GAME_ANALYSIS_ON_FINISH", "0")
+
+# The ODS8 word list is not shipped with the repository: play the default
+# lexicon with a small fixture list instead.
+from backend import lexicon  # noqa: E402
+
+lexicon.register(
+    lexicon.Lexicon(
+        lexicon.DEFAULT_LEXICON, Path(__file__).with_name("fixtures") / "words.txt"
+    )
+)
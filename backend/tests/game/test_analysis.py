@@ -0,0 +1,52 @@
+"""Tests for the stateless analysis endpoint."""
+
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import game, lexicon  # type: ignore
+from backend.api import analysis  # type: ignore
+
+app = FastAPI()
+app.include_router(analysis.router)
+client = TestClient(app)
+
+
+def _board() -> str:
+    grid = [[None] * game.BOARD_SIZE for _ in range(game.BOARD_SIZE)]
+    grid[7][7:10] = list("NUE")
+    return game.board_to_string(grid)
+
+
+def test_best_moves_use_the_given_board_only(monkeypatch):
+    lex = lexicon.Lexicon("test-nue", words={"NUE", "NUES", "ET", "TE"})
+    monkeypatch.setitem(lexicon.REGISTRY, "test-nue", lex)
+    game.reset_game()
+    res = client.post(
+        "/analysis/best-moves",
+        json={"board": _board(), "rack": "st", "n": 2, "lexicon": "test-nue"},
+    )
+    assert res.status_code == 200
+    moves = res.json()["moves"]
+    assert len(moves) == 2
+    assert moves[0]["score"] >= moves[1]["score"]
+    assert {m["word"] for m in moves} <= {"NUES", "ET", "TE"}
+    assert not game.board[7][7]
+
+
+def test_best_moves_reject_bad_input():
+    bad_board = client.post("/analysis/best-moves", json={"board": "..", "rack": "A"})
+    assert bad_board.status_code == 400
+    bad_rack = client.post(
+        "/analysis/best-moves", json={"board": _board(), "rack": "A1"}
+    )
+    assert bad_rack.status_code == 422
+    bad_lexicon = client.post(
+        "/analysis/best-moves",
+        json={"board": _board(), "rack": "A", "lexicon": "klingon"},
+    )
+    assert bad_lexicon.status_code == 400
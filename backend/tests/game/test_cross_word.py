@@ -14,7 +14,7 @@ def test_build_move_rejects_invalid_cross_word():
     # column 7 would create the cross word ``SL`` which is not present in the
     # dictionary.
     board = bot.Board()
-    board.get(7, 6).letter = "S"
+    board.set(7, 6, "S")
 
     # Minimal dictionary only containing the main word ``LI``.
     trie = bot.Trie()
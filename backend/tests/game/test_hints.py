@@ -0,0 +1,84 @@
+"""Tests for the hint endpoint."""
+
+import os
+import pathlib
+import random
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+
+import pytest
+from fastapi import HTTPException
+
+from backend import bot, lexicon, models
+from backend.api.games import (
+    CreateGameRequest,
+    JoinGameRequest,
+    create_game,
+    get_hints,
+    join_game,
+    start_game,
+)
+from backend.database import Base, SessionLocal, engine  # type: ignore
+
+Base.metadata.drop_all(bind=engine)
+Base.metadata.create_all(bind=engine)
+
+
+def _setup_game(rack: str) -> tuple[int, int]:
+    random.seed(0)
+    with SessionLocal() as db:
+        game_id = create_game(CreateGameRequest(max_players=2), db=db)["game_id"]
+    with SessionLocal() as db:
+        p1 = join_game(game_id, JoinGameRequest(user_id=1), db=db)["player_id"]
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=2), db=db)
+    with SessionLocal() as db:
+        start_game(game_id, seed=0, db=db)
+        db.get(models.GamePlayer, p1).rack = rack
+        db.commit()
+    return game_id, p1
+
+
+def test_hints_return_best_moves_and_are_cached(monkeypatch):
+    words = {"NUE", "UNE", "NU", "EU"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    game_id, p1 = _setup_game("NUEKKKK")
+    with SessionLocal() as db:
+        res = get_hints(game_id, player_id=p1, n=4, db=db)
+    assert len(res.hints) == 4
+    assert res.hints[0].word in {"NUE", "UNE"}
+    assert res.hints[0].score == 6
+    assert [h.score for h in res.hints] == sorted(
+        (h.score for h in res.hints), reverse=True
+    )
+
+    hits = bot.HINT_CACHE.hits
+    with SessionLocal() as db:
+        assert get_hints(game_id, player_id=p1, n=4, db=db) == res
+    assert bot.HINT_CACHE.hits == hits + 1
+
+
+def test_hints_unknown_player():
+    game_id, _p1 = _setup_game("NUEKKKK")
+    with SessionLocal() as db:
+        with pytest.raises(HTTPException) as exc:
+            get_hints(game_id, player_id=999_999, n=3, db=db)
+    assert exc.value.status_code == 404
+
+
+def test_truncated_hints_are_not_cached(monkeypatch):
+    monkeypatch.setitem(
+        lexicon.REGISTRY,
+        "ods8",
+        lexicon.Lexicon("ods8", words={"NUE", "UNE", "NU", "EU"}),
+    )
+    board = [[None] * bot.BOARD_SIZE for _ in range(bot.BOARD_SIZE)]
+    rack = list("NUEKKKK")
+    bot.HINT_CACHE.clear()
+    assert bot.hint_moves(board, rack, 2, time_budget=-1.0)
+    assert bot.HINT_CACHE.stats()["size"] == 0
+    bot.hint_moves(board, rack, 2)
+    assert bot.HINT_CACHE.stats()["size"] == 1
@@ -0,0 +1,64 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[3]
+# Generous enough for a slow CI machine; a word list read at import blows it.
+BUDGET = float(os.getenv("IMPORT_TIME_BUDGET", "2.0"))
+
+SCRIPT = """
+import json, time
+start = time.perf_counter()
+import backend.game, backend.bot, backend.analysis
+elapsed = time.perf_counter() - start
+from backend import lexicon
+manifest_read = lexicon._manifest_cache[0] is not None
+print(json.dumps({
+    "seconds": elapsed,
+    "loaded": [lex.key for lex in lexicon.REGISTRY.values() if lex.loaded],
+    "shared": backend.bot.DICTIONARY is backend.game.DICTIONARY,
+    "manifest_read": manifest_read,
+}))
+"""
+
+
+WORDS = pathlib.Path(__file__).resolve().parents[1] / "fixtures" / "words.txt"
+
+
+def _import(**env: str) -> dict:
+    # A fresh interpreter: register the fixture list the way a deployment would.
+    fixture = {"DEFAULT_LEXICON": "test", "LEXICONS": f"test={WORDS}:french"}
+    out = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=ROOT,
+        env={**os.environ, **fixture, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def test_import_does_not_load_lexicons():
+    assert _import()["loaded"] == []
+
+
+def test_import_time_budget():
+    assert _import()["seconds"] < BUDGET
+
+
+def test_game_and_bot_share_the_word_list():
+    assert _import()["shared"]
+
+
+def test_import_does_not_read_the_reload_manifest(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("nue\n")
+    manifest = tmp_path / "lexicons.json"
+    entry = {"path": str(words), "sha256": "0" * 64}
+    manifest.write_text(json.dumps({"test": {"2": entry}}))
+    result = _import(LEXICON_MANIFEST=str(manifest))
+    assert not result["manifest_read"]
+    assert result["loaded"] == []
@@ -0,0 +1,103 @@
+"""Tests for per-game lexicons."""
+
+import os
+import pathlib
+import random
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+
+import pytest
+from fastapi import HTTPException
+
+from backend import bot, game, lexicon, models
+from backend.api.games import (
+    CreateGameRequest,
+    JoinGameRequest,
+    PreviewRequest,
+    create_game,
+    join_game,
+    preview_move,
+    start_game,
+)
+from backend.database import Base, SessionLocal, engine  # type: ignore
+
+Base.metadata.drop_all(bind=engine)
+Base.metadata.create_all(bind=engine)
+
+
+@pytest.fixture
+def english(monkeypatch):
+    lex = lexicon.Lexicon(
+        "test-en", distribution=lexicon.ENGLISH_DISTRIBUTION, words={"KA"}
+    )
+    monkeypatch.setitem(lexicon.REGISTRY, "test-en", lex)
+    return lex
+
+
+def test_lexicon_is_loaded_once_from_its_file(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("ka\nzo\n\n")
+    lex = lexicon.Lexicon("file", path)
+    assert lex.words == {"KA", "ZO"}
+    assert lex.words is lex.words
+    assert lex.values[ord("K")] == 10 and lex.values[ord("k")] == 0
+
+
+def test_game_plays_with_its_lexicon(english):
+    random.seed(0)
+    with SessionLocal() as db:
+        game_id = create_game(
+            CreateGameRequest(max_players=2, lexicon="test-en"), db=db
+        )["game_id"]
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=1), db=db)
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=2), db=db)
+    with SessionLocal() as db:
+        start_game(game_id, seed=0, db=db)
+    assert len(game.bag) == 100 - 14
+
+    ka = [
+        {"row": 7, "col": 7, "letter": "K", "blank": False},
+        {"row": 7, "col": 8, "letter": "A", "blank": False},
+    ]
+    with SessionLocal() as db:
+        res = preview_move(game_id, PreviewRequest(placements=ka), db=db)
+    # K is worth 5 in English, doubled on the centre square.
+    assert res.valid and res.score == 12
+    # The default lexicon is left alone for concurrent requests.
+    assert bot.DICTIONARY is lexicon.get_lexicon().words
+    assert bot.DICTIONARY is not english.words
+    assert bot.engine_fingerprint() != bot.engine_fingerprint(english)
+
+
+def test_unavailable_lexicon_version_gives_a_conflict(english):
+    with SessionLocal() as db:
+        game_id = create_game(
+            CreateGameRequest(max_players=2, lexicon="test-en"), db=db
+        )["game_id"]
+        db.get(models.Game, game_id).lexicon = "test-en@7"
+        db.commit()
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=1), db=db)
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=2), db=db)
+    with SessionLocal() as db:
+        # Tiles are the same in every version: the current one stands in.
+        start_game(game_id, seed=0, db=db)
+    assert len(game.bag) == 100 - 14
+    with SessionLocal() as db:
+        with pytest.raises(HTTPException) as exc:
+            preview_move(game_id, PreviewRequest(placements=[]), db=db)
+    assert exc.value.status_code == 409
+    assert exc.value.detail == "lexicon_version_unavailable"
+
+
+def test_unknown_lexicon_is_rejected():
+    with SessionLocal() as db:
+        with pytest.raises(HTTPException) as exc:
+            create_game(CreateGameRequest(lexicon="klingon"), db=db)
+    assert exc.value.status_code == 400
@@ -0,0 +1,96 @@
+"""Tests for the post-game analysis pipeline."""
+
+import os
+import pathlib
+import random
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+
+from backend import analysis, lexicon, models
+from backend.api.games import (
+    CreateGameRequest,
+    FinishRequest,
+    JoinGameRequest,
+    MoveRequest,
+    create_game,
+    finish,
+    get_game_analysis,
+    join_game,
+    play_move,
+    start_game,
+)
+from backend.database import Base, SessionLocal, engine  # type: ignore
+
+Base.metadata.drop_all(bind=engine)
+Base.metadata.create_all(bind=engine)
+
+
+def test_finished_game_is_analysed_once(monkeypatch):
+    lex = lexicon.Lexicon("test-nu", words={"NU", "NUKE"})
+    monkeypatch.setitem(lexicon.REGISTRY, "test-nu", lex)
+    random.seed(0)
+    with SessionLocal() as db:
+        game_id = create_game(
+            CreateGameRequest(max_players=2, lexicon="test-nu"), db=db
+        )["game_id"]
+    with SessionLocal() as db:
+        p1 = join_game(game_id, JoinGameRequest(user_id=1), db=db)["player_id"]
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=2), db=db)
+    with SessionLocal() as db:
+        start_game(game_id, seed=0, db=db)
+        db.get(models.GamePlayer, p1).rack = "NUEKKKK"
+        db.commit()
+
+    nu = [
+        {"row": 7, "col": 7, "letter": "N", "blank": False},
+        {"row": 7, "col": 8, "letter": "U", "blank": False},
+    ]
+    with SessionLocal() as db:
+        play_move(game_id, MoveRequest(player_id=p1, placements=nu), db=db)
+        finish(FinishRequest(game_id=game_id), db=db)
+    with SessionLocal() as db:
+        turn = db.query(models.Turn).filter_by(game_id=game_id).one()
+        assert (turn.number, turn.rack, turn.score) == (1, "NUEKKKK", 4)
+        assert len(turn.tiles) == 2
+
+    with SessionLocal() as db:
+        assert analysis.analyse_game(db, game_id, workers=0) == 1
+        # Already analysed turns are not searched again.
+        assert analysis.analyse_game(db, game_id, workers=0) == 0
+        res = get_game_analysis(game_id, db=db)
+    assert res.complete
+    (only,) = res.turns
+    assert only.best_word == "NUKE"
+    assert only.best_score == 26
+    assert only.equity_lost > 0
+
+
+def test_tiles_without_a_turn_are_on_the_board(monkeypatch):
+    lex = lexicon.Lexicon("test-nu", words={"NU", "NUKE"})
+    monkeypatch.setitem(lexicon.REGISTRY, "test-nu", lex)
+    with SessionLocal() as db:
+        game_id = create_game(
+            CreateGameRequest(max_players=2, lexicon="test-nu"), db=db
+        )["game_id"]
+    with SessionLocal() as db:
+        p1 = join_game(game_id, JoinGameRequest(user_id=1), db=db)["player_id"]
+    with SessionLocal() as db:
+        # Played before migration 0005 recorded turns.
+        db.add(models.PlacedTile(game_id=game_id, player_id=p1, x=7, y=7, letter="N"))
+        turn = models.Turn(game_id=game_id, player_id=p1, number=1, rack="K", score=3)
+        db.add(turn)
+        db.flush()
+        db.add(
+            models.PlacedTile(
+                game_id=game_id, player_id=p1, x=7, y=8, letter="U", turn_id=turn.id
+            )
+        )
+        db.commit()
+        (job,) = analysis.pending_turns(db, game_id)
+    board = job[2]
+    assert board[7][7] == "N"
+    assert board[7][8] is None
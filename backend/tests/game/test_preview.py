@@ -0,0 +1,83 @@
+"""Tests for the move preview endpoint."""
+
+import os
+import pathlib
+import random
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+
+import pytest
+from fastapi import HTTPException
+
+from backend import models
+from backend.api.games import (
+    CreateGameRequest,
+    JoinGameRequest,
+    MoveRequest,
+    PreviewRequest,
+    create_game,
+    join_game,
+    play_move,
+    preview_move,
+    start_game,
+)
+from backend.database import Base, SessionLocal, engine  # type: ignore
+
+Base.metadata.drop_all(bind=engine)
+Base.metadata.create_all(bind=engine)
+
+HOU = [
+    {"row": 7, "col": 7, "letter": "H", "blank": False},
+    {"row": 7, "col": 8, "letter": "O", "blank": False},
+    {"row": 7, "col": 9, "letter": "U", "blank": False},
+]
+
+
+def _setup_game() -> tuple[int, int]:
+    random.seed(0)
+    with SessionLocal() as db:
+        game_id = create_game(CreateGameRequest(max_players=2), db=db)["game_id"]
+    with SessionLocal() as db:
+        p1 = join_game(game_id, JoinGameRequest(user_id=1), db=db)["player_id"]
+    with SessionLocal() as db:
+        join_game(game_id, JoinGameRequest(user_id=2), db=db)
+    with SessionLocal() as db:
+        start_game(game_id, seed=0, db=db)
+    return game_id, p1
+
+
+def test_preview_scores_without_saving() -> None:
+    game_id, _p1 = _setup_game()
+    with SessionLocal() as db:
+        res = preview_move(game_id, PreviewRequest(placements=HOU), db=db)
+    assert res.valid
+    assert res.score == 12
+    assert [(w.word, w.score) for w in res.words] == [("HOU", 12)]
+
+    with SessionLocal() as db:
+        assert db.query(models.PlacedTile).filter_by(game_id=game_id).count() == 0
+
+
+def test_preview_follows_the_board() -> None:
+    game_id, p1 = _setup_game()
+    with SessionLocal() as db:
+        play_move(game_id, MoveRequest(player_id=p1, placements=HOU), db=db)
+    with SessionLocal() as db:
+        res = preview_move(game_id, PreviewRequest(placements=HOU), db=db)
+    assert not res.valid
+    assert res.code == "occupied"
+
+    far = [{"row": 0, "col": 0, "letter": "A", "blank": False}]
+    with SessionLocal() as db:
+        res = preview_move(game_id, PreviewRequest(placements=far), db=db)
+    assert res.code == "not_connected"
+
+
+def test_preview_unknown_game() -> None:
+    with SessionLocal() as db:
+        with pytest.raises(HTTPException) as exc:
+            preview_move(999_999, PreviewRequest(placements=HOU), db=db)
+    assert exc.value.status_code == 404
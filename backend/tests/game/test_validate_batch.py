@@ -0,0 +1,35 @@
+"""Tests for the batch word validation endpoint."""
+
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import lexicon  # type: ignore
+from backend.api import health  # type: ignore
+
+app = FastAPI()
+app.include_router(health.router)
+client = TestClient(app)
+
+
+def test_batch_keeps_order_and_case(monkeypatch) -> None:
+    words = {"MAISON", "EU"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    res = client.post("/validate/batch", json={"words": ["maison", "ZZQX", "EU"]})
+    assert res.status_code == 200
+    assert res.json() == {
+        "results": [
+            {"word": "maison", "valid": True},
+            {"word": "ZZQX", "valid": False},
+            {"word": "EU", "valid": True},
+        ]
+    }
+
+
+def test_batch_rejects_too_many_words() -> None:
+    words = ["EU"] * (health.MAX_BATCH_WORDS + 1)
+    assert client.post("/validate/batch", json={"words": words}).status_code == 422
@@ -0,0 +1,59 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import game, lexicon  # type: ignore
+
+
+@pytest.fixture
+def dictionary(monkeypatch):
+    words = {"NUE", "NUES", "ET", "TE", "SET"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+
+
+def _grid():
+    grid = [[None] * game.BOARD_SIZE for _ in range(game.BOARD_SIZE)]
+    grid[7][7:10] = list("NUE")
+    return grid
+
+
+def test_validate_move_does_not_touch_the_board(dictionary):
+    grid = _grid()
+    before = [row[:] for row in grid]
+    result = game.validate_move([(7, 10, "S", False)], grid, first=False)
+    assert result.valid
+    assert result.words == [("NUES", 4)]
+    assert result.total == 4
+    assert grid == before
+
+
+@pytest.mark.parametrize(
+    "placements, code, error",
+    [
+        ([], "no_tiles", "No tiles placed"),
+        ([(7, 9, "S", False)], "occupied", "Cell already occupied"),
+        ([(0, 0, "E", False)], "not_connected", "Move must connect to existing tiles"),
+        ([(8, 9, "T", False), (10, 9, "S", False)], "not_contiguous", None),
+        ([(7, 10, "T", False)], "main_word", "Main word not in dictionary"),
+        ([(6, 9, "S", False), (6, 10, "E", False)], "main_word", None),
+    ],
+)
+def test_validate_move_reports_error_codes(dictionary, placements, code, error):
+    result = game.validate_move(placements, _grid(), first=False)
+    assert not result.valid
+    assert result.code == code
+    if error is not None:
+        assert result.error == error
+
+
+def test_place_tiles_commits_only_valid_moves(dictionary):
+    game.load_game_state([(7, 7, "N"), (7, 8, "U"), (7, 9, "E")], [])
+    with pytest.raises(ValueError, match="Invalid cross word: TN"):
+        game.place_tiles([(6, 7, "T", False), (6, 8, "E", False)])
+    assert game.board[6][7] is None
+    total, words = game.place_tiles([(8, 9, "T", False)])
+    assert words == [("ET", 2)]
+    assert game.board[8][9] == "T"
@@ -0,0 +1,38 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import lexicon  # type: ignore
+from backend.api import words  # type: ignore
+
+app = FastAPI()
+app.include_router(words.router)
+client = TestClient(app)
+
+WORDS = {"NUE", "UNE", "NU", "EU", "NUES", "SUE", "USE"}
+
+
+def test_index_finds_subsets_and_blanks():
+    index = lexicon.AnagramIndex(WORDS)
+    assert index.anagrams("EUN") == ["NUE", "UNE"]
+    assert index.anagrams("EU?") == ["NUE", "SUE", "UNE", "USE"]
+    assert index.words_from("NUE") == ["NUE", "UNE", "EU", "NU"]
+    assert index.words_from("NU?", min_len=4) == []
+    assert index.words_from("N??", min_len=3) == ["NUE", "UNE"]
+
+
+def test_anagrams_endpoint(monkeypatch):
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=WORDS))
+    res = client.get("/words/anagrams", params={"rack": "sue?"})
+    assert res.status_code == 200
+    assert res.json()["words"][0] == "NUES"
+
+    res = client.get("/words/anagrams", params={"rack": "ues", "exact": True})
+    assert res.json() == {"words": ["SUE", "USE"]}
+
+    assert client.get("/words/anagrams", params={"rack": "a???"}).status_code == 400
+    assert client.get("/words/anagrams", params={"rack": "a1"}).status_code == 422
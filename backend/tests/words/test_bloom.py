@@ -0,0 +1,52 @@
+import os
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from backend import bloom, lexicon  # type: ignore
+
+WORDS = {"NUE", "NUES", "ET", "TE", "SET", "ANE"}
+
+
+def test_filter_has_no_false_negatives():
+    f = lexicon.BloomFilter(WORDS)
+    assert all(w in f for w in WORDS)
+    misses = [w for w in ("XQZ", "QQQ", "ZZZZ", "KWX", "JJJ") if w not in f]
+    assert misses
+
+
+def test_lexicon_rejects_non_words_without_loading(tmp_path, monkeypatch):
+    path = tmp_path / "tiny.txt"
+    path.write_text("\n".join(sorted(WORDS)))
+    monkeypatch.setattr(lexicon, "REGISTRY", {})
+    lexicon.register(lexicon.Lexicon("tiny", path))
+    bloom.build("tiny")
+    assert (tmp_path / "tiny.bloom").exists()
+
+    lex = lexicon.Lexicon("tiny", path)
+    rejected = next(w for w in ("XQZ", "QQQ", "ZZZZ", "KWX") if w not in lex.bloom)
+    assert rejected not in lex
+    assert not lex.loaded
+    assert "NUE" in lex
+    assert lex.loaded
+
+
+def test_stale_filter_is_ignored(tmp_path, monkeypatch):
+    path = tmp_path / "tiny.txt"
+    path.write_text("\n".join(sorted(WORDS)))
+    monkeypatch.setattr(lexicon, "REGISTRY", {})
+    lexicon.register(lexicon.Lexicon("tiny", path))
+    bloom.build("tiny")
+    path.write_text("\n".join(sorted(WORDS | {"XQZ"})))
+    os.utime(path, ns=(0, 0))
+    lex = lexicon.Lexicon("tiny", path)
+    assert lex.bloom is None
+    assert "XQZ" in lex
+
+
+def test_benchmark_reports_every_structure():
+    report = bloom.benchmark(WORDS, probes=50, seed=1)
+    assert set(report) == {"set", "trie", "bloom"}
+    assert report["bloom"]["bytes"] < report["set"]["bytes"]
+    assert 0 <= report["bloom"]["false_positive_rate"] <= 1
@@ -0,0 +1,22 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import lexicon  # type: ignore
+from backend.api import words  # type: ignore
+
+app = FastAPI()
+app.include_router(words.router)
+client = TestClient(app)
+
+
+def test_hooks_endpoint(monkeypatch):
+    words = {"NUE", "NUES", "NUEE", "ANUE"}
+    monkeypatch.setitem(lexicon.REGISTRY, "ods8", lexicon.Lexicon("ods8", words=words))
+    res = client.get("/words/hooks", params={"word": "nue"})
+    assert res.json() == {"word": "NUE", "front": ["A"], "back": ["E", "S"]}
+    assert client.get("/words/hooks", params={"word": "n?"}).status_code == 422
@@ -0,0 +1,114 @@
+import json
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import lexicon  # type: ignore
+from backend.api import lexicons  # type: ignore
+
+app = FastAPI()
+app.include_router(lexicons.router)
+client = TestClient(app)
+
+
+def _wait() -> None:
+    lexicons._executor.submit(lambda: None).result()
+
+
+def test_reload_swaps_version_and_keeps_the_old_one(tmp_path, monkeypatch):
+    (tmp_path / "v1.txt").write_text("nue\nnues\n")
+    (tmp_path / "v2.txt").write_text("nue\nnues\nnuee\n")
+    monkeypatch.setattr(lexicon, "REGISTRY", {})
+    monkeypatch.setattr(lexicon, "RETIRED", {})
+    monkeypatch.setattr(lexicons, "RELOADS", {})
+    monkeypatch.setattr(lexicon, "MANIFEST_PATH", tmp_path / "lexicons.json")
+    lexicon.register(lexicon.Lexicon("tiny", tmp_path / "v1.txt"))
+
+    res = client.post("/admin/lexicons/tiny/reload", json={"file": "v2.txt"})
+    assert res.status_code == 202
+    _wait()
+    status = client.get("/admin/lexicons/tiny/reload").json()
+    assert status["status"] == "ready"
+    assert status["key"] == "tiny@2"
+    assert status["words"] == 3
+
+    assert lexicon.get_lexicon("tiny").key == "tiny@2"
+    assert "NUEE" in lexicon.get_lexicon("tiny").words
+    assert "NUEE" not in lexicon.get_lexicon("tiny@1").words
+
+    listed = {lex["key"]: lex for lex in client.get("/lexicons").json()}
+    assert listed["tiny@2"]["current"] and not listed["tiny@1"]["current"]
+
+
+def test_reload_rejects_unknown_lexicon_and_file(tmp_path, monkeypatch):
+    (tmp_path / "v1.txt").write_text("nue\n")
+    monkeypatch.setattr(lexicon, "REGISTRY", {})
+    lexicon.register(lexicon.Lexicon("tiny", tmp_path / "v1.txt"))
+    assert client.post("/admin/lexicons/nope/reload", json={}).status_code == 404
+    res = client.post("/admin/lexicons/tiny/reload", json={"file": "../etc/passwd"})
+    assert res.status_code == 400
+
+
+def _restart(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(lexicon, "REGISTRY", {})
+    monkeypatch.setattr(lexicon, "RETIRED", {})
+    lexicon.register(lexicon.Lexicon("tiny", tmp_path / "v1.txt"))
+
+
+def test_reloaded_versions_survive_a_restart(tmp_path, monkeypatch):
+    (tmp_path / "v1.txt").write_text("nue\n")
+    (tmp_path / "v2.txt").write_text("nue\nnues\n")
+    monkeypatch.setattr(lexicon, "MANIFEST_PATH", tmp_path / "lexicons.json")
+    _restart(tmp_path, monkeypatch)
+    lexicon.reload("tiny", tmp_path / "v2.txt")
+
+    _restart(tmp_path, monkeypatch)
+    assert lexicon.get_lexicon("tiny").key == "tiny@2"
+    assert "NUES" in lexicon.get_lexicon("tiny@2").words
+    assert "NUES" not in lexicon.get_lexicon("tiny@1").words
+
+    # A changed file no longer matches its version, which is left out.
+    (tmp_path / "v2.txt").write_text("nue\nnues\nnuee\n")
+    _restart(tmp_path, monkeypatch)
+    assert lexicon.get_lexicon("tiny").key == "tiny@3"
+    assert lexicon.get_lexicon("tiny@1").key == "tiny@1"
+    with pytest.raises(ValueError):
+        lexicon.get_lexicon("tiny@2")
+
+
+def test_reload_in_place_keeps_the_old_words(tmp_path, monkeypatch):
+    (tmp_path / "v1.txt").write_text("nue\n")
+    monkeypatch.setattr(lexicon, "MANIFEST_PATH", tmp_path / "lexicons.json")
+    _restart(tmp_path, monkeypatch)
+    with pytest.raises(ValueError):
+        lexicon.reload("tiny")
+
+    (tmp_path / "v1.txt").write_text("nue\nnues\n")
+    lexicon.reload("tiny")
+    assert lexicon.get_lexicon("tiny@1").words == {"NUE"}
+    assert lexicon.get_lexicon("tiny@2").words == {"NUE", "NUES"}
+    versions = json.loads((tmp_path / "lexicons.json").read_text())["tiny"]
+    assert versions["1"]["sha256"] != versions["2"]["sha256"]
+
+
+def test_reload_by_another_process_is_picked_up(tmp_path, monkeypatch):
+    (tmp_path / "v1.txt").write_text("nue\n")
+    (tmp_path / "v2.txt").write_text("nue\nnues\n")
+    monkeypatch.setattr(lexicon, "MANIFEST_PATH", tmp_path / "lexicons.json")
+    _restart(tmp_path, monkeypatch)
+    here = lexicon.get_lexicon("tiny")
+    assert here.words == {"NUE"}
+
+    # Another process reloads: only the manifest is shared.
+    _restart(tmp_path, monkeypatch)
+    lexicon.reload("tiny", tmp_path / "v2.txt")
+    monkeypatch.setattr(lexicon, "REGISTRY", {"tiny": here})
+    monkeypatch.setattr(lexicon, "RETIRED", {})
+
+    assert lexicon.get_lexicon("tiny").key == "tiny@2"
+    assert lexicon.get_lexicon("tiny@1") is here
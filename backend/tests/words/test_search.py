@@ -0,0 +1,36 @@
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[2]))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import lexicon  # type: ignore
+from backend.api import words  # type: ignore
+
+app = FastAPI()
+app.include_router(words.router)
+client = TestClient(app)
+
+WORDS = {"MAISON", "RAISON", "SAISON", "ARBRE", "ABBE", "ETE", "EU"}
+
+
+def test_pattern_and_contains_constraints():
+    index = lexicon.PatternIndex(WORDS)
+    assert index.search("?AISON") == (3, ["MAISON", "RAISON", "SAISON"])
+    assert index.search(".AISON", contains="ss") == (1, ["SAISON"])
+    assert index.search(contains="B", length=4) == (1, ["ABBE"])
+    assert index.search(contains="BB") == (1, ["ABBE"])
+    assert index.search("E.E", length=2) == (0, [])
+    assert index.search(contains="E", limit=1) == (4, ["EU"])
+
+
+def test_search_endpoint(monkeypatch):
+    monkeypatch.setitem(lexicon.REGISTRY, "test", lexicon.Lexicon("test", words=WORDS))
+    res = client.get("/words/search", params={"pattern": "..b.e", "lexicon": "test"})
+    assert res.json() == {"count": 1, "words": ["ARBRE"]}
+    res = client.get("/words/search", params={"len": 2, "lexicon": "test"})
+    assert res.json() == {"count": 1, "words": ["EU"]}
+    assert client.get("/words/search", params={"pattern": "a*"}).status_code == 422
+    assert client.get("/words/search", params={"lexicon": "nope"}).status_code == 404